@@ -0,0 +1,231 @@
+"""
+Benchmarks de las operaciones de src/data.
+
+Uso:
+    python -m benchmarks.bench_data
+"""
+import asyncio
+import queue
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from src.data.data import Data
+from src.data.external import ExternalSorter
+from src.data.queues import AsyncQueue, ThreadSafeQueue
+
+
+def medir(funcion, *args, repeticiones=1):
+    """Retorna el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def cola_con_lista():
+    """Cola original: lista con pop(0), que desplaza todos los elementos."""
+    cola = []
+    return {
+        "enqueue": lambda x: cola.append(x),
+        "dequeue": lambda: cola.pop(0) if cola else None,
+        "is_empty": lambda: len(cola) == 0,
+    }
+
+
+def llenar_y_vaciar(cola, n):
+    enqueue, dequeue, is_empty = cola["enqueue"], cola["dequeue"], cola["is_empty"]
+    for i in range(n):
+        enqueue(i)
+    while not is_empty():
+        dequeue()
+
+
+def llenar_y_vaciar_por_lotes(cola, n, lote=1000):
+    cola["enqueue_many"](range(n))
+    while not cola["is_empty"]():
+        cola["dequeue_many"](lote)
+
+
+def bench_cola(n=1_000_000, n_lista=100_000):
+    data = Data()
+    print(f"cola: encolar y vaciar {n} elementos")
+    t_lista = medir(llenar_y_vaciar, cola_con_lista(), n_lista)
+    print(f"  lista con pop(0)  {t_lista:.3f} s con {n_lista} elementos (crece como n^2)")
+    print(f"  implementar_cola  {medir(llenar_y_vaciar, data.implementar_cola(), n):.3f} s")
+    print(f"  por lotes de 1000 {medir(llenar_y_vaciar_por_lotes, data.implementar_cola(), n):.3f} s")
+
+
+def con_hilos(meter, sacar, n, productores, consumidores):
+    """Reparte n elementos entre productores y consumidores con hilos."""
+    por_productor = n // productores
+
+    def producir(inicio):
+        for i in range(inicio, inicio + por_productor):
+            meter(i)
+
+    def consumir():
+        while sacar() is not None:
+            pass
+
+    hilos = [threading.Thread(target=producir, args=(k * por_productor,)) for k in range(productores)]
+    lectores = [threading.Thread(target=consumir) for _ in range(consumidores)]
+    for hilo in hilos + lectores:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    for _ in lectores:
+        meter(None)
+    for hilo in lectores:
+        hilo.join()
+
+
+def con_hilos_por_lotes(cola, n, productores, consumidores, lote=256):
+    """Como con_hilos, pero con push_many y pop_many."""
+    por_productor = n // productores
+
+    def producir(inicio):
+        cola.push_many(range(inicio, inicio + por_productor))
+
+    def consumir():
+        while True:
+            sacados = cola.pop_many(lote)
+            if None in sacados:
+                # Devuelve las marcas de fin que eran de otros consumidores
+                for _ in range(sacados.count(None) - 1):
+                    cola.push(None)
+                return
+
+    hilos = [threading.Thread(target=producir, args=(k * por_productor,)) for k in range(productores)]
+    lectores = [threading.Thread(target=consumir) for _ in range(consumidores)]
+    for hilo in hilos + lectores:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    for _ in lectores:
+        cola.push(None)
+    for hilo in lectores:
+        hilo.join()
+
+
+def con_asyncio(meter, sacar, n, productores, consumidores):
+    """Reparte n elementos entre tareas productoras y consumidoras."""
+    por_productor = n // productores
+
+    async def producir(inicio):
+        for i in range(inicio, inicio + por_productor):
+            await meter(i)
+
+    async def consumir():
+        while await sacar() is not None:
+            pass
+
+    async def principal():
+        lectores = [asyncio.create_task(consumir()) for _ in range(consumidores)]
+        await asyncio.gather(*(producir(k * por_productor) for k in range(productores)))
+        for _ in lectores:
+            await meter(None)
+        await asyncio.gather(*lectores)
+
+    asyncio.run(principal())
+
+
+def bench_contencion(n=200_000, productores=4, consumidores=4, capacidad=1000):
+    print(f"contención: {n} elementos, {productores} productores, {consumidores} consumidores, capacidad {capacidad}")
+    estandar = queue.Queue(capacidad)
+    t = medir(con_hilos, estandar.put, estandar.get, n, productores, consumidores)
+    print(f"  queue.Queue           {t:.3f} s")
+    cola = ThreadSafeQueue(capacidad)
+    t = medir(con_hilos, cola.push, cola.pop, n, productores, consumidores)
+    print(f"  ThreadSafeQueue       {t:.3f} s")
+    t = medir(con_hilos_por_lotes, ThreadSafeQueue(capacidad), n, productores, consumidores)
+    print(f"  ThreadSafeQueue lotes {t:.3f} s")
+    estandar = asyncio.Queue(capacidad)
+    t = medir(con_asyncio, estandar.put, estandar.get, n, productores, consumidores)
+    print(f"  asyncio.Queue         {t:.3f} s")
+    cola = AsyncQueue(capacidad)
+    t = medir(con_asyncio, cola.push, cola.pop, n, productores, consumidores)
+    print(f"  AsyncQueue            {t:.3f} s")
+
+
+def merge_con_sorted(lista1, lista2):
+    """merge_ordenado original: concatena, copia y vuelve a ordenar."""
+    merge = []
+    for item in lista1 + lista2:
+        merge.append(item)
+    return sorted(merge)
+
+
+def bench_merge(n=1_000_000, k=64):
+    data = Data()
+    lista1 = sorted(random.random() for _ in range(n))
+    lista2 = sorted(random.random() for _ in range(n))
+    print(f"merge_ordenado: dos listas de {n} floats")
+    print(f"  concatenar y ordenar {medir(merge_con_sorted, lista1, lista2):.3f} s")
+    print(f"  dos punteros         {medir(data.merge_ordenado, lista1, lista2):.3f} s")
+    tramos = [lista1[i::k] for i in range(k)]
+    print(f"merge_k: {k} secuencias ordenadas, {n} elementos en total")
+    print(f"  merge_k              {medir(lambda: sum(1 for _ in data.merge_k(tramos))):.3f} s")
+
+
+def ordenar_externo(numeros, memoria, fan_in):
+    with ExternalSorter(memoria=memoria, fan_in=fan_in) as ordenador:
+        ordenador.extend(numeros)
+        tramos = len(ordenador._tramos)
+        unicos = sum(1 for _ in ordenador.unicos())
+    return tramos, unicos
+
+
+def bench_externo(memoria=8 * 2**20, veces=10, fan_in=8):
+    n = veces * (memoria // 32)
+    print(f"orden externo: {n} floats (unas {veces} veces el presupuesto de {memoria // 2**20} MB), fan_in {fan_in}")
+    numeros = lambda: (random.random() // 1e-6 for _ in range(n))
+    inicio = time.perf_counter()
+    tramos, unicos = ordenar_externo(numeros(), memoria, fan_in)
+    print(f"  ExternalSorter.unicos {time.perf_counter() - inicio:.3f} s, {tramos} tramos, {unicos} únicos")
+    tracemalloc.start()
+    ordenar_externo(numeros(), memoria, fan_in)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  pico de memoria       {pico / 2**20:.1f} MB (medido con tracemalloc)")
+    inicio = time.perf_counter()
+    ordenados = sorted(numeros())
+    print(f"  sorted en memoria     {time.perf_counter() - inicio:.3f} s (la lista sola ocupa unos {n * 32 / 2**20:.0f} MB)")
+    del ordenados
+
+
+def subconjunto_con_lista(conjunto1, conjunto2):
+    """es_subconjunto original: busca cada elemento recorriendo la lista."""
+    for item in conjunto1:
+        if item not in conjunto2:
+            return False
+    return True
+
+
+def bench_subconjunto(n=100_000, n_lista=10_000):
+    data = Data()
+    conjunto2 = list(range(n))
+    random.shuffle(conjunto2)
+    conjunto1 = conjunto2[::-1]
+    print(f"es_subconjunto: {n} elementos contra {n}")
+    t_lista = medir(subconjunto_con_lista, conjunto2[:n_lista][::-1], conjunto2[:n_lista])
+    print(f"  recorriendo la lista {t_lista:.3f} s con {n_lista} elementos (crece como n*m)")
+    print(f"  con ListIndex        {medir(data.es_subconjunto, conjunto1, conjunto2, repeticiones=3):.3f} s")
+    indice = data.indice_lista(conjunto2)
+    print(f"  buscar_elemento x{n} {medir(lambda: [data.buscar_elemento(conjunto2, x, indice) for x in conjunto1]):.3f} s con índice")
+
+
+def main(argv):
+    bench_cola()
+    bench_merge()
+    bench_externo()
+    bench_subconjunto()
+    bench_contencion()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
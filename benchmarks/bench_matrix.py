@@ -0,0 +1,166 @@
+"""
+Benchmarks de las operaciones de src/matrix.
+
+Uso:
+    python -m benchmarks.bench_matrix
+    python -m benchmarks.bench_matrix 64 256
+"""
+import os
+import random
+import sys
+import time
+
+from src.matrix.dense import DenseMatrix
+from src.matrix.matrix import Matrix
+from src.matrix.parallel import ParallelMatrix
+from src.matrix.sparse import COOMatrix
+
+
+def multiplicar_ingenuo(A, B):
+    """Triple bucle i-j-k original, usado como referencia."""
+    resultado = []
+    for i in range(len(A)):
+        fila = []
+        for j in range(len(B[0])):
+            suma = 0
+            for k in range(len(A[0])):
+                suma += A[i][k] * B[k][j]
+            fila.append(suma)
+        resultado.append(fila)
+    return resultado
+
+
+def matriz_aleatoria(n, m, semilla=0):
+    aleatorio = random.Random(semilla)
+    return [[aleatorio.randint(-100, 100) for _ in range(m)] for _ in range(n)]
+
+
+def medir(funcion, *args, repeticiones=1):
+    """Retorna el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def bench_multiplicacion(tamanos):
+    matrix = Matrix()
+    print("multiplicar_matrices (enteros)")
+    print(f"{'n':>6} {'ingenuo (s)':>12} {'motor (s)':>12} {'aceleración':>12}")
+    for n in tamanos:
+        A = matriz_aleatoria(n, n, 1)
+        B = matriz_aleatoria(n, n, 2)
+        t_ingenuo = medir(multiplicar_ingenuo, A, B)
+        t_motor = medir(matrix.multiplicar_matrices, A, B)
+        print(f"{n:>6} {t_ingenuo:>12.3f} {t_motor:>12.3f} {t_ingenuo / t_motor:>11.1f}x")
+
+
+def tamano_lista(matriz):
+    """Bytes aproximados de una lista de listas (contenedores y elementos)."""
+    total = sys.getsizeof(matriz)
+    for fila in matriz:
+        total += sys.getsizeof(fila) + sum(sys.getsizeof(valor) for valor in fila)
+    return total
+
+
+def bench_strassen(tamanos=(64, 128, 256, 512), cortes=(32, 64, 128)):
+    matrix = Matrix()
+    print("multiplicar_strassen frente a multiplicar_matrices (cruce según el corte)")
+    print(f"{'n':>6} {'clásico (s)':>12}" + "".join(f"{'corte ' + str(c):>12}" for c in cortes))
+    for n in tamanos:
+        A = matriz_aleatoria(n, n, 1)
+        B = matriz_aleatoria(n, n, 2)
+        fila = f"{n:>6} {medir(matrix.multiplicar_matrices, A, B):>12.3f}"
+        for corte in cortes:
+            fila += f"{medir(matrix.multiplicar_strassen, A, B, corte):>12.3f}"
+        print(fila)
+
+
+def bench_densa(n=1000):
+    matrix = Matrix()
+    aleatorio = random.Random(3)
+    A = [[aleatorio.random() for _ in range(n)] for _ in range(n)]
+    B = [[aleatorio.random() for _ in range(n)] for _ in range(n)]
+    DA = DenseMatrix.desde_lista(A)
+    DB = DenseMatrix.desde_lista(B)
+    print(f"DenseMatrix frente a listas ({n}x{n} decimales)")
+    bytes_lista = tamano_lista(A)
+    bytes_densa = DA.datos.itemsize * len(DA.datos)
+    print(f"  memoria: listas {bytes_lista / 1e6:.1f} MB, densa {bytes_densa / 1e6:.1f} MB "
+          f"({bytes_lista / bytes_densa:.1f}x menos)")
+    for nombre, args_lista, args_densa in (
+        ("suma_matrices", (A, B), (DA, DB)),
+        ("resta_matrices", (A, B), (DA, DB)),
+        ("multiplicar_escalar", (A, 2.5), (DA, 2.5)),
+        ("transpuesta", (A,), (DA,)),
+    ):
+        funcion = getattr(matrix, nombre)
+        t_lista = medir(funcion, *args_lista)
+        t_densa = medir(funcion, *args_densa)
+        print(f"  {nombre:<20} listas {t_lista:.3f} s, densa {t_densa:.4f} s")
+
+
+def bench_dispersa(n=10000, densidad=0.01):
+    matrix = Matrix()
+    aleatorio = random.Random(4)
+    nnz = int(n * n * densidad)
+    filas = [aleatorio.randrange(n) for _ in range(nnz)]
+    columnas = [aleatorio.randrange(n) for _ in range(nnz)]
+    valores = [aleatorio.randint(1, 9) for _ in range(nnz)]
+    print(f"CSRMatrix ({n}x{n}, densidad {densidad:.0%}, {nnz} no ceros)")
+    inicio = time.perf_counter()
+    A = COOMatrix(n, n, filas, columnas, valores).a_csr()
+    B = COOMatrix(n, n, columnas, filas, valores).a_csr()
+    print(f"  construcción (COO -> CSR)  {time.perf_counter() - inicio:.3f} s")
+    for nombre, args in (
+        ("suma_matrices", (A, B)),
+        ("multiplicar_escalar", (A, 3)),
+        ("transpuesta", (A,)),
+        ("traza", (A,)),
+        ("diagonal", (A,)),
+        ("es_diagonal", (A,)),
+        ("buscar_en_matriz", (A, 7)),
+    ):
+        print(f"  {nombre:<26} {medir(getattr(matrix, nombre), *args):.3f} s")
+    # La versión densa equivalente ocuparía n * n celdas; se compara a menor escala
+    m = 1000
+    densa = [[0] * m for _ in range(m)]
+    for _ in range(int(m * m * densidad)):
+        densa[aleatorio.randrange(m)][aleatorio.randrange(m)] = aleatorio.randint(1, 9)
+    print(f"  referencia densa {m}x{m}: suma_matrices {medir(matrix.suma_matrices, densa, densa):.3f} s, "
+          f"buscar_en_matriz {medir(matrix.buscar_en_matriz, densa, 7):.3f} s")
+
+
+def bench_paralela(n=384, maximo_workers=None):
+    maximo_workers = maximo_workers or os.cpu_count() or 1
+    A = matriz_aleatoria(n, n, 5)
+    B = matriz_aleatoria(n, n, 6)
+    # Las operaciones elemento a elemento solo se reparten con DenseMatrix
+    grande = DenseMatrix.desde_lista(matriz_aleatoria(4 * n, 4 * n, 7))
+    print(f"ParallelMatrix: escalado con 1..{maximo_workers} procesos")
+    print(f"{'workers':>8} {'multiplicar ' + str(n):>18} {'suma densa ' + str(4 * n):>20}")
+    matrix = Matrix()
+    print(f"{'serie':>8} {medir(matrix.multiplicar_matrices, A, B):>17.3f}s "
+          f"{medir(matrix.suma_matrices, grande, grande):>19.3f}s")
+    for workers in range(1, maximo_workers + 1):
+        with ParallelMatrix(workers=workers, umbral=0) as paralela:
+            # Primera llamada para arrancar los procesos del pool
+            paralela.multiplicar_matrices([[1]], [[1]])
+            t_producto = medir(paralela.multiplicar_matrices, A, B)
+            t_suma = medir(paralela.suma_matrices, grande, grande)
+        print(f"{workers:>8} {t_producto:>17.3f}s {t_suma:>19.3f}s")
+
+
+def main(argv):
+    tamanos = [int(arg) for arg in argv] or [64, 256, 512]
+    bench_multiplicacion(tamanos)
+    bench_strassen()
+    bench_densa()
+    bench_dispersa()
+    bench_paralela()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
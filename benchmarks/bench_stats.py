@@ -0,0 +1,241 @@
+"""
+Benchmarks de las operaciones de src/stats.
+
+Uso:
+    python -m benchmarks.bench_stats
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_right
+from itertools import chain
+
+from src.stats.dataset import Dataset
+from src.stats.histogram import Histogram
+from src.stats.parallel import ParallelStats
+from src.stats.running import RunningCovariance
+from src.stats.sketch import KLLSketch
+from src.stats.stats import Stats
+
+
+def medir(funcion, *args, repeticiones=1):
+    """Retorna el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def numeros_aleatorios(n, semilla=0):
+    aleatorio = random.Random(semilla)
+    return [aleatorio.gauss(100, 15) for _ in range(n)]
+
+
+def bench_paralela(n=5_000_000, maximo_workers=None):
+    maximo_workers = maximo_workers or os.cpu_count() or 1
+    stats = Stats()
+    numeros = numeros_aleatorios(n)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as archivo:
+        archivo.write("\n".join(map(repr, numeros)))
+        ruta = archivo.name
+    try:
+        tamano = os.path.getsize(ruta)
+        print(f"ParallelStats: archivo de {n} números ({tamano / 1e6:.0f} MB)")
+
+        def secuencial():
+            with open(ruta) as f:
+                datos = [float(linea) for linea in f]
+            return stats.promedio(datos), stats.varianza(datos), stats.rango(datos)
+
+        print(f"{'Stats (leer + 3 llamadas)':>28} {medir(secuencial):>8.3f} s")
+        for workers in range(1, maximo_workers + 1):
+            with ParallelStats(workers=workers, bytes_por_bloque=max(1, tamano // (4 * workers))) as paralela:
+                tiempo = medir(paralela.resumir, ruta)
+            print(f"{str(workers) + ' procesos':>28} {tiempo:>8.3f} s")
+    finally:
+        os.remove(ruta)
+
+
+def mediana_ordenando(numeros):
+    """Mediana original: ordena toda la lista."""
+    ordenados = sorted(numeros)
+    n = len(ordenados)
+    if n % 2 == 1:
+        return ordenados[n // 2]
+    return (ordenados[n // 2 - 1] + ordenados[n // 2]) / 2
+
+
+def bench_seleccion(n=1_000_000):
+    stats = Stats()
+    print(f"mediana / cuantiles por selección ({n} valores)")
+    casos = (
+        ("aleatorios", numeros_aleatorios(n)),
+        ("enteros repetidos", [random.Random(1).randint(0, 100) for _ in range(n)]),
+        ("ya ordenados", list(range(n))),
+    )
+    for nombre, numeros in casos:
+        t_orden = medir(mediana_ordenando, numeros)
+        t_seleccion = medir(stats.mediana, numeros)
+        t_cuantiles = medir(stats.cuantiles, numeros, [0.5, 0.9, 0.99])
+        print(f"  {nombre:<18} ordenar {t_orden:.3f} s, selección {t_seleccion:.3f} s, "
+              f"p50/p90/p99 {t_cuantiles:.3f} s")
+
+
+def bench_bosquejo(n=1_000_000):
+    stats = Stats()
+    numeros = numeros_aleatorios(n)
+    qs = [0.5, 0.95, 0.99]
+    ordenados = sorted(numeros)
+    print(f"KLLSketch: p50/p95/p99 de {n} valores")
+    print(f"  Stats.cuantiles (todo en memoria) {medir(stats.cuantiles, numeros, qs):.3f} s")
+    for k in (100, 200, 400):
+        bosquejo = KLLSketch(k, semilla=0)
+        tiempo = medir(bosquejo.extend, iter(numeros))
+        guardados = sum(map(len, bosquejo.a_dict()["niveles"]))
+        error = max(
+            abs(bisect_right(ordenados, valor) / n - q) for q, valor in zip(qs, bosquejo.cuantiles(qs))
+        )
+        print(f"  k={k:<4} {tiempo:.3f} s, {guardados} valores guardados, error de rango {error:.4f}")
+
+
+def moda_dos_pasadas(numeros):
+    """Moda original: cuenta con un dict y recorre otra vez la lista para los empates."""
+    conteo = {}
+    for num in numeros:
+        conteo[num] = conteo.get(num, 0) + 1
+    max_frecuencia = max(conteo.values())
+    for num in numeros:
+        if conteo[num] == max_frecuencia:
+            return num
+
+
+def bench_moda(n=1_000_000):
+    stats = Stats()
+    aleatorio = random.Random(2)
+    numeros = [int(aleatorio.paretovariate(1.1)) for _ in range(n)]
+    print(f"moda / mas_frecuentes ({n} valores, {len(set(numeros))} distintos)")
+    print(f"  moda en dos pasadas   {medir(moda_dos_pasadas, numeros):.3f} s")
+    print(f"  moda (Counter)        {medir(stats.moda, numeros):.3f} s")
+    print(f"  mas_frecuentes top 10 {medir(stats.mas_frecuentes, iter(numeros), 10):.3f} s (100 contadores)")
+
+
+def bench_lote(series=5_000, longitud=50):
+    stats = Stats()
+    aleatorio = random.Random(4)
+    lote = [[aleatorio.gauss(100, 15) for _ in range(longitud)] for _ in range(series)]
+    columna = array("d", chain.from_iterable(lote))
+
+    def seis_llamadas():
+        return [
+            (stats.promedio(s), stats.mediana(s), stats.moda(s),
+             stats.desviacion_estandar(s), stats.varianza(s), stats.rango(s))
+            for s in lote
+        ]
+
+    print(f"resumen_lote: {series} series de {longitud} valores")
+    print(f"  seis llamadas por serie {medir(seis_llamadas):.3f} s")
+    print(f"  resumen_lote(series)    {medir(stats.resumen_lote, lote):.3f} s")
+    print(f"  resumen_lote(array)     {medir(stats.resumen_lote, columna, longitud):.3f} s")
+
+
+def bench_moviles(n=100_000, ventana=100):
+    stats = Stats()
+    serie = numeros_aleatorios(n)
+    print(f"ventanas móviles: {n} valores, ventana de {ventana}")
+    for nombre, original, movil in (
+        ("promedio", stats.promedio, stats.promedio_movil),
+        ("varianza", stats.varianza, stats.varianza_movil),
+        ("rango", stats.rango, stats.rango_movil),
+        ("mediana", stats.mediana, stats.mediana_movil),
+    ):
+        t_cortes = medir(lambda: [original(serie[i:i + ventana]) for i in range(n - ventana + 1)])
+        t_movil = medir(lambda: list(movil(serie, ventana)))
+        print(f"  {nombre:<9} cortes {t_cortes:.3f} s, móvil {t_movil:.3f} s")
+
+
+def bench_histograma(n=1_000_000, cubetas=200):
+    stats = Stats()
+    aleatorio = random.Random(6)
+    latencias = [aleatorio.lognormvariate(3, 1) for _ in range(n)]
+    exactos = stats.cuantiles(latencias, [0.5, 0.99])
+    print(f"Histogram: {n} latencias, {cubetas} cubetas (p50 exacto {exactos[0]:.2f}, p99 {exactos[1]:.2f})")
+    for nombre, histograma in (
+        ("ancho fijo", Histogram.ancho_fijo(0, 1000, cubetas)),
+        ("logarítmico", Histogram.logaritmico(0.1, 10_000, cubetas)),
+        ("por cuantiles", Histogram.por_cuantiles(aleatorio.sample(latencias, 10_000), cubetas)),
+    ):
+        tiempo = medir(histograma.extend, latencias)
+        p50, p99 = histograma.cuantiles([0.5, 0.99])
+        print(f"  {nombre:<14} {tiempo:.3f} s, p50 {p50:.2f}, p99 {p99:.2f}")
+
+
+def bench_describe(n=1_000_000, consultas=10):
+    stats = Stats(capacidad_cache=8)
+    numeros = numeros_aleatorios(n)
+    datos = Dataset(numeros)
+
+    def por_separado():
+        return (stats.promedio(numeros), stats.mediana(numeros), stats.moda(numeros),
+                stats.varianza(numeros), stats.desviacion_estandar(numeros))
+
+    def repetidas():
+        for _ in range(consultas):
+            stats.promedio(datos), stats.mediana(datos), stats.varianza(datos)
+
+    print(f"describe ({n} valores)")
+    print(f"  cinco llamadas         {medir(por_separado):.3f} s")
+    print(f"  describe               {medir(stats.describe, numeros):.3f} s")
+    stats.limpiar_cache()
+    print(f"  {consultas} x 3 con Dataset   {medir(repetidas):.3f} s (caché de {stats.capacidad_cache})")
+
+
+def covarianza_dos_pasadas(xs, ys):
+    """Versión ingenua: medias en una pasada y co-momentos con generadores en otra."""
+    n = len(xs)
+    media_x, media_y = sum(xs) / n, sum(ys) / n
+    sxy = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    sxx = sum((x - media_x) ** 2 for x in xs)
+    syy = sum((y - media_y) ** 2 for y in ys)
+    return sxy / n, sxy / (sxx * syy) ** 0.5, sxy / sxx
+
+
+def bench_covarianza(n=2_000_000, bloques=8):
+    stats = Stats()
+    aleatorio = random.Random(8)
+    xs = numeros_aleatorios(n)
+    ys = [2 * x + aleatorio.gauss(0, 10) for x in xs]
+    paso = -(-n // bloques)
+
+    def por_bloques():
+        total = RunningCovariance()
+        for i in range(0, n, paso):
+            total.merge(RunningCovariance(zip(xs[i:i + paso], ys[i:i + paso])))
+        return total
+
+    print(f"covarianza / correlación / regresión ({n} pares)")
+    print(f"  dos pasadas ingenuas          {medir(covarianza_dos_pasadas, xs, ys):.3f} s")
+    print(f"  Stats.correlacion             {medir(stats.correlacion, xs, ys):.3f} s")
+    print(f"  desde_secuencias (las tres)   {medir(RunningCovariance.desde_secuencias, xs, ys):.3f} s")
+    print(f"  extend(zip), una pasada       {medir(lambda: RunningCovariance(zip(xs, ys))):.3f} s")
+    print(f"  {str(bloques) + ' bloques, extend + merge':<29} {medir(por_bloques):.3f} s")
+
+
+def main(argv):
+    bench_seleccion()
+    bench_bosquejo()
+    bench_moda()
+    bench_lote()
+    bench_moviles()
+    bench_histograma()
+    bench_describe()
+    bench_covarianza()
+    bench_paralela()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
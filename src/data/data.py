@@ -1,3 +1,28 @@
+import heapq
+
+from src.data.index import ListIndex
+from src.data.queues import AsyncQueue, AsyncStack, Queue, ThreadSafeQueue, ThreadSafeStack
+
+_PILAS = {"hilos": ThreadSafeStack, "asyncio": AsyncStack}
+_COLAS = {"hilos": ThreadSafeQueue, "asyncio": AsyncQueue}
+
+
+def _concurrente(clases, modo, capacidad, meter, sacar):
+    """Diccionario de métodos de una pila o cola para hilos o asyncio."""
+    if modo not in clases:
+        raise ValueError(f"Modo desconocido: {modo!r}; se espera 'simple', 'hilos' o 'asyncio'")
+    estructura = clases[modo](capacidad)
+    return {
+        meter: estructura.push,
+        sacar: estructura.pop,
+        "peek": estructura.peek,
+        "is_empty": estructura.is_empty,
+        meter + "_many": estructura.push_many,
+        sacar + "_many": estructura.pop_many,
+        "is_full": estructura.is_full,
+    }
+
+
 class Data:
     """
     Clase con métodos para operaciones y manipulaciones de estructuras de datos.
@@ -16,7 +41,7 @@ class Data:
         """
         return lista[::-1]
     
-    def buscar_elemento(self, lista, elemento):
+    def buscar_elemento(self, lista, elemento, indice=None):
         """
         Busca un elemento en una lista y devuelve su índice (o -1 si no existe).
         Implementación manual sin usar index().
@@ -24,15 +49,46 @@ class Data:
         Args:
             lista (list): Lista donde buscar
             elemento: Elemento a buscar
+            indice (ListIndex): Índice creado con indice_lista(lista). Si se
+                                indica, la búsqueda cuesta O(1) en promedio (o
+                                O(log n) si la lista está ordenada) en lugar de
+                                recorrer la lista
             
         Returns:
             int: Índice del elemento o -1 si no se encuentra
+        
+        Raises:
+            ValueError: Si el índice no corresponde a la lista
         """
+        if indice is not None:
+            if indice.lista is not lista:
+                raise ValueError("El índice no corresponde a la lista")
+            return indice.buscar(elemento)
         for i, item in enumerate(lista):
             if item == elemento:
                 return i
         return -1
     
+    def indice_lista(self, lista, ordenada=False):
+        """
+        Crea un índice elemento -> primer índice para hacer muchas búsquedas
+        sobre la misma lista con buscar_elemento(lista, elemento, indice), o
+        pruebas de pertenencia con "elemento in indice". Si la lista cambia,
+        se avisa con indice.invalidar().
+        
+        Args:
+            lista (list): Lista a indexar
+            ordenada (bool): True si la lista está ordenada; entonces se busca
+                             con búsqueda binaria sin construir nada
+        
+        Returns:
+            ListIndex: Índice de la lista
+        
+        Ejemplo:
+            indice_lista([10, 20, 30, 20]).buscar(20) -> 1
+        """
+        return ListIndex(lista, ordenada)
+    
     def eliminar_duplicados(self, lista):
         """
         Elimina elementos duplicados de una lista sin usar set().
@@ -58,7 +114,9 @@ class Data:
     
     def merge_ordenado(self, lista1, lista2):
         """
-        Combina dos listas ordenadas en una sola lista ordenada.
+        Combina dos listas ordenadas en una sola lista ordenada con dos
+        punteros, en O(n + m) y sin volver a ordenar. Es estable: con
+        elementos iguales, los de lista1 van primero.
         
         Args:
             lista1 (list): Primera lista ordenada
@@ -67,10 +125,50 @@ class Data:
         Returns:
             list: Lista combinada y ordenada
         """
+        if not lista1 or not lista2:
+            return list(lista1) + list(lista2)
         merge = []
-        for item in lista1 + lista2:
-            merge.append(item)
-        return sorted(merge)
+        append = merge.append
+        i, j = 0, 0
+        n, m = len(lista1), len(lista2)
+        a, b = lista1[0], lista2[0]
+        while True:
+            if b < a:
+                append(b)
+                j += 1
+                if j == m:
+                    break
+                b = lista2[j]
+            else:
+                append(a)
+                i += 1
+                if i == n:
+                    break
+                a = lista1[i]
+        # Solo a una de las dos le quedan elementos, ya ordenados
+        merge.extend(lista1[i:])
+        merge.extend(lista2[j:])
+        return merge
+    
+    def merge_k(self, iterables):
+        """
+        Combina k secuencias ordenadas de forma perezosa con un montículo de
+        k elementos: cada valor cuesta O(log k) y la memoria solo depende de
+        k, así que sirve para combinar ficheros ordenados más grandes que la
+        memoria. Es estable: con elementos iguales, sale primero el de la
+        secuencia anterior.
+        
+        Args:
+            iterables (iterable): Secuencias ordenadas (listas, generadores,
+                                  ficheros...)
+            
+        Yields:
+            Los elementos de todas las secuencias, en orden
+        
+        Ejemplo:
+            list(Data().merge_k([[1, 4], [2, 5], [3]])) -> [1, 2, 3, 4, 5]
+        """
+        yield from heapq.merge(*iterables)
     
     def rotar_lista(self, lista, k):
         """
@@ -104,29 +202,54 @@ class Data:
         suma_actual = sum(lista)
         return suma_esperada - suma_actual
     
-    def es_subconjunto(self, conjunto1, conjunto2):
+    def es_subconjunto(self, conjunto1, conjunto2, indice=None):
         """
         Verifica si conjunto1 es subconjunto de conjunto2 sin usar set.
         
+        Construye una vez un ListIndex de conjunto2 y comprueba cada elemento
+        de conjunto1 contra él, en O(n + m) en lugar de recorrer conjunto2
+        por cada elemento. Los elementos no hashables se comparan uno a uno.
+        
         Args:
             conjunto1 (list): Posible subconjunto
             conjunto2 (list): Conjunto principal
+            indice (ListIndex): Índice de conjunto2 ya construido (opcional),
+                                por ejemplo indice_lista(conjunto2, ordenada=True)
+                                si conjunto2 está ordenado
             
         Returns:
             bool: True si conjunto1 es subconjunto de conjunto2, False en caso contrario
+        
+        Raises:
+            ValueError: Si el índice no corresponde a conjunto2
         """
-        for item in conjunto1:
-            if item not in conjunto2:
-                return False
-        return True
+        if indice is None:
+            indice = ListIndex(conjunto2)
+        elif indice.lista is not conjunto2:
+            raise ValueError("El índice no corresponde a la lista")
+        return all(map(indice.__contains__, conjunto1))
     
-    def implementar_pila(self):
+    def implementar_pila(self, capacidad=None, modo="simple"):
         """
         Implementa una estructura de datos tipo pila (stack) usando listas.
         
+        Con modo "hilos" la pila es una ThreadSafeStack: push espera si está
+        llena y pop si está vacía (ambos aceptan timeout). Con modo "asyncio"
+        es una AsyncStack y push y pop son corrutinas.
+        
+        Args:
+            capacidad (int): Número máximo de elementos en los modos "hilos"
+                             y "asyncio" (opcional)
+            modo (str): "simple", "hilos" o "asyncio"
+        
         Returns:
             dict: Diccionario con métodos push, pop, peek y is_empty
+        
+        Raises:
+            ValueError: Si el modo no es uno de los anteriores
         """
+        if modo != "simple":
+            return _concurrente(_PILAS, modo, capacidad, "push", "pop")
         pila = []
 
         def is_empty():
@@ -140,23 +263,39 @@ class Data:
         }
     
     
-    def implementar_cola(self):
+    def implementar_cola(self, capacidad=None, modo="simple"):
         """
-        Implementa una estructura de datos tipo cola (queue) usando listas.
+        Implementa una estructura de datos tipo cola (queue) con enqueue y
+        dequeue en O(1), sobre la clase Queue.
+        
+        Con modo "hilos" la cola es una ThreadSafeQueue: enqueue espera si
+        está llena y dequeue si está vacía (ambos aceptan timeout). Con modo
+        "asyncio" es una AsyncQueue y enqueue y dequeue son corrutinas.
+        
+        Args:
+            capacidad (int): Número máximo de elementos (opcional). En modo
+                             "simple", con la cola llena enqueue retorna False
+            modo (str): "simple", "hilos" o "asyncio"
         
         Returns:
-            dict: Diccionario con métodos enqueue, dequeue, peek y is_empty
-        """
-        cola = []
+            dict: Diccionario con métodos enqueue, dequeue, peek, is_empty,
+                  enqueue_many, dequeue_many e is_full
         
-        def is_empty():
-            return len(cola) == 0
+        Raises:
+            ValueError: Si el modo no es uno de los anteriores
+        """
+        if modo != "simple":
+            return _concurrente(_COLAS, modo, capacidad, "enqueue", "dequeue")
+        cola = Queue(capacidad)
         
         return {
-            "enqueue": lambda x: cola.append(x),
-            "dequeue": lambda: cola.pop(0) if cola else None,
-            "peek": lambda: cola[0] if cola else None,
-            "is_empty": is_empty  
+            "enqueue": cola.enqueue,
+            "dequeue": cola.dequeue,
+            "peek": cola.peek,
+            "is_empty": cola.is_empty,
+            "enqueue_many": cola.enqueue_many,
+            "dequeue_many": cola.dequeue_many,
+            "is_full": cola.is_full,
         }
     
     def matriz_transpuesta(self, matriz):
@@ -0,0 +1,224 @@
+import tempfile
+from array import array
+from functools import partial
+from itertools import chain, groupby, islice
+
+from src.data.data import Data
+
+# Memoria aproximada de un número dentro de una lista de Python (el objeto
+# más el puntero), para convertir el presupuesto en bytes a elementos
+_BYTES_POR_ELEMENTO = 32
+_TIPOS = "bBhHiIlLqQfd"
+
+
+def leer_binario(ruta, tipo="d", bloque=65536):
+    """
+    Lee por bloques un archivo de números en el formato binario de
+    ExternalSorter (los bytes de un array del tipo dado, sin cabecera).
+
+    Args:
+        ruta (str): Ruta del archivo
+        tipo (str): Código de tipo de array ("d" para float, "q" para int de 64 bits...)
+        bloque (int): Números leídos de cada vez
+
+    Yields:
+        Los números del archivo, en orden
+    """
+    with open(ruta, "rb") as archivo:
+        yield from _leer_tramo(archivo, tipo, bloque)
+
+
+def _leer_tramo(archivo, tipo, bloque):
+    """Números de un archivo binario abierto, desde el principio."""
+    archivo.seek(0)
+    lecturas = iter(partial(archivo.read, array(tipo).itemsize * bloque), b"")
+    return chain.from_iterable(map(partial(array, tipo), lecturas))
+
+
+class ExternalSorter:
+    """
+    Ordenación externa para datos que no caben en memoria.
+
+    extend() acumula números hasta llenar el presupuesto de memoria; entonces
+    los ordena y los vuelca a un archivo temporal como un tramo ordenado, en
+    binario compacto (los bytes de un array, 8 bytes por número con "d" o
+    "q"). ordenados() combina los tramos con Data.merge_k leyendo cada uno por
+    bloques. Si hay más tramos que fan_in, primero se combinan por grupos de
+    fan_in en tramos más largos, así que nunca hay más de fan_in archivos
+    abiertos a la vez en una combinación.
+
+    unicos() añade una etapa que elimina duplicados sobre la salida ordenada:
+    como los iguales salen seguidos, basta comparar con el anterior y la
+    memoria no crece con el número de valores distintos.
+
+    Los números se convierten al tipo del array al añadirlos (con "d" los
+    enteros pasan a float), así que la salida es la misma tanto si cabe en
+    memoria como si se vuelca a disco, y un valor que no es un número o no
+    cabe en el tipo falla ya en extend().
+
+    Los archivos temporales se borran al llamar a cerrar() o al salir del
+    bloque with.
+
+    Ejemplo:
+        with ExternalSorter(memoria=64 * 2**20) as ordenador:
+            ordenador.extend(leer_binario("datos.bin"))
+            ordenador.escribir("unicos.bin", unicos=True)
+    """
+
+    def __init__(self, memoria=64 * 2**20, tipo="d", fan_in=64):
+        """
+        Args:
+            memoria (int): Presupuesto aproximado de memoria en bytes, para el
+                           tramo en curso y para los búferes de lectura al combinar
+            tipo (str): Código de tipo de array con el que se guardan los
+                        tramos ("d" para float, "q" para int de 64 bits...)
+            fan_in (int): Número máximo de tramos que se combinan a la vez
+
+        Raises:
+            ValueError: Si el tipo no es numérico, fan_in es menor que 2 o la
+                        memoria no alcanza para un búfer por tramo
+        """
+        if tipo not in _TIPOS:
+            raise ValueError(f"Tipo desconocido: {tipo!r}; se espera uno de {_TIPOS!r}")
+        if fan_in < 2:
+            raise ValueError("fan_in debe ser al menos 2")
+        self.capacidad = memoria // _BYTES_POR_ELEMENTO
+        if self.capacidad < 2 * fan_in:
+            raise ValueError("La memoria no alcanza para combinar fan_in tramos")
+        self.memoria = memoria
+        # Al combinar, el presupuesto se reparte entre un búfer por tramo y
+        # otro para la salida
+        self._bloque = self.capacidad // (fan_in + 1)
+        self.tipo = tipo
+        self.fan_in = fan_in
+        self.n = 0
+        self._pendientes = []
+        self._tramos = []
+
+    def _volcar(self, valores):
+        """Escribe valores ya ordenados en un archivo temporal nuevo."""
+        archivo = tempfile.TemporaryFile()
+        array(self.tipo, valores).tofile(archivo)
+        self._tramos.append(archivo)
+
+    def push(self, x):
+        """
+        Añade un número.
+
+        Args:
+            x (number): Número a añadir
+
+        Raises:
+            TypeError: Si x no es un número del tipo del array
+            OverflowError: Si x no cabe en el tipo del array
+        """
+        self.extend((x,))
+
+    def extend(self, numeros):
+        """
+        Añade todos los números de un iterable (puede ser un generador más
+        grande que la memoria; se consume por bloques).
+
+        Args:
+            numeros (iterable): Números a añadir
+
+        Returns:
+            ExternalSorter: El propio ordenador
+
+        Raises:
+            TypeError: Si algún valor no es un número del tipo del array
+            OverflowError: Si algún valor no cabe en el tipo del array
+        """
+        iterador = iter(numeros)
+        while True:
+            antes = len(self._pendientes)
+            # Pasar por el array convierte cada bloque igual que al volcarlo
+            self._pendientes.extend(array(self.tipo, islice(iterador, self.capacidad - antes)))
+            self.n += len(self._pendientes) - antes
+            if len(self._pendientes) < self.capacidad:
+                return self
+            self._pendientes.sort()
+            self._volcar(self._pendientes)
+            self._pendientes = []
+
+    def _combinar(self, tramos):
+        return Data().merge_k(_leer_tramo(archivo, self.tipo, self._bloque) for archivo in tramos)
+
+    def ordenados(self):
+        """
+        Retorna todos los números añadidos, en orden ascendente. Si todo cupo
+        en un solo tramo, se ordena en memoria sin tocar el disco.
+
+        Yields:
+            Los números en orden
+        """
+        if not self._tramos:
+            self._pendientes.sort()
+            yield from self._pendientes
+            return
+        if self._pendientes:
+            self._pendientes.sort()
+            self._volcar(self._pendientes)
+            self._pendientes = []
+        while len(self._tramos) > self.fan_in:
+            tramos, self._tramos = self._tramos, []
+            for i in range(0, len(tramos), self.fan_in):
+                grupo = tramos[i:i + self.fan_in]
+                archivo = tempfile.TemporaryFile()
+                combinados = self._combinar(grupo)
+                while lote := list(islice(combinados, self._bloque)):
+                    array(self.tipo, lote).tofile(archivo)
+                self._tramos.append(archivo)
+                for tramo in grupo:
+                    tramo.close()
+        yield from self._combinar(self._tramos)
+
+    def unicos(self):
+        """
+        Retorna los números añadidos sin repetidos, en orden ascendente.
+
+        Yields:
+            Cada número distinto una vez, en orden
+        """
+        for x, _ in groupby(self.ordenados()):
+            yield x
+
+    def escribir(self, ruta, unicos=False):
+        """
+        Escribe la salida ordenada en un archivo binario que se puede volver
+        a leer con leer_binario().
+
+        Args:
+            ruta (str): Ruta del archivo de salida
+            unicos (bool): Si es True, se escribe sin repetidos
+
+        Returns:
+            int: Cuántos números se escribieron
+        """
+        valores = self.unicos() if unicos else self.ordenados()
+        total = 0
+        with open(ruta, "wb") as archivo:
+            while lote := list(islice(valores, self._bloque)):
+                array(self.tipo, lote).tofile(archivo)
+                total += len(lote)
+        return total
+
+    def cerrar(self):
+        """Borra los archivos temporales y descarta los números añadidos."""
+        for archivo in self._tramos:
+            archivo.close()
+        self._tramos = []
+        self._pendientes = []
+        self.n = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return f"ExternalSorter(memoria={self.memoria}, tipo={self.tipo!r}, n={self.n}, tramos={len(self._tramos)})"
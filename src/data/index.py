@@ -0,0 +1,91 @@
+from bisect import bisect_left
+
+
+class ListIndex:
+    """
+    Índice de una lista para hacer muchas búsquedas y pruebas de pertenencia
+    sobre ella: guarda en un diccionario el primer índice de cada elemento,
+    así que construirlo cuesta un recorrido de la lista y después cada
+    búsqueda cuesta O(1) en promedio.
+
+    Los elementos que no se pueden usar como clave de un diccionario (listas,
+    diccionarios...) se guardan aparte y se buscan recorriéndolos, así que
+    solo esos cuestan O(k) en el número de elementos no hashables.
+
+    Con ordenada=True la lista debe estar ordenada: no se construye nada y
+    cada búsqueda es una búsqueda binaria en O(log n), que también sirve para
+    elementos no hashables que se puedan comparar.
+
+    Como ValueIndex, el índice no detecta los cambios hechos sobre la lista;
+    se avisa con invalidar() para que se reconstruya en la siguiente búsqueda.
+
+    Ejemplo:
+        indice = ListIndex([10, 20, 30, 20])
+        indice.buscar(20) -> 1
+        30 in indice -> True
+    """
+
+    def __init__(self, lista, ordenada=False):
+        """
+        Args:
+            lista (list): Lista a indexar
+            ordenada (bool): True si la lista está ordenada de menor a mayor
+        """
+        self.lista = lista
+        self.ordenada = ordenada
+        self._posiciones = None
+        self._no_hashables = None
+
+    def _construir(self):
+        lista = self.lista
+        try:
+            # Al recorrerla al revés, cada clave se queda con su primer índice
+            self._posiciones = dict(zip(reversed(lista), range(len(lista) - 1, -1, -1)))
+            self._no_hashables = []
+        except TypeError:
+            posiciones = {}
+            no_hashables = []
+            for i, elemento in enumerate(lista):
+                try:
+                    posiciones.setdefault(elemento, i)
+                except TypeError:
+                    no_hashables.append((elemento, i))
+            self._posiciones = posiciones
+            self._no_hashables = no_hashables
+
+    def invalidar(self):
+        """Marca el índice como desactualizado; se reconstruye en la siguiente búsqueda."""
+        self._posiciones = None
+        self._no_hashables = None
+
+    def buscar(self, elemento):
+        """
+        Retorna el índice de la primera aparición del elemento.
+
+        Args:
+            elemento: Elemento a buscar
+
+        Returns:
+            int: Índice del elemento o -1 si no se encuentra
+        """
+        if self.ordenada:
+            i = bisect_left(self.lista, elemento)
+            return i if i < len(self.lista) and self.lista[i] == elemento else -1
+        if self._posiciones is None:
+            self._construir()
+        try:
+            return self._posiciones.get(elemento, -1)
+        except TypeError:
+            for otro, i in self._no_hashables:
+                if otro == elemento:
+                    return i
+            return -1
+
+    def __contains__(self, elemento):
+        return self.buscar(elemento) != -1
+
+    def __len__(self):
+        return len(self.lista)
+
+    def __repr__(self):
+        return f"ListIndex(elementos={len(self.lista)}, ordenada={self.ordenada})"
@@ -0,0 +1,405 @@
+import asyncio
+import threading
+from collections import deque
+from itertools import islice
+
+# Marca de fin de un iterador
+_FIN = object()
+# Elementos que push_many mete como máximo por cada toma del cerrojo
+_LOTE = 1024
+
+
+class _Contenedor:
+    """
+    Núcleo común de colas y pilas: un collections.deque con capacidad
+    opcional. Las subclases con _LIFO = True sacan por el final (pila) y las
+    demás por el principio (cola); en ambos casos sacar cuesta O(1).
+    """
+
+    _LIFO = False
+
+    def __init__(self, capacidad=None):
+        """
+        Args:
+            capacidad (int): Número máximo de elementos. None para no tener límite
+
+        Raises:
+            ValueError: Si la capacidad es menor que 1
+        """
+        if capacidad is not None and capacidad < 1:
+            raise ValueError("La capacidad debe ser al menos 1")
+        self.capacidad = capacidad
+        self._elementos = deque()
+
+    def _libres(self):
+        """Huecos disponibles (None sin capacidad)."""
+        return None if self.capacidad is None else self.capacidad - len(self._elementos)
+
+    def _meter_varios(self, elementos):
+        """Mete los elementos que quepan y retorna cuántos metió."""
+        libres = self._libres()
+        if libres is None:
+            antes = len(self._elementos)
+            self._elementos.extend(elementos)
+            return len(self._elementos) - antes
+        if libres <= 0:
+            return 0
+        nuevos = list(islice(elementos, libres))
+        self._elementos.extend(nuevos)
+        return len(nuevos)
+
+    def _sacar(self):
+        return self._elementos.pop() if self._LIFO else self._elementos.popleft()
+
+    def _sacar_varios(self, k):
+        sacar = self._elementos.pop if self._LIFO else self._elementos.popleft
+        return [sacar() for _ in range(min(k, len(self._elementos)))]
+
+    def peek(self):
+        """
+        Returns:
+            El siguiente elemento que saldría, sin sacarlo, o None si está vacía
+        """
+        if not self._elementos:
+            return None
+        return self._elementos[-1] if self._LIFO else self._elementos[0]
+
+    def is_empty(self):
+        """bool: True si no hay elementos."""
+        return not self._elementos
+
+    def is_full(self):
+        """bool: True si hay capacidad y está llena."""
+        return self.capacidad is not None and len(self._elementos) >= self.capacidad
+
+    def __len__(self):
+        return len(self._elementos)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(capacidad={self.capacidad}, elementos={len(self._elementos)})"
+
+
+class Queue(_Contenedor):
+    """
+    Cola FIFO sobre un collections.deque: enqueue y dequeue cuestan O(1)
+    (una lista con pop(0) desplaza todos los elementos en cada dequeue).
+
+    Con capacidad, la cola aplica contrapresión: enqueue no añade nada y
+    retorna False cuando está llena, para que el productor espere o descarte.
+
+    Ejemplo:
+        cola = Queue(capacidad=2)
+        cola.enqueue(1), cola.enqueue(2), cola.enqueue(3) -> (True, True, False)
+        cola.dequeue() -> 1
+    """
+
+    def enqueue(self, x):
+        """
+        Añade un elemento al final de la cola.
+
+        Args:
+            x: Elemento a añadir
+
+        Returns:
+            bool: True si se añadió, False si la cola estaba llena
+        """
+        if self.is_full():
+            return False
+        self._elementos.append(x)
+        return True
+
+    def enqueue_many(self, elementos):
+        """
+        Añade varios elementos en orden hasta llenar la cola.
+
+        Args:
+            elementos (iterable): Elementos a añadir
+
+        Returns:
+            int: Cuántos elementos se añadieron. Si la cola se llena, los
+                 siguientes elementos de un iterador no se consumen.
+        """
+        return self._meter_varios(elementos)
+
+    def dequeue(self):
+        """
+        Saca el primer elemento de la cola.
+
+        Returns:
+            El primer elemento, o None si la cola está vacía
+        """
+        return self._elementos.popleft() if self._elementos else None
+
+    def dequeue_many(self, k):
+        """
+        Saca hasta k elementos del principio de la cola.
+
+        Args:
+            k (int): Número máximo de elementos a sacar
+
+        Returns:
+            list: Los elementos sacados, en orden (vacía si la cola está vacía)
+        """
+        return self._sacar_varios(k)
+
+
+class _Bloqueante(_Contenedor):
+    """
+    Versión para hilos del núcleo: un cerrojo protege el deque y dos
+    condiciones despiertan solo a quien puede avanzar (productores cuando
+    queda sitio, consumidores cuando hay elementos).
+    """
+
+    def __init__(self, capacidad=None):
+        super().__init__(capacidad)
+        cerrojo = threading.Lock()
+        self._hay_elementos = threading.Condition(cerrojo)
+        self._hay_sitio = threading.Condition(cerrojo)
+
+    def push(self, x, timeout=None):
+        """
+        Añade un elemento, esperando a que haya sitio si está llena.
+
+        Args:
+            x: Elemento a añadir
+            timeout (float): Segundos máximos de espera. None espera sin límite
+                             y 0 no espera
+
+        Raises:
+            TimeoutError: Si sigue llena al acabar el tiempo
+        """
+        with self._hay_sitio:
+            if not self._hay_sitio.wait_for(lambda: not self.is_full(), timeout):
+                raise TimeoutError("La estructura sigue llena")
+            self._elementos.append(x)
+            self._hay_elementos.notify()
+
+    def push_many(self, elementos, timeout=None):
+        """
+        Añade todos los elementos en orden, tomando el cerrojo una vez por
+        bloque de hasta 1024 elementos en lugar de una vez por elemento y
+        esperando cuando está llena. El cerrojo se suelta entre bloques, así
+        que los consumidores avanzan aunque el iterable no termine nunca.
+
+        Args:
+            elementos (iterable): Elementos a añadir
+            timeout (float): Segundos máximos de cada espera por sitio
+
+        Returns:
+            int: Cuántos elementos se añadieron
+
+        Raises:
+            TimeoutError: Si sigue llena al acabar el tiempo de una espera
+        """
+        iterador = iter(elementos)
+        total = 0
+        siguiente = next(iterador, _FIN)
+        while siguiente is not _FIN:
+            with self._hay_sitio:
+                if not self._hay_sitio.wait_for(lambda: not self.is_full(), timeout):
+                    raise TimeoutError("La estructura sigue llena")
+                self._elementos.append(siguiente)
+                metidos = 1 + self._meter_varios(islice(iterador, _LOTE - 1))
+                self._hay_elementos.notify(metidos)
+            total += metidos
+            # Si quedan elementos, o se llenó o se acabó el bloque
+            siguiente = next(iterador, _FIN)
+        return total
+
+    def pop(self, timeout=None):
+        """
+        Saca el siguiente elemento, esperando a que haya alguno si está vacía.
+
+        Args:
+            timeout (float): Segundos máximos de espera. None espera sin límite
+                             y 0 no espera
+
+        Returns:
+            El elemento sacado
+
+        Raises:
+            TimeoutError: Si sigue vacía al acabar el tiempo
+        """
+        with self._hay_elementos:
+            if not self._hay_elementos.wait_for(lambda: self._elementos, timeout):
+                raise TimeoutError("La estructura sigue vacía")
+            x = self._sacar()
+            self._hay_sitio.notify()
+            return x
+
+    def pop_many(self, k, timeout=None):
+        """
+        Saca hasta k elementos con una sola toma del cerrojo. Espera solo
+        hasta que haya al menos uno.
+
+        Args:
+            k (int): Número máximo de elementos a sacar
+            timeout (float): Segundos máximos de espera
+
+        Returns:
+            list: Entre 1 y k elementos, en el orden en que salen
+
+        Raises:
+            TimeoutError: Si sigue vacía al acabar el tiempo
+        """
+        with self._hay_elementos:
+            if not self._hay_elementos.wait_for(lambda: self._elementos, timeout):
+                raise TimeoutError("La estructura sigue vacía")
+            sacados = self._sacar_varios(k)
+            self._hay_sitio.notify(len(sacados))
+            return sacados
+
+    def peek(self):
+        with self._hay_elementos:
+            return super().peek()
+
+
+class ThreadSafeQueue(_Bloqueante):
+    """
+    Cola FIFO para comunicar hilos productores y consumidores. push espera
+    si está llena y pop si está vacía, con timeout opcional.
+
+    Ejemplo:
+        cola = ThreadSafeQueue(capacidad=100)
+        # hilo productor:  cola.push(tarea)
+        # hilo consumidor: tarea = cola.pop(timeout=1.0)
+    """
+
+
+class ThreadSafeStack(_Bloqueante):
+    """
+    Pila LIFO para varios hilos, con la misma interfaz que ThreadSafeQueue.
+    """
+
+    _LIFO = True
+
+
+class _Asincrono(_Contenedor):
+    """
+    Versión asyncio del núcleo: push y pop son corrutinas que ceden el bucle
+    de eventos mientras esperan, con dos asyncio.Condition sobre un mismo
+    cerrojo. Solo se debe usar desde un único bucle de eventos.
+    """
+
+    def __init__(self, capacidad=None):
+        super().__init__(capacidad)
+        cerrojo = asyncio.Lock()
+        self._hay_elementos = asyncio.Condition(cerrojo)
+        self._hay_sitio = asyncio.Condition(cerrojo)
+
+    @staticmethod
+    async def _esperar(condicion, predicado, timeout, mensaje):
+        try:
+            await asyncio.wait_for(condicion.wait_for(predicado), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(mensaje) from None
+
+    async def push(self, x, timeout=None):
+        """
+        Añade un elemento, esperando a que haya sitio si está llena.
+
+        Args:
+            x: Elemento a añadir
+            timeout (float): Segundos máximos de espera. None espera sin límite
+
+        Raises:
+            TimeoutError: Si sigue llena al acabar el tiempo
+        """
+        async with self._hay_sitio:
+            if self.is_full():
+                await self._esperar(self._hay_sitio, lambda: not self.is_full(), timeout, "La estructura sigue llena")
+            self._elementos.append(x)
+            self._hay_elementos.notify()
+
+    async def push_many(self, elementos, timeout=None):
+        """
+        Añade todos los elementos en orden por bloques de hasta 1024,
+        esperando cuando está llena. Entre bloques cede el bucle de eventos,
+        así que los consumidores avanzan aunque el iterable no termine nunca.
+
+        Args:
+            elementos (iterable): Elementos a añadir
+            timeout (float): Segundos máximos de cada espera por sitio
+
+        Returns:
+            int: Cuántos elementos se añadieron
+
+        Raises:
+            TimeoutError: Si sigue llena al acabar el tiempo de una espera
+        """
+        iterador = iter(elementos)
+        total = 0
+        siguiente = next(iterador, _FIN)
+        while siguiente is not _FIN:
+            async with self._hay_sitio:
+                if self.is_full():
+                    await self._esperar(self._hay_sitio, lambda: not self.is_full(), timeout, "La estructura sigue llena")
+                self._elementos.append(siguiente)
+                metidos = 1 + self._meter_varios(islice(iterador, _LOTE - 1))
+                self._hay_elementos.notify(metidos)
+            total += metidos
+            siguiente = next(iterador, _FIN)
+            if siguiente is not _FIN:
+                await asyncio.sleep(0)
+        return total
+
+    async def pop(self, timeout=None):
+        """
+        Saca el siguiente elemento, esperando a que haya alguno si está vacía.
+
+        Args:
+            timeout (float): Segundos máximos de espera. None espera sin límite
+
+        Returns:
+            El elemento sacado
+
+        Raises:
+            TimeoutError: Si sigue vacía al acabar el tiempo
+        """
+        async with self._hay_elementos:
+            if not self._elementos:
+                await self._esperar(self._hay_elementos, lambda: self._elementos, timeout, "La estructura sigue vacía")
+            x = self._sacar()
+            self._hay_sitio.notify()
+            return x
+
+    async def pop_many(self, k, timeout=None):
+        """
+        Saca hasta k elementos; espera solo hasta que haya al menos uno.
+
+        Args:
+            k (int): Número máximo de elementos a sacar
+            timeout (float): Segundos máximos de espera
+
+        Returns:
+            list: Entre 1 y k elementos, en el orden en que salen
+
+        Raises:
+            TimeoutError: Si sigue vacía al acabar el tiempo
+        """
+        async with self._hay_elementos:
+            if not self._elementos:
+                await self._esperar(self._hay_elementos, lambda: self._elementos, timeout, "La estructura sigue vacía")
+            sacados = self._sacar_varios(k)
+            self._hay_sitio.notify(len(sacados))
+            return sacados
+
+
+class AsyncQueue(_Asincrono):
+    """
+    Cola FIFO para tareas de asyncio con tamaño acotado: await push() espera
+    si está llena y await pop() si está vacía.
+
+    Ejemplo:
+        cola = AsyncQueue(capacidad=100)
+        await cola.push(tarea)
+        tarea = await cola.pop(timeout=1.0)
+    """
+
+
+class AsyncStack(_Asincrono):
+    """
+    Pila LIFO para tareas de asyncio, con la misma interfaz que AsyncQueue.
+    """
+
+    _LIFO = True
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+
+def instantanea(matriz):
+    """
+    Copia inmutable de los valores de una matriz, usada para detectar cambios.
+
+    Args:
+        matriz (list): Matriz (lista de listas, DenseMatrix o MatrixView)
+
+    Returns:
+        tuple: Tupla de tuplas con los valores de la matriz
+    """
+    return tuple(tuple(fila) for fila in matriz)
+
+
+class MatrixCache:
+    """
+    Caché LRU de resultados asociados a una matriz concreta.
+
+    Las listas no son hashables, así que cada entrada se identifica por la
+    identidad de la matriz (id) y una clave opcional. La entrada guarda una
+    referencia a la matriz (para que su id no se reutilice) y una instantánea
+    de sus valores: si la matriz se modifica, la entrada deja de ser válida.
+    Validar la instantánea cuesta O(filas * columnas), mucho menos que
+    recalcular resultados como una descomposición LU.
+    """
+
+    def __init__(self, capacidad=32):
+        """
+        Args:
+            capacidad (int): Número máximo de entradas antes de descartar la menos usada
+        """
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+
+    def obtener(self, matriz, clave=None):
+        """
+        Busca el resultado guardado para la matriz.
+
+        Args:
+            matriz (list): Matriz
+            clave: Clave adicional para distinguir resultados de la misma matriz
+
+        Returns:
+            El resultado guardado, o None si no existe o la matriz cambió
+        """
+        indice = (id(matriz), clave)
+        entrada = self._entradas.get(indice)
+        if entrada is None:
+            return None
+        guardada, valores, resultado = entrada
+        if guardada is not matriz or valores != instantanea(matriz):
+            del self._entradas[indice]
+            return None
+        self._entradas.move_to_end(indice)
+        return resultado
+
+    def guardar(self, matriz, resultado, clave=None):
+        """
+        Guarda un resultado para la matriz, descartando la entrada menos usada
+        si se supera la capacidad.
+
+        Args:
+            matriz (list): Matriz
+            resultado: Valor a guardar
+            clave: Clave adicional para distinguir resultados de la misma matriz
+        """
+        indice = (id(matriz), clave)
+        self._entradas[indice] = (matriz, instantanea(matriz), resultado)
+        self._entradas.move_to_end(indice)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+
+    def limpiar(self):
+        """Elimina todas las entradas."""
+        self._entradas.clear()
+
+    def __len__(self):
+        return len(self._entradas)
@@ -0,0 +1,221 @@
+from array import array
+from itertools import repeat
+from operator import add, mul, sub
+
+# Límites de un entero con signo de 64 bits (código de tipo 'q')
+_MIN_ENTERO = -(2**63)
+_MAX_ENTERO = 2**63 - 1
+
+
+def tipo_para(valores):
+    """
+    Elige el código de tipo de array adecuado para una secuencia de valores.
+
+    Args:
+        valores (iterable): Valores numéricos
+
+    Returns:
+        str: 'q' si todos son enteros representables en 64 bits, 'd' en otro caso
+
+    Ejemplo:
+        tipo_para([1, 2, 3]) -> 'q'
+        tipo_para([1, 2.5]) -> 'd'
+    """
+    for valor in valores:
+        if not isinstance(valor, int) or not _MIN_ENTERO <= valor <= _MAX_ENTERO:
+            return "d"
+    return "q"
+
+
+class DenseMatrix:
+    """
+    Matriz densa almacenada en un único buffer contiguo array('q') o array('d').
+
+    Guarda los datos, la forma (filas, columnas), los pasos (cuántas posiciones
+    del buffer avanzar por fila y por columna) y un desplazamiento inicial.
+    Gracias a los pasos, la transpuesta comparte el buffer con la original.
+
+    Se puede indexar como una lista de listas: matriz[i] retorna la fila i como
+    un memoryview (sin copiar) y matriz[i][j] el elemento, por lo que todos los
+    métodos de Matrix la aceptan.
+    """
+
+    __slots__ = ("datos", "filas", "columnas", "pasos", "desplazamiento")
+
+    def __init__(self, datos, filas, columnas, pasos=None, desplazamiento=0):
+        """
+        Args:
+            datos (array): Buffer con los elementos, de tipo 'q' o 'd'
+            filas (int): Número de filas
+            columnas (int): Número de columnas
+            pasos (tuple): Pasos (por fila, por columna). Por defecto (columnas, 1)
+            desplazamiento (int): Posición del elemento (0, 0) dentro del buffer
+
+        Raises:
+            ValueError: Si el buffer no tiene el tamaño o el tipo adecuados
+        """
+        if datos.typecode not in ("q", "d"):
+            raise ValueError("El buffer debe ser de tipo 'q' o 'd'")
+        if pasos is None:
+            pasos = (columnas, 1)
+            if len(datos) != filas * columnas:
+                raise ValueError("El tamaño del buffer no coincide con la forma")
+        self.datos = datos
+        self.filas = filas
+        self.columnas = columnas
+        self.pasos = pasos
+        self.desplazamiento = desplazamiento
+
+    @classmethod
+    def desde_lista(cls, matriz, tipo=None):
+        """
+        Construye una DenseMatrix a partir de una lista de listas.
+
+        Args:
+            matriz (list): Matriz (lista de listas)
+            tipo (str): Código de tipo 'q' o 'd'. Si es None se elige según los valores
+
+        Returns:
+            DenseMatrix: Matriz con los mismos valores
+
+        Raises:
+            ValueError: Si las filas tienen longitudes distintas
+
+        Ejemplo:
+            DenseMatrix.desde_lista([[1, 2], [3, 4]]).forma -> (2, 2)
+        """
+        if isinstance(matriz, DenseMatrix):
+            return matriz
+        filas = len(matriz)
+        columnas = len(matriz[0]) if filas else 0
+        for fila in matriz:
+            if len(fila) != columnas:
+                raise ValueError("Las filas deben tener la misma longitud")
+        if tipo is None:
+            tipo = tipo_para(valor for fila in matriz for valor in fila)
+        datos = array(tipo)
+        for fila in matriz:
+            datos.extend(fila)
+        return cls(datos, filas, columnas)
+
+    def a_lista(self):
+        """
+        Convierte la matriz en una lista de listas.
+
+        Returns:
+            list: Matriz (lista de listas)
+        """
+        return [fila.tolist() for fila in self]
+
+    @property
+    def forma(self):
+        """tuple: Dimensiones (filas, columnas)."""
+        return (self.filas, self.columnas)
+
+    @property
+    def tipo(self):
+        """str: Código de tipo del buffer ('q' o 'd')."""
+        return self.datos.typecode
+
+    def es_contigua(self):
+        """
+        Indica si los elementos están en el buffer en orden de filas y sin huecos.
+
+        Returns:
+            bool: True si la matriz ocupa todo el buffer en orden de filas
+        """
+        return (
+            self.desplazamiento == 0
+            and self.pasos == (self.columnas, 1)
+            and len(self.datos) == self.filas * self.columnas
+        )
+
+    def plano(self):
+        """
+        Retorna los elementos en orden de filas como un array.
+        Si la matriz es contigua retorna el propio buffer, sin copiar.
+
+        Returns:
+            array: Elementos en orden de filas
+        """
+        if self.es_contigua():
+            return self.datos
+        datos = array(self.tipo)
+        for fila in self:
+            datos.extend(fila)
+        return datos
+
+    def __len__(self):
+        return self.filas
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.filas
+        if not 0 <= i < self.filas:
+            raise IndexError("Índice de fila fuera de rango")
+        if self.columnas == 0:
+            return memoryview(self.datos)[0:0]
+        paso_fila, paso_columna = self.pasos
+        inicio = self.desplazamiento + i * paso_fila
+        fin = inicio + (self.columnas - 1) * paso_columna + 1
+        return memoryview(self.datos)[inicio:fin:paso_columna]
+
+    def __iter__(self):
+        for i in range(self.filas):
+            yield self[i]
+
+    def __repr__(self):
+        return f"DenseMatrix({self.a_lista()!r})"
+
+    def _operar(self, otra, operacion):
+        if self.forma != otra.forma:
+            raise ValueError("Las matrices tienen dimensiones incompatibles")
+        tipo = "q" if self.tipo == "q" and otra.tipo == "q" else "d"
+        datos = array(tipo, map(operacion, self.plano(), otra.plano()))
+        return DenseMatrix(datos, self.filas, self.columnas)
+
+    def suma(self, otra):
+        """
+        Suma elemento a elemento con otra DenseMatrix de la misma forma.
+
+        Raises:
+            ValueError: Si las formas son distintas
+            OverflowError: Si un resultado entero no cabe en 64 bits
+        """
+        return self._operar(otra, add)
+
+    def resta(self, otra):
+        """
+        Resta elemento a elemento otra DenseMatrix de la misma forma.
+
+        Raises:
+            ValueError: Si las formas son distintas
+            OverflowError: Si un resultado entero no cabe en 64 bits
+        """
+        return self._operar(otra, sub)
+
+    def escalar(self, escalar):
+        """
+        Multiplica cada elemento por un escalar.
+        El resultado es entero solo si la matriz y el escalar son enteros.
+
+        Raises:
+            OverflowError: Si un resultado entero no cabe en 64 bits
+        """
+        tipo = "q" if self.tipo == "q" and isinstance(escalar, int) else "d"
+        datos = array(tipo, map(mul, self.plano(), repeat(escalar)))
+        return DenseMatrix(datos, self.filas, self.columnas)
+
+    def transpuesta(self):
+        """
+        Retorna la transpuesta intercambiando forma y pasos.
+        Comparte el buffer con la matriz original (no copia datos).
+        """
+        paso_fila, paso_columna = self.pasos
+        return DenseMatrix(
+            self.datos,
+            self.columnas,
+            self.filas,
+            pasos=(paso_columna, paso_fila),
+            desplazamiento=self.desplazamiento,
+        )
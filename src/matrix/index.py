@@ -0,0 +1,102 @@
+from array import array
+from bisect import bisect_left
+
+
+class ValueIndex:
+    """
+    Índice invertido de una matriz: para cada valor guarda las posiciones donde
+    aparece, como un array('q') ordenado de posiciones planas (fila * columnas + columna).
+
+    Construirlo cuesta un recorrido de la matriz; después cada búsqueda cuesta
+    O(k) en el número de apariciones del valor.
+
+    El índice no detecta por sí solo los cambios hechos directamente sobre la
+    matriz: los cambios se hacen con actualizar(), que mantiene el índice al día,
+    o se avisa con invalidar() para que se reconstruya en la siguiente búsqueda.
+    """
+
+    def __init__(self, matriz):
+        """
+        Args:
+            matriz (list): Matriz (lista de listas o DenseMatrix)
+        """
+        self.matriz = matriz
+        self._posiciones = None
+        self._columnas = 0
+
+    def _construir(self):
+        matriz = self.matriz
+        self._columnas = len(matriz[0]) if matriz else 0
+        posiciones = {}
+        plana = 0
+        for fila in matriz:
+            for valor in fila:
+                lista = posiciones.get(valor)
+                if lista is None:
+                    posiciones[valor] = array("q", [plana])
+                else:
+                    lista.append(plana)
+                plana += 1
+        self._posiciones = posiciones
+
+    def _indice(self):
+        if self._posiciones is None:
+            self._construir()
+        return self._posiciones
+
+    def invalidar(self):
+        """Marca el índice como desactualizado; se reconstruye en la siguiente búsqueda."""
+        self._posiciones = None
+
+    def buscar(self, valor):
+        """
+        Retorna todas las posiciones del valor en orden de filas.
+
+        Args:
+            valor: Valor a buscar
+
+        Returns:
+            list: Lista de tuplas (fila, columna). Lista vacía si no aparece.
+        """
+        posiciones = self._indice().get(valor)
+        if posiciones is None:
+            return []
+        columnas = self._columnas
+        return [divmod(plana, columnas) for plana in posiciones]
+
+    def conteo(self, valor):
+        """
+        Número de apariciones del valor en O(1).
+
+        Returns:
+            int: Cantidad de celdas con ese valor
+        """
+        posiciones = self._indice().get(valor)
+        return len(posiciones) if posiciones is not None else 0
+
+    def __contains__(self, valor):
+        return valor in self._indice()
+
+    def actualizar(self, fila, columna, valor):
+        """
+        Asigna matriz[fila][columna] = valor y actualiza el índice en O(k),
+        sin recorrer toda la matriz.
+
+        Args:
+            fila (int): Fila de la celda
+            columna (int): Columna de la celda
+            valor: Nuevo valor
+        """
+        indice = self._indice()
+        anterior = self.matriz[fila][columna]
+        self.matriz[fila][columna] = valor
+        plana = fila * self._columnas + columna
+        posiciones = indice[anterior]
+        del posiciones[bisect_left(posiciones, plana)]
+        if not posiciones:
+            del indice[anterior]
+        posiciones = indice.get(valor)
+        if posiciones is None:
+            indice[valor] = array("q", [plana])
+        else:
+            posiciones.insert(bisect_left(posiciones, plana), plana)
@@ -0,0 +1,152 @@
+import sys
+from fractions import Fraction
+
+
+class LUDecomposition:
+    """
+    Descomposición LU con pivoteo parcial de una matriz cuadrada: P·A = L·U.
+
+    L (triangular inferior con unos en la diagonal) y U (triangular superior)
+    se guardan juntas en una sola matriz. Calcularla cuesta O(n^3); después,
+    el determinante cuesta O(n) y resolver un sistema O(n^2) por cada lado derecho.
+
+    Con exacto=True los cálculos se hacen con fractions.Fraction, de modo que
+    para entradas enteras los resultados son exactos. En coma flotante un
+    pivote cuenta como cero si su valor absoluto no supera
+    n * épsilon * (mayor valor absoluto de la matriz), ya que el redondeo deja
+    restos del orden de 1e-16 donde el valor exacto sería 0.
+    """
+
+    def __init__(self, matriz, exacto=False):
+        """
+        Args:
+            matriz (list): Matriz cuadrada (lista de listas)
+            exacto (bool): Si se usa aritmética exacta con Fraction
+
+        Raises:
+            ValueError: Si la matriz está vacía o no es cuadrada
+        """
+        n = len(matriz)
+        if n == 0:
+            raise ValueError("La matriz no puede estar vacía")
+        if any(len(fila) != n for fila in matriz):
+            raise ValueError("La matriz no es cuadrada")
+        convertir = Fraction if exacto else float
+        lu = [[convertir(valor) for valor in fila] for fila in matriz]
+        if exacto:
+            tolerancia = 0
+        else:
+            tolerancia = n * sys.float_info.epsilon * max(abs(valor) for fila in lu for valor in fila)
+        permutacion = list(range(n))
+        signo = 1
+        singular = False
+        for k in range(n):
+            if exacto:
+                p = next((i for i in range(k, n) if lu[i][k] != 0), k)
+            else:
+                p = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if abs(lu[p][k]) <= tolerancia:
+                # Columna sin pivote: U tendrá un cero (o un resto de redondeo) en la diagonal
+                singular = True
+                continue
+            if p != k:
+                lu[k], lu[p] = lu[p], lu[k]
+                permutacion[k], permutacion[p] = permutacion[p], permutacion[k]
+                signo = -signo
+            fila_k = lu[k]
+            pivote = fila_k[k]
+            resto_k = fila_k[k + 1:]
+            for i in range(k + 1, n):
+                fila_i = lu[i]
+                factor = fila_i[k] / pivote
+                fila_i[k] = factor
+                if factor:
+                    fila_i[k + 1:] = [x - factor * y for x, y in zip(fila_i[k + 1:], resto_k)]
+        self.n = n
+        self.exacto = exacto
+        self.lu = lu
+        self.permutacion = permutacion
+        self.signo = signo
+        self.singular = singular
+
+    @property
+    def L(self):
+        """list: Matriz triangular inferior con unos en la diagonal."""
+        n = self.n
+        return [
+            [self.lu[i][j] if j < i else (1 if i == j else 0) for j in range(n)]
+            for i in range(n)
+        ]
+
+    @property
+    def U(self):
+        """list: Matriz triangular superior."""
+        n = self.n
+        return [[self.lu[i][j] if j >= i else 0 for j in range(n)] for i in range(n)]
+
+    def determinante(self):
+        """
+        Calcula el determinante como el producto de la diagonal de U por el
+        signo de la permutación.
+
+        Returns:
+            number: El determinante (Fraction en modo exacto); 0 si la matriz es singular
+        """
+        if self.singular:
+            return Fraction(0) if self.exacto else 0.0
+        resultado = Fraction(self.signo) if self.exacto else float(self.signo)
+        for i in range(self.n):
+            resultado *= self.lu[i][i]
+        return resultado
+
+    def _resolver_vector(self, b):
+        n = self.n
+        lu = self.lu
+        convertir = Fraction if self.exacto else float
+        # Sustitución hacia adelante: L·y = P·b
+        y = [convertir(b[i]) for i in self.permutacion]
+        for i in range(1, n):
+            fila = lu[i]
+            y[i] -= sum(fila[j] * y[j] for j in range(i))
+        # Sustitución hacia atrás: U·x = y
+        x = y
+        for i in range(n - 1, -1, -1):
+            fila = lu[i]
+            x[i] = (x[i] - sum(fila[j] * x[j] for j in range(i + 1, n))) / fila[i]
+        return x
+
+    def resolver(self, b):
+        """
+        Resuelve A·x = b reutilizando la descomposición.
+
+        Args:
+            b (list): Vector de n valores, o matriz n x k con un lado derecho por
+                      columna (lista de listas, DenseMatrix o MatrixView)
+
+        Returns:
+            list: Vector solución, o matriz n x k con una solución por columna
+
+        Raises:
+            ValueError: Si la matriz es singular o b tiene dimensiones incompatibles
+        """
+        if self.singular:
+            raise ValueError("La matriz es singular")
+        if len(b) != self.n:
+            raise ValueError("Las dimensiones son incompatibles")
+        if self.n and not hasattr(b[0], "__len__"):
+            return self._resolver_vector(b)
+        soluciones = [self._resolver_vector(columna) for columna in zip(*b)]
+        return [list(fila) for fila in zip(*soluciones)]
+
+    def inversa(self):
+        """
+        Calcula la inversa resolviendo A·X = I.
+
+        Returns:
+            list: Matriz inversa
+
+        Raises:
+            ValueError: Si la matriz es singular
+        """
+        identidad = [[1 if i == j else 0 for j in range(self.n)] for i in range(self.n)]
+        return self.resolver(identidad)
@@ -1,9 +1,122 @@
+from operator import add, mul, sub
+
+from src.matrix.cache import MatrixCache
+from src.matrix.dense import DenseMatrix
+from src.matrix.index import ValueIndex
+from src.matrix.lu import LUDecomposition
+from src.matrix.sparse import COOMatrix, CSRMatrix
+from src.matrix.views import MatrixView
+
+# Tamaño por debajo del cual Strassen usa el producto clásico
+_CORTE_STRASSEN = 64
+
+
+def _sumar(X, Y):
+    return [list(map(add, x, y)) for x, y in zip(X, Y)]
+
+
+def _restar(X, Y):
+    return [list(map(sub, x, y)) for x, y in zip(X, Y)]
+
+
+def _strassen(A, B, corte):
+    """
+    Multiplica dos matrices cuadradas n x n con la variante de Winograd del
+    algoritmo de Strassen: 7 productos recursivos y 15 sumas/restas por nivel.
+    Si n es impar se añade una fila y una columna de ceros; por debajo del corte
+    se usa el producto clásico.
+    """
+    n = len(A)
+    if n <= corte:
+        return _producto_filas(A, [list(columna) for columna in zip(*B)])
+    if n % 2:
+        A = [fila + [0] for fila in A] + [[0] * (n + 1)]
+        B = [fila + [0] for fila in B] + [[0] * (n + 1)]
+        return [fila[:n] for fila in _strassen(A, B, corte)[:n]]
+    h = n // 2
+    A11 = [fila[:h] for fila in A[:h]]
+    A12 = [fila[h:] for fila in A[:h]]
+    A21 = [fila[:h] for fila in A[h:]]
+    A22 = [fila[h:] for fila in A[h:]]
+    B11 = [fila[:h] for fila in B[:h]]
+    B12 = [fila[h:] for fila in B[:h]]
+    B21 = [fila[:h] for fila in B[h:]]
+    B22 = [fila[h:] for fila in B[h:]]
+    S1 = _sumar(A21, A22)
+    S2 = _restar(S1, A11)
+    S3 = _restar(A11, A21)
+    S4 = _restar(A12, S2)
+    T1 = _restar(B12, B11)
+    T2 = _restar(B22, T1)
+    T3 = _restar(B22, B12)
+    T4 = _restar(T2, B21)
+    M1 = _strassen(A11, B11, corte)
+    M2 = _strassen(A12, B21, corte)
+    M3 = _strassen(S4, B22, corte)
+    M4 = _strassen(A22, T4, corte)
+    M5 = _strassen(S1, T1, corte)
+    M6 = _strassen(S2, T2, corte)
+    M7 = _strassen(S3, T3, corte)
+    U2 = _sumar(M1, M6)
+    U3 = _sumar(U2, M7)
+    C11 = _sumar(M1, M2)
+    C12 = _sumar(_sumar(U2, M5), M3)
+    C21 = _restar(U3, M4)
+    C22 = _sumar(U3, M5)
+    return [x + y for x, y in zip(C11, C12)] + [x + y for x, y in zip(C21, C22)]
+
+
+def _es_dispersa(matriz):
+    return isinstance(matriz, (CSRMatrix, COOMatrix))
+
+
+def _densa(matriz):
+    """Convierte una matriz dispersa a lista de listas; el resto se retorna igual."""
+    if _es_dispersa(matriz):
+        return matriz.a_lista()
+    return matriz
+
+
+def _a_densa(resultado, tipo=None):
+    """
+    Guarda un resultado calculado con listas en una DenseMatrix. Si todos los
+    valores son enteros se usa 'q', así que un entero que no cabe en 64 bits
+    lanza OverflowError en lugar de pasar en silencio a coma flotante.
+    """
+    if tipo is None:
+        tipo = "q" if all(isinstance(valor, int) for fila in resultado for valor in fila) else "d"
+    return DenseMatrix.desde_lista(resultado, tipo)
+
+
+def _producto_filas(A, Bt):
+    """
+    Multiplica A por B recibiendo B ya transpuesta (Bt).
+    Cada elemento es el producto punto de una fila de A con una fila de Bt.
+    """
+    return [[sum(map(mul, fila, columna)) for columna in Bt] for fila in A]
+
+
 class Matrix:
     """
     Clase con métodos para operaciones sobre matrices.
     Incluye operaciones aritméticas, propiedades y transformaciones matriciales.
+
+    Todos los métodos aceptan listas de listas, DenseMatrix o MatrixView. Las
+    operaciones que reciben una DenseMatrix y retornan una matriz (suma, resta,
+    multiplicación, potencia, producto por escalar, transpuesta y rotar_90)
+    retornan una DenseMatrix; si un resultado entero no cabe en 64 bits lanzan
+    OverflowError. inversa y resolver retornan listas, porque en modo exacto
+    sus valores son Fraction.
+
+    Las operaciones aritméticas, la transpuesta, la traza, la diagonal y la
+    búsqueda también aceptan matrices dispersas (CSRMatrix o COOMatrix) y las
+    resuelven en tiempo proporcional al número de elementos distintos de cero.
     """
 
+    def __init__(self):
+        # Resultados costosos (como la descomposición LU) de las últimas matrices usadas
+        self._cache = MatrixCache()
+
     def suma_matrices(self, A, B):
         """
         Suma dos matrices elemento a elemento.
@@ -21,10 +134,15 @@ class Matrix:
         Ejemplo:
             suma_matrices([[1, 2], [3, 4]], [[5, 6], [7, 8]]) -> [[6, 8], [10, 12]]
         """
+        if _es_dispersa(A) and _es_dispersa(B):
+            return CSRMatrix.desde_lista(A).suma(CSRMatrix.desde_lista(B))
+        A, B = _densa(A), _densa(B)
         if not A or not B:
             raise ValueError("Las matrices no pueden estar vacías")
         if len(A) != len(B) or len(A[0]) != len(B[0]):
             raise ValueError("Las matrices tienen dimensiones incompatibles")
+        if isinstance(A, DenseMatrix) or isinstance(B, DenseMatrix):
+            return DenseMatrix.desde_lista(A).suma(DenseMatrix.desde_lista(B))
         resultado = []
         for i in range(len(A)):
             fila = []
@@ -50,10 +168,15 @@ class Matrix:
         Ejemplo:
             resta_matrices([[5, 6], [7, 8]], [[1, 2], [3, 4]]) -> [[4, 4], [4, 4]]
         """
+        if _es_dispersa(A) and _es_dispersa(B):
+            return CSRMatrix.desde_lista(A).resta(CSRMatrix.desde_lista(B))
+        A, B = _densa(A), _densa(B)
         if not A or not B:
             raise ValueError("Las matrices no pueden estar vacías")
         if len(A) != len(B) or len(A[0]) != len(B[0]):
             raise ValueError("Las matrices tienen dimensiones incompatibles")
+        if isinstance(A, DenseMatrix) or isinstance(B, DenseMatrix):
+            return DenseMatrix.desde_lista(A).resta(DenseMatrix.desde_lista(B))
         resultado = []
         for i in range(len(A)):
             fila = []
@@ -76,23 +199,136 @@ class Matrix:
 
         Raises:
             ValueError: Si las dimensiones son incompatibles para multiplicación
+            OverflowError: Si A o B es una DenseMatrix y un resultado entero no
+                           cabe en 64 bits
 
         Ejemplo:
             multiplicar_matrices([[1, 2], [3, 4]], [[5, 6], [7, 8]]) -> [[19, 22], [43, 50]]
+
+        Nota:
+            B se transpone una sola vez y cada elemento se calcula como el
+            producto punto de una fila de A con una fila de B transpuesta,
+            con sum(map(mul, ...)) para que el bucle interno corra en C.
+            Con enteros el resultado es exacto.
         """
+        if _es_dispersa(A):
+            if _es_dispersa(B):
+                return CSRMatrix.desde_lista(A).multiplicar(CSRMatrix.desde_lista(B))
+            return CSRMatrix.desde_lista(A).multiplicar_densa(_densa(B))
+        B = _densa(B)
         if not A or not B:
             raise ValueError("Las matrices no pueden estar vacías")
         if len(A[0]) != len(B):
             raise ValueError("Las dimensiones son incompatibles para multiplicación")
-        resultado = []
-        for i in range(len(A)):
-            fila = []
-            for j in range(len(B[0])):
-                suma = 0
-                for k in range(len(A[0])):
-                    suma += A[i][k] * B[k][j]
-                fila.append(suma)
-            resultado.append(fila)
+        densa = isinstance(A, DenseMatrix) or isinstance(B, DenseMatrix)
+        if isinstance(A, DenseMatrix):
+            A = A.a_lista()
+        elif isinstance(A, MatrixView):
+            A = A.materializar()
+        # Se transpone B una sola vez para recorrer fila contra fila
+        if isinstance(B, DenseMatrix):
+            Bt = B.transpuesta().a_lista()
+        elif isinstance(B, MatrixView):
+            # Si B es la vista transpuesta de otra matriz, sus filas se leen sin reordenar
+            Bt = B.transponer().materializar()
+        else:
+            Bt = [list(columna) for columna in zip(*B)]
+        resultado = _producto_filas(A, Bt)
+        if densa:
+            return _a_densa(resultado)
+        return resultado
+
+    def multiplicar_strassen(self, A, B, corte=None):
+        """
+        Multiplica dos matrices cuadradas con el algoritmo de Strassen (variante
+        de Winograd), que hace 7 productos recursivos en lugar de 8 y cuesta
+        O(n^2.81). Las submatrices de tamaño impar se completan con ceros y por
+        debajo del corte se usa el producto clásico.
+
+        Con enteros el resultado es exacto. Con decimales el resultado puede
+        diferir en los últimos dígitos del de multiplicar_matrices, porque las
+        sumas se hacen en otro orden.
+
+        Args:
+            A (list): Primera matriz cuadrada n x n
+            B (list): Segunda matriz cuadrada n x n
+            corte (int): Tamaño por debajo del cual se usa el producto clásico
+
+        Returns:
+            list: Matriz resultante n x n. Si las matrices no son cuadradas del
+                  mismo tamaño se usa multiplicar_matrices.
+
+        Raises:
+            ValueError: Si las dimensiones son incompatibles para multiplicación
+
+        Ejemplo:
+            multiplicar_strassen([[1, 2], [3, 4]], [[5, 6], [7, 8]], corte=1) -> [[19, 22], [43, 50]]
+        """
+        if (
+            not isinstance(A, list)
+            or not isinstance(B, list)
+            or not self.es_cuadrada(A)
+            or not self.es_cuadrada(B)
+            or len(A) != len(B)
+        ):
+            return self.multiplicar_matrices(A, B)
+        if corte is None:
+            corte = _CORTE_STRASSEN
+        return _strassen(A, B, max(1, corte))
+
+    def potencia(self, matriz, k, cache=False):
+        """
+        Eleva una matriz cuadrada a la potencia k por exponenciación binaria:
+        se multiplican solo los cuadrados A, A^2, A^4, ... que corresponden a
+        los bits de k, con O(log k) multiplicaciones en lugar de k - 1.
+
+        Con cache=True los cuadrados calculados se guardan asociados a la matriz
+        (en la caché LRU de la instancia), así que calcular A^k para muchos k
+        sobre la misma matriz reutiliza los cuadrados ya obtenidos. Si la matriz
+        cambia, los cuadrados guardados se descartan.
+
+        Args:
+            matriz (list): Matriz cuadrada (lista de listas)
+            k (int): Exponente entero no negativo
+            cache (bool): Si se guardan y reutilizan los cuadrados de la matriz
+
+        Returns:
+            list: Matriz elevada a la potencia k (identidad si k es 0). Si la
+                  matriz es una DenseMatrix, una DenseMatrix
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada o k es negativo
+            OverflowError: Si la matriz es una DenseMatrix y un resultado
+                           entero no cabe en 64 bits
+
+        Ejemplo:
+            potencia([[1, 1], [1, 0]], 10) -> [[89, 55], [55, 34]]
+        """
+        if not self.es_cuadrada(matriz):
+            raise ValueError("La matriz no es cuadrada")
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("El exponente debe ser un entero no negativo")
+        cuadrados = self._cache.obtener(matriz, "potencias") if cache else None
+        if cuadrados is None:
+            cuadrados = [[list(fila) for fila in matriz]]
+            if cache:
+                self._cache.guardar(matriz, cuadrados, "potencias")
+        resultado = None
+        bit = 0
+        while k:
+            if bit == len(cuadrados):
+                cuadrados.append(self.multiplicar_matrices(cuadrados[-1], cuadrados[-1]))
+            if k & 1:
+                if resultado is None:
+                    resultado = [list(fila) for fila in cuadrados[bit]]
+                else:
+                    resultado = self.multiplicar_matrices(resultado, cuadrados[bit])
+            k >>= 1
+            bit += 1
+        if resultado is None:
+            resultado = self.identidad(len(matriz))
+        if isinstance(matriz, DenseMatrix):
+            return _a_densa(resultado)
         return resultado
 
     def multiplicar_escalar(self, matriz, escalar):
@@ -109,6 +345,10 @@ class Matrix:
         Ejemplo:
             multiplicar_escalar([[1, 2], [3, 4]], 3) -> [[3, 6], [9, 12]]
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).escalar(escalar)
+        if isinstance(matriz, DenseMatrix):
+            return matriz.escalar(escalar)
         resultado = []
         for i in range(len(matriz)):
             fila = []
@@ -130,6 +370,10 @@ class Matrix:
         Ejemplo:
             transpuesta([[1, 2, 3], [4, 5, 6]]) -> [[1, 4], [2, 5], [3, 6]]
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).transpuesta()
+        if isinstance(matriz, DenseMatrix):
+            return matriz.transpuesta()
         if not matriz:
             return []
         resultado = []
@@ -154,6 +398,8 @@ class Matrix:
             es_cuadrada([[1, 2], [3, 4]]) -> True
             es_cuadrada([[1, 2, 3], [4, 5, 6]]) -> False
         """
+        if _es_dispersa(matriz):
+            return matriz.filas > 0 and matriz.filas == matriz.columnas
         if not matriz:
             return False
         return len(matriz) == len(matriz[0])
@@ -173,10 +419,13 @@ class Matrix:
             es_simetrica([[1, 2, 3], [2, 5, 6], [3, 6, 9]]) -> True
             es_simetrica([[1, 2], [3, 4]]) -> False
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).es_simetrica()
         if not matriz or not self.es_cuadrada(matriz):
             return False
+        # Basta con el triángulo superior: cada par (i, j), (j, i) se compara una vez
         for i in range(len(matriz)):
-            for j in range(len(matriz)):
+            for j in range(i + 1, len(matriz)):
                 if matriz[i][j] != matriz[j][i]:
                     return False
         return True
@@ -198,6 +447,8 @@ class Matrix:
             traza([[1, 2], [3, 4]]) -> 5
             traza([[1, 0, 0], [0, 5, 0], [0, 0, 9]]) -> 15
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).traza()
         if not self.es_cuadrada(matriz):
             raise ValueError("La matriz no es cuadrada")
         suma = 0
@@ -257,6 +508,91 @@ class Matrix:
         i = matriz[2][2]
         return a * e * i + b * f * g + c * d * h - c * e * g - b * d * i - a * f * h
 
+    def descomposicion_lu(self, matriz, exacto=False):
+        """
+        Calcula la descomposición LU con pivoteo parcial de una matriz cuadrada.
+        El resultado se guarda en caché: mientras la matriz no cambie, las
+        siguientes llamadas con la misma matriz lo reutilizan.
+
+        Args:
+            matriz (list): Matriz cuadrada (lista de listas)
+            exacto (bool): Si se usa aritmética exacta con fractions.Fraction
+
+        Returns:
+            LUDecomposition: Descomposición con L, U, determinante, resolver e inversa
+
+        Raises:
+            ValueError: Si la matriz está vacía o no es cuadrada
+        """
+        clave = ("lu", exacto)
+        lu = self._cache.obtener(matriz, clave)
+        if lu is None:
+            lu = LUDecomposition(matriz, exacto)
+            self._cache.guardar(matriz, lu, clave)
+        return lu
+
+    def determinante(self, matriz, exacto=False):
+        """
+        Calcula el determinante de una matriz cuadrada de cualquier tamaño en O(n^3)
+        usando la descomposición LU.
+
+        Args:
+            matriz (list): Matriz cuadrada (lista de listas)
+            exacto (bool): Si se usa aritmética exacta con fractions.Fraction
+
+        Returns:
+            number: El determinante (float, o Fraction en modo exacto)
+
+        Raises:
+            ValueError: Si la matriz está vacía o no es cuadrada
+
+        Ejemplo:
+            determinante([[2, -1, 0], [1, 3, -2], [0, 1, 4]], exacto=True) -> Fraction(32, 1)
+        """
+        return self.descomposicion_lu(matriz, exacto).determinante()
+
+    def inversa(self, matriz, exacto=False):
+        """
+        Calcula la inversa de una matriz cuadrada usando la descomposición LU.
+
+        Args:
+            matriz (list): Matriz cuadrada (lista de listas)
+            exacto (bool): Si se usa aritmética exacta con fractions.Fraction
+
+        Returns:
+            list: Matriz inversa
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada o es singular
+
+        Ejemplo:
+            inversa([[4, 7], [2, 6]], exacto=True) -> [[Fraction(3, 5), Fraction(-7, 10)],
+                                                      [Fraction(-1, 5), Fraction(2, 5)]]
+        """
+        return self.descomposicion_lu(matriz, exacto).inversa()
+
+    def resolver(self, A, b, exacto=False):
+        """
+        Resuelve el sistema lineal A·x = b. La descomposición LU de A se calcula
+        una sola vez, así que resolver varios lados derechos cuesta O(n^2) cada uno.
+
+        Args:
+            A (list): Matriz cuadrada de coeficientes
+            b (list): Vector de n valores, o matriz n x k con un lado derecho por
+                      columna (lista de listas, DenseMatrix o MatrixView)
+            exacto (bool): Si se usa aritmética exacta con fractions.Fraction
+
+        Returns:
+            list: Vector solución, o matriz n x k con una solución por columna
+
+        Raises:
+            ValueError: Si A no es cuadrada, es singular o b tiene dimensiones incompatibles
+
+        Ejemplo:
+            resolver([[2, 1], [1, 3]], [3, 5]) -> [0.8, 1.4]
+        """
+        return self.descomposicion_lu(A, exacto).resolver(b)
+
     def identidad(self, n):
         """
         Genera una matriz identidad de tamaño n x n.
@@ -297,6 +633,8 @@ class Matrix:
             diagonal([[1, 2, 3], [4, 5, 6], [7, 8, 9]]) -> [1, 5, 9]
             diagonal([[3, 0], [0, 7]]) -> [3, 7]
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).diagonal()
         if not self.es_cuadrada(matriz):
             raise ValueError("La matriz no es cuadrada")
         return [matriz[i][i] for i in range(len(matriz))]
@@ -316,6 +654,8 @@ class Matrix:
             es_diagonal([[3, 0], [0, 7]]) -> True
             es_diagonal([[1, 2], [0, 4]]) -> False
         """
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).es_diagonal()
         if not self.es_cuadrada(matriz):
             return False
         for i in range(len(matriz)):
@@ -324,6 +664,71 @@ class Matrix:
                     return False
         return True
 
+    def analizar(self, matriz):
+        """
+        Clasifica una matriz en una sola pasada por sus filas y su triángulo superior
+        y retorna todas sus propiedades a la vez. Cada par (i, j), (j, i) se visita
+        una sola vez, y la comparación de pares termina en cuanto ya no queda ninguna
+        propiedad (simétrica o triangular) por confirmar.
+
+        Args:
+            matriz (list): Matriz (lista de listas)
+
+        Returns:
+            dict: Propiedades de la matriz:
+                  es_cuadrada, es_simetrica, es_diagonal, es_identidad,
+                  es_triangular_superior, es_triangular_inferior (bool),
+                  traza (number) y diagonal (list), None si no es cuadrada,
+                  ceros (int) y dispersion (float, proporción de ceros)
+
+        Ejemplo:
+            analizar([[1, 0], [0, 1]])["es_identidad"] -> True
+            analizar([[1, 2], [0, 3]])["es_triangular_superior"] -> True
+        """
+        filas = matriz if isinstance(matriz, list) else [list(fila) for fila in matriz]
+        n = len(filas)
+        m = len(filas[0]) if n else 0
+        cuadrada = n > 0 and n == m
+        simetrica = superior = inferior = identidad = cuadrada
+        diagonal = [] if cuadrada else None
+        traza = 0 if cuadrada else None
+        ceros = 0
+        for i, fila in enumerate(filas):
+            fila = fila if isinstance(fila, list) else list(fila)
+            ceros += fila.count(0)
+            if not cuadrada:
+                continue
+            valor = fila[i]
+            diagonal.append(valor)
+            traza += valor
+            if valor != 1:
+                identidad = False
+            if simetrica or superior or inferior:
+                for j in range(i + 1, n):
+                    a = fila[j]
+                    b = filas[j][i]
+                    if a != b:
+                        simetrica = False
+                    if b != 0:
+                        superior = False
+                    if a != 0:
+                        inferior = False
+                    if not (simetrica or superior or inferior):
+                        break
+        es_diagonal = superior and inferior
+        return {
+            "es_cuadrada": cuadrada,
+            "es_simetrica": simetrica,
+            "es_diagonal": es_diagonal,
+            "es_identidad": identidad and es_diagonal,
+            "es_triangular_superior": superior,
+            "es_triangular_inferior": inferior,
+            "traza": traza,
+            "diagonal": diagonal,
+            "ceros": ceros,
+            "dispersion": ceros / (n * m) if n * m else 0.0,
+        }
+
     def rotar_90(self, matriz):
         """
         Rota una matriz 90 grados en sentido horario.
@@ -332,7 +737,8 @@ class Matrix:
             matriz (list): Matriz (lista de listas)
 
         Returns:
-            list: Matriz rotada 90 grados en sentido horario
+            list: Matriz rotada 90 grados en sentido horario. Si la matriz es
+                  una DenseMatrix, una DenseMatrix del mismo tipo
 
         Ejemplo:
             rotar_90([[1, 2], [3, 4]]) -> [[3, 1], [4, 2]]
@@ -340,15 +746,42 @@ class Matrix:
         """
         if not matriz:
             return []
-        return [list(reversed(fila)) for fila in self.transpuesta(matriz)]
+        rotada = self.vista(matriz).rotar(90).materializar()
+        if isinstance(matriz, DenseMatrix):
+            return _a_densa(rotada, matriz.tipo)
+        return rotada
+
+    def vista(self, matriz):
+        """
+        Crea una vista perezosa de la matriz para transponer, rotar o voltear
+        sin copiar datos. Cada transformación sobre la vista es O(1) y solo
+        se copia al llamar a materializar().
+
+        Args:
+            matriz (list): Matriz (lista de listas o DenseMatrix)
 
-    def buscar_en_matriz(self, matriz, valor):
+        Returns:
+            MatrixView: Vista de la matriz
+
+        Ejemplo:
+            vista([[1, 2], [3, 4]]).transponer().materializar() -> [[1, 3], [2, 4]]
+            vista([[1, 2], [3, 4]]).rotar(270).materializar() -> [[2, 4], [1, 3]]
+        """
+        return MatrixView(matriz)
+
+    def buscar_en_matriz(self, matriz, valor, indice=None):
         """
         Busca un valor en la matriz y retorna todas las posiciones donde se encuentra.
 
         Args:
             matriz (list): Matriz (lista de listas)
             valor: Valor a buscar en la matriz
+            indice (ValueIndex): Índice creado con indice_valores(matriz). Si se
+                                 indica, la búsqueda cuesta O(k) en el número de
+                                 apariciones en lugar de recorrer la matriz
+
+        Raises:
+            ValueError: Si el índice no corresponde a la matriz
 
         Returns:
             list: Lista de tuplas (fila, columna) con las posiciones del valor.
@@ -358,6 +791,12 @@ class Matrix:
             buscar_en_matriz([[1, 2, 3], [4, 2, 6], [7, 8, 2]], 2) -> [(0, 1), (1, 1), (2, 2)]
             buscar_en_matriz([[1, 2], [3, 4]], 9) -> []
         """
+        if indice is not None:
+            if indice.matriz is not matriz:
+                raise ValueError("El índice no corresponde a la matriz")
+            return indice.buscar(valor)
+        if _es_dispersa(matriz):
+            return CSRMatrix.desde_lista(matriz).buscar(valor)
         if not matriz:
             return []
         posiciones = []
@@ -366,3 +805,21 @@ class Matrix:
                 if matriz[i][j] == valor:
                     posiciones.append((i, j))
         return posiciones
+
+    def indice_valores(self, matriz):
+        """
+        Crea un índice invertido valor -> posiciones para hacer muchas búsquedas
+        sobre la misma matriz con buscar_en_matriz(matriz, valor, indice).
+        Los cambios en la matriz se hacen con indice.actualizar(fila, columna, valor),
+        o se avisa con indice.invalidar() si la matriz se modificó directamente.
+
+        Args:
+            matriz (list): Matriz (lista de listas o DenseMatrix)
+
+        Returns:
+            ValueIndex: Índice de la matriz
+
+        Ejemplo:
+            indice_valores([[1, 2], [2, 1]]).buscar(2) -> [(0, 1), (1, 0)]
+        """
+        return ValueIndex(matriz)
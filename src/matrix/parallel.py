@@ -0,0 +1,298 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from multiprocessing.shared_memory import SharedMemory
+from operator import add, mul, sub
+
+from src.matrix.dense import DenseMatrix
+from src.matrix.matrix import Matrix
+
+_MIN_ENTERO = -(2**63)
+_MAX_ENTERO = 2**63 - 1
+_OPERACIONES = {"suma": add, "resta": sub}
+
+
+def _adjuntar(nombre, tipo):
+    memoria = SharedMemory(name=nombre)
+    return memoria, memoria.buf.cast(tipo)
+
+
+def _trabajo_producto(nombre_a, nombre_bt, nombre_c, tipo, n, p, inicio, fin):
+    """Calcula las filas inicio:fin de A·B leyendo A y B transpuesta de memoria compartida."""
+    memorias = []
+    vistas = []
+    try:
+        for nombre in (nombre_a, nombre_bt, nombre_c):
+            memoria, vista = _adjuntar(nombre, tipo)
+            memorias.append(memoria)
+            vistas.append(vista)
+        a, bt, c = vistas
+        columnas = [bt[j * n:(j + 1) * n].tolist() for j in range(p)]
+        for i in range(inicio, fin):
+            fila = a[i * n:(i + 1) * n].tolist()
+            c[i * p:(i + 1) * p] = array(tipo, [sum(map(mul, fila, columna)) for columna in columnas])
+    finally:
+        for vista in vistas:
+            vista.release()
+        for memoria in memorias:
+            memoria.close()
+
+
+def _trabajo_elementos(operacion, nombre_a, nombre_b, nombre_c, tipo, escalar, inicio, fin):
+    """Calcula las posiciones planas inicio:fin de una operación elemento a elemento."""
+    nombres = [nombre_a, nombre_c] if nombre_b is None else [nombre_a, nombre_b, nombre_c]
+    memorias = []
+    vistas = []
+    try:
+        for nombre in nombres:
+            memoria, vista = _adjuntar(nombre, tipo)
+            memorias.append(memoria)
+            vistas.append(vista)
+        a, c = vistas[0], vistas[-1]
+        if operacion == "escalar":
+            valores = map(mul, a[inicio:fin].tolist(), repeat(escalar))
+        else:
+            valores = map(_OPERACIONES[operacion], a[inicio:fin].tolist(), vistas[1][inicio:fin].tolist())
+        c[inicio:fin] = array(tipo, valores)
+    finally:
+        for vista in vistas:
+            vista.release()
+        for memoria in memorias:
+            memoria.close()
+
+
+def _plano(matriz):
+    if isinstance(matriz, DenseMatrix):
+        return matriz.plano()
+    return list(chain.from_iterable(matriz))
+
+
+def _tipo_comun(*planos):
+    """
+    Código de tipo para calcular con todos los valores: 'q' si son enteros de
+    64 bits, 'd' si además hay decimales, y None si hay enteros más grandes u
+    otros tipos (Fraction, Decimal...), que se perderían al pasar a 'd'.
+    """
+    tipo = "q"
+    for plano in planos:
+        for valor in plano:
+            if isinstance(valor, float):
+                tipo = "d"
+            elif not isinstance(valor, int) or not _MIN_ENTERO <= valor <= _MAX_ENTERO:
+                return None
+    return tipo
+
+
+def _con_tipo(datos, tipo):
+    """El array datos con el código de tipo dado, copiándolo solo si hace falta."""
+    return datos if datos.typecode == tipo else array(tipo, datos)
+
+
+def _maximo_absoluto(valores):
+    return max(map(abs, valores), default=0)
+
+
+class ParallelMatrix(Matrix):
+    """
+    Versión de Matrix que reparte multiplicar_matrices, suma_matrices,
+    resta_matrices y multiplicar_escalar en bloques de filas sobre un
+    ProcessPoolExecutor.
+
+    Las matrices se copian una vez a multiprocessing.shared_memory como
+    buffers 'q' (enteros de 64 bits) o 'd' (decimales), y cada proceso lee de
+    ahí su bloque y escribe su parte del resultado en otro buffer compartido,
+    sin pasar las matrices por pickle.
+
+    suma_matrices, resta_matrices y multiplicar_escalar solo se reparten con
+    entradas DenseMatrix, cuyo buffer se copia tal cual. Con listas de listas
+    aplanarlas, revisar los valores y reconstruir las filas cuesta más que
+    la propia operación secuencial, así que se calculan con Matrix. Como en
+    DenseMatrix, un resultado entero que no cabe en 64 bits lanza OverflowError.
+
+    Por debajo de un umbral de trabajo, con entradas que no son listas de listas
+    ni DenseMatrix, con valores que no son int o float (Fraction, Decimal...),
+    con enteros que no caben en 64 bits, o si un resultado entero podría no
+    caber en 64 bits, se usa la versión secuencial de Matrix. Con enteros el
+    resultado es exacto; si se mezclan enteros y decimales el cálculo paralelo
+    se hace en coma flotante.
+
+    Ejemplo:
+        with ParallelMatrix(workers=4) as matrix:
+            C = matrix.multiplicar_matrices(A, B)
+    """
+
+    def __init__(self, workers=None, umbral=2_000_000, executor=None):
+        """
+        Args:
+            workers (int): Número de procesos. Por defecto, el número de CPUs
+            umbral (int): Operaciones mínimas (m*n*p para multiplicar, m*n para el
+                          resto con DenseMatrix) a partir de las cuales se usa el pool
+            executor (Executor): Pool ya creado. Si no se indica se crea uno al
+                                 primer uso y se cierra con cerrar()
+        """
+        super().__init__()
+        self.workers = workers or os.cpu_count() or 1
+        self.umbral = umbral
+        self._executor = executor
+        self._executor_propio = executor is None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def cerrar(self):
+        """Cierra el pool de procesos si fue creado por esta instancia."""
+        if self._executor is not None and self._executor_propio:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _bloques(self, total):
+        """Divide range(total) en hasta self.workers bloques contiguos."""
+        partes = min(self.workers, total)
+        tamano, resto = divmod(total, partes)
+        inicio = 0
+        for k in range(partes):
+            fin = inicio + tamano + (1 if k < resto else 0)
+            yield inicio, fin
+            inicio = fin
+
+    @staticmethod
+    def _compartir(datos):
+        memoria = SharedMemory(create=True, size=max(1, len(datos) * datos.itemsize))
+        memoria.buf[:len(datos) * datos.itemsize] = memoryview(datos).cast("B")
+        return memoria
+
+    @staticmethod
+    def _es_paralelizable(*matrices):
+        return all(isinstance(m, (list, DenseMatrix)) for m in matrices)
+
+    def _ejecutar(self, tarea, memorias, tamano_resultado, tipo, argumentos, total=None):
+        """
+        Lanza una tarea por bloque de range(total), espera y retorna el buffer de
+        resultado. Libera toda la memoria compartida al terminar.
+        """
+        resultado = SharedMemory(create=True, size=max(1, tamano_resultado * array(tipo).itemsize))
+        memorias.append(resultado)
+        try:
+            futuros = [
+                self._pool().submit(tarea, *argumentos(resultado.name, inicio, fin))
+                for inicio, fin in self._bloques(tamano_resultado if total is None else total)
+            ]
+            for futuro in futuros:
+                futuro.result()
+            datos = array(tipo)
+            with resultado.buf[:tamano_resultado * datos.itemsize] as crudos:
+                datos.frombytes(crudos)
+            return datos
+        finally:
+            for memoria in memorias:
+                memoria.close()
+                memoria.unlink()
+
+    def _resultado(self, datos, filas, columnas, *entradas):
+        if any(isinstance(m, DenseMatrix) for m in entradas):
+            return DenseMatrix(datos, filas, columnas)
+        return [datos[i * columnas:(i + 1) * columnas].tolist() for i in range(filas)]
+
+    def multiplicar_matrices(self, A, B):
+        """
+        Multiplica A·B repartiendo bloques de filas de A entre los procesos.
+        Mismo contrato que Matrix.multiplicar_matrices.
+        """
+        if (
+            not self._es_paralelizable(A, B)
+            or not A
+            or not B
+            or len(A[0]) != len(B)
+            or len(A) * len(B) * len(B[0]) < self.umbral
+        ):
+            return super().multiplicar_matrices(A, B)
+        m, n, p = len(A), len(B), len(B[0])
+        plano_a = _plano(A)
+        if isinstance(B, DenseMatrix):
+            plano_bt = B.transpuesta().plano()
+        else:
+            plano_bt = list(chain.from_iterable(zip(*B)))
+        tipo = _tipo_comun(plano_a, plano_bt)
+        if tipo is None or tipo == "q" and _maximo_absoluto(plano_a) * _maximo_absoluto(plano_bt) * n > _MAX_ENTERO:
+            return super().multiplicar_matrices(A, B)
+        memorias = [self._compartir(array(tipo, plano_a)), self._compartir(array(tipo, plano_bt))]
+        nombre_a, nombre_bt = memorias[0].name, memorias[1].name
+        datos = self._ejecutar(
+            _trabajo_producto,
+            memorias,
+            m * p,
+            tipo,
+            lambda nombre_c, inicio, fin: (nombre_a, nombre_bt, nombre_c, tipo, n, p, inicio, fin),
+            total=m,
+        )
+        return self._resultado(datos, m, p, A, B)
+
+    def _elemento_a_elemento(self, operacion, A, B):
+        # Un resultado entero que no cabe en 64 bits lanza OverflowError en el
+        # proceso que lo calcula y se propaga, igual que con DenseMatrix.suma
+        tipo = "q" if A.tipo == "q" and B.tipo == "q" else "d"
+        plano_a = A.plano()
+        plano_b = B.plano()
+        memorias = [self._compartir(_con_tipo(plano_a, tipo)), self._compartir(_con_tipo(plano_b, tipo))]
+        nombre_a, nombre_b = memorias[0].name, memorias[1].name
+        datos = self._ejecutar(
+            _trabajo_elementos,
+            memorias,
+            len(plano_a),
+            tipo,
+            lambda nombre_c, inicio, fin: (operacion, nombre_a, nombre_b, nombre_c, tipo, None, inicio, fin),
+        )
+        return DenseMatrix(datos, A.filas, A.columnas)
+
+    def _paralelizar_elementos(self, *matrices):
+        if not all(isinstance(m, DenseMatrix) for m in matrices):
+            return False
+        filas, columnas = matrices[0].forma
+        return all(m.forma == (filas, columnas) for m in matrices) and 0 < filas * columnas >= self.umbral
+
+    def suma_matrices(self, A, B):
+        """
+        Suma A + B repartiendo bloques de filas entre los procesos.
+        Mismo contrato que Matrix.suma_matrices.
+        """
+        if self._paralelizar_elementos(A, B):
+            return self._elemento_a_elemento("suma", A, B)
+        return super().suma_matrices(A, B)
+
+    def resta_matrices(self, A, B):
+        """
+        Resta A - B repartiendo bloques de filas entre los procesos.
+        Mismo contrato que Matrix.resta_matrices.
+        """
+        if self._paralelizar_elementos(A, B):
+            return self._elemento_a_elemento("resta", A, B)
+        return super().resta_matrices(A, B)
+
+    def multiplicar_escalar(self, matriz, escalar):
+        """
+        Multiplica cada elemento por un escalar repartiendo bloques de filas
+        entre los procesos. Mismo contrato que Matrix.multiplicar_escalar.
+        """
+        if not self._paralelizar_elementos(matriz) or not isinstance(escalar, (int, float)):
+            return super().multiplicar_escalar(matriz, escalar)
+        tipo = "q" if matriz.tipo == "q" and isinstance(escalar, int) else "d"
+        plano = matriz.plano()
+        memorias = [self._compartir(_con_tipo(plano, tipo))]
+        nombre_a = memorias[0].name
+        datos = self._ejecutar(
+            _trabajo_elementos,
+            memorias,
+            len(plano),
+            tipo,
+            lambda nombre_c, inicio, fin: ("escalar", nombre_a, None, nombre_c, tipo, escalar, inicio, fin),
+        )
+        return DenseMatrix(datos, matriz.filas, matriz.columnas)
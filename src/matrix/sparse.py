@@ -0,0 +1,419 @@
+from array import array
+from bisect import bisect_left
+
+_MIN_ENTERO = -(2**63)
+_MAX_ENTERO = 2**63 - 1
+
+
+def _valores(valores):
+    """
+    Guarda los valores en un array 'q' (enteros de 64 bits) o 'd' (float)
+    cuando caben sin pérdida. Los enteros más grandes, Fraction, Decimal u
+    otros números se guardan en una lista para no convertirlos a float.
+    """
+    tipo = "q"
+    for valor in valores:
+        if isinstance(valor, float):
+            tipo = "d"
+        elif not isinstance(valor, int) or not _MIN_ENTERO <= valor <= _MAX_ENTERO:
+            return valores
+    return array(tipo, valores)
+
+
+class COOMatrix:
+    """
+    Matriz dispersa en formato de coordenadas (COO): tres arrays paralelos con
+    la fila, la columna y el valor de cada elemento distinto de cero.
+
+    Es el formato cómodo para construir una matriz elemento a elemento; para
+    operar se convierte a CSRMatrix con a_csr().
+    """
+
+    __slots__ = ("filas", "columnas", "indices_fila", "indices_columna", "valores")
+
+    def __init__(self, filas, columnas, indices_fila=(), indices_columna=(), valores=()):
+        """
+        Args:
+            filas (int): Número de filas
+            columnas (int): Número de columnas
+            indices_fila (iterable): Fila de cada elemento
+            indices_columna (iterable): Columna de cada elemento
+            valores (iterable): Valor de cada elemento
+
+        Raises:
+            ValueError: Si los tres iterables tienen longitudes distintas o algún
+                        índice está fuera de rango
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.indices_fila = array("q", indices_fila)
+        self.indices_columna = array("q", indices_columna)
+        valores = list(valores)
+        self.valores = _valores(valores)
+        if not len(self.indices_fila) == len(self.indices_columna) == len(self.valores):
+            raise ValueError("Los índices y los valores deben tener la misma longitud")
+        for i, j in zip(self.indices_fila, self.indices_columna):
+            if not (0 <= i < filas and 0 <= j < columnas):
+                raise ValueError("Índice fuera de rango")
+
+    @classmethod
+    def desde_lista(cls, matriz):
+        """
+        Construye una COOMatrix con los elementos distintos de cero de una lista de listas.
+
+        Args:
+            matriz (list): Matriz (lista de listas)
+
+        Returns:
+            COOMatrix: Matriz dispersa equivalente
+        """
+        filas = len(matriz)
+        columnas = len(matriz[0]) if filas else 0
+        indices_fila, indices_columna, valores = [], [], []
+        for i, fila in enumerate(matriz):
+            for j, valor in enumerate(fila):
+                if valor != 0:
+                    indices_fila.append(i)
+                    indices_columna.append(j)
+                    valores.append(valor)
+        return cls(filas, columnas, indices_fila, indices_columna, valores)
+
+    @property
+    def forma(self):
+        """tuple: Dimensiones (filas, columnas)."""
+        return (self.filas, self.columnas)
+
+    @property
+    def nnz(self):
+        """int: Número de elementos guardados."""
+        return len(self.valores)
+
+    def a_csr(self):
+        """
+        Convierte a CSRMatrix. Los elementos repetidos en la misma posición se suman.
+
+        Returns:
+            CSRMatrix: Matriz dispersa en formato CSR
+        """
+        por_fila = [dict() for _ in range(self.filas)]
+        for i, j, valor in zip(self.indices_fila, self.indices_columna, self.valores):
+            fila = por_fila[i]
+            fila[j] = fila.get(j, 0) + valor
+        return CSRMatrix._desde_filas(self.filas, self.columnas, por_fila)
+
+    def a_lista(self):
+        """
+        Convierte a lista de listas (densa).
+
+        Returns:
+            list: Matriz (lista de listas)
+        """
+        return self.a_csr().a_lista()
+
+
+class CSRMatrix:
+    """
+    Matriz dispersa en formato CSR (Compressed Sparse Row).
+
+    Para cada fila i, sus elementos distintos de cero están en las posiciones
+    punteros[i]:punteros[i + 1] de los arrays columnas_nz (columna, en orden
+    creciente) y valores. Las operaciones recorren solo esos elementos, así que
+    cuestan tiempo proporcional al número de no ceros (nnz) y no a filas * columnas.
+
+    Los métodos de Matrix aceptan CSRMatrix y COOMatrix.
+    """
+
+    __slots__ = ("filas", "columnas", "punteros", "columnas_nz", "valores")
+
+    def __init__(self, filas, columnas, punteros, columnas_nz, valores):
+        """
+        Args:
+            filas (int): Número de filas
+            columnas (int): Número de columnas
+            punteros (array): filas + 1 posiciones de inicio de cada fila
+            columnas_nz (array): Columna de cada elemento guardado
+            valores (array o list): Valor de cada elemento guardado
+
+        Raises:
+            ValueError: Si los arrays no son coherentes con la forma
+        """
+        if len(punteros) != filas + 1 or len(columnas_nz) != len(valores):
+            raise ValueError("Los arrays no son coherentes con la forma")
+        self.filas = filas
+        self.columnas = columnas
+        self.punteros = punteros
+        self.columnas_nz = columnas_nz
+        self.valores = valores
+
+    @classmethod
+    def _desde_filas(cls, filas, columnas, por_fila):
+        """Construye una CSRMatrix desde una lista de dicts {columna: valor} por fila."""
+        punteros = array("q", [0])
+        columnas_nz = array("q")
+        valores = []
+        for fila in por_fila:
+            for j in sorted(fila):
+                valor = fila[j]
+                if valor != 0:
+                    columnas_nz.append(j)
+                    valores.append(valor)
+            punteros.append(len(columnas_nz))
+        return cls(filas, columnas, punteros, columnas_nz, _valores(valores))
+
+    @classmethod
+    def desde_lista(cls, matriz):
+        """
+        Construye una CSRMatrix con los elementos distintos de cero de una lista de listas.
+
+        Args:
+            matriz (list): Matriz (lista de listas)
+
+        Returns:
+            CSRMatrix: Matriz dispersa equivalente
+
+        Ejemplo:
+            CSRMatrix.desde_lista([[0, 2], [3, 0]]).nnz -> 2
+        """
+        if isinstance(matriz, CSRMatrix):
+            return matriz
+        if isinstance(matriz, COOMatrix):
+            return matriz.a_csr()
+        filas = len(matriz)
+        columnas = len(matriz[0]) if filas else 0
+        punteros = array("q", [0])
+        columnas_nz = array("q")
+        valores = []
+        for fila in matriz:
+            for j, valor in enumerate(fila):
+                if valor != 0:
+                    columnas_nz.append(j)
+                    valores.append(valor)
+            punteros.append(len(columnas_nz))
+        return cls(filas, columnas, punteros, columnas_nz, _valores(valores))
+
+    def a_lista(self):
+        """
+        Convierte a lista de listas (densa).
+
+        Returns:
+            list: Matriz (lista de listas)
+        """
+        resultado = []
+        for i in range(self.filas):
+            fila = [0] * self.columnas
+            for k in range(self.punteros[i], self.punteros[i + 1]):
+                fila[self.columnas_nz[k]] = self.valores[k]
+            resultado.append(fila)
+        return resultado
+
+    def a_coo(self):
+        """
+        Convierte a COOMatrix.
+
+        Returns:
+            COOMatrix: Matriz dispersa en formato de coordenadas
+        """
+        indices_fila = array("q")
+        for i in range(self.filas):
+            indices_fila.extend([i] * (self.punteros[i + 1] - self.punteros[i]))
+        return COOMatrix(self.filas, self.columnas, indices_fila, self.columnas_nz, self.valores)
+
+    @property
+    def forma(self):
+        """tuple: Dimensiones (filas, columnas)."""
+        return (self.filas, self.columnas)
+
+    @property
+    def nnz(self):
+        """int: Número de elementos guardados."""
+        return len(self.valores)
+
+    def __len__(self):
+        return self.filas
+
+    def __getitem__(self, i):
+        # Fila densa, para los métodos de Matrix que no tienen versión dispersa
+        if i < 0:
+            i += self.filas
+        if not 0 <= i < self.filas:
+            raise IndexError("Índice de fila fuera de rango")
+        fila = [0] * self.columnas
+        for j, valor in self.fila(i).items():
+            fila[j] = valor
+        return fila
+
+    def fila(self, i):
+        """
+        Retorna los elementos guardados de la fila i.
+
+        Returns:
+            dict: {columna: valor} con los elementos distintos de cero de la fila
+        """
+        inicio, fin = self.punteros[i], self.punteros[i + 1]
+        return dict(zip(self.columnas_nz[inicio:fin], self.valores[inicio:fin]))
+
+    def valor(self, i, j):
+        """
+        Retorna el elemento (i, j) con búsqueda binaria dentro de la fila.
+
+        Returns:
+            number: El elemento, o 0 si no está guardado
+        """
+        inicio, fin = self.punteros[i], self.punteros[i + 1]
+        k = bisect_left(self.columnas_nz, j, inicio, fin)
+        if k < fin and self.columnas_nz[k] == j:
+            return self.valores[k]
+        return 0
+
+    def _combinar(self, otra, signo):
+        if self.forma != otra.forma:
+            raise ValueError("Las matrices tienen dimensiones incompatibles")
+        por_fila = []
+        for i in range(self.filas):
+            fila = self.fila(i)
+            for j, valor in otra.fila(i).items():
+                fila[j] = fila.get(j, 0) + signo * valor
+            por_fila.append(fila)
+        return CSRMatrix._desde_filas(self.filas, self.columnas, por_fila)
+
+    def suma(self, otra):
+        """Suma con otra CSRMatrix de la misma forma en O(nnz)."""
+        return self._combinar(otra, 1)
+
+    def resta(self, otra):
+        """Resta otra CSRMatrix de la misma forma en O(nnz)."""
+        return self._combinar(otra, -1)
+
+    def escalar(self, escalar):
+        """Multiplica cada elemento por un escalar en O(nnz)."""
+        if escalar == 0:
+            return CSRMatrix(self.filas, self.columnas, array("q", [0] * (self.filas + 1)), array("q"), array("q"))
+        valores = [valor * escalar for valor in self.valores]
+        return CSRMatrix(self.filas, self.columnas, array("q", self.punteros), array("q", self.columnas_nz), _valores(valores))
+
+    def multiplicar(self, otra):
+        """
+        Multiplica por otra CSRMatrix (algoritmo de Gustavson): cada fila del
+        resultado acumula las filas de la otra matriz indicadas por los no ceros
+        de la fila correspondiente. Cuesta O(suma de productos no nulos).
+
+        Raises:
+            ValueError: Si las dimensiones son incompatibles para multiplicación
+        """
+        if self.columnas != otra.filas:
+            raise ValueError("Las dimensiones son incompatibles para multiplicación")
+        por_fila = []
+        for i in range(self.filas):
+            acumulado = {}
+            for k in range(self.punteros[i], self.punteros[i + 1]):
+                a = self.valores[k]
+                fila_otra = self.columnas_nz[k]
+                for m in range(otra.punteros[fila_otra], otra.punteros[fila_otra + 1]):
+                    j = otra.columnas_nz[m]
+                    acumulado[j] = acumulado.get(j, 0) + a * otra.valores[m]
+            por_fila.append(acumulado)
+        return CSRMatrix._desde_filas(self.filas, otra.columnas, por_fila)
+
+    def multiplicar_densa(self, matriz):
+        """
+        Multiplica por una matriz densa (lista de listas) en O(nnz * columnas).
+
+        Returns:
+            list: Matriz resultante (lista de listas)
+        """
+        if self.columnas != len(matriz):
+            raise ValueError("Las dimensiones son incompatibles para multiplicación")
+        p = len(matriz[0]) if matriz else 0
+        resultado = []
+        for i in range(self.filas):
+            fila = [0] * p
+            for k in range(self.punteros[i], self.punteros[i + 1]):
+                a = self.valores[k]
+                fila = [x + a * y for x, y in zip(fila, matriz[self.columnas_nz[k]])]
+            resultado.append(fila)
+        return resultado
+
+    def transpuesta(self):
+        """
+        Calcula la transpuesta en O(nnz + filas + columnas) contando los
+        elementos de cada columna.
+        """
+        conteo = [0] * (self.columnas + 1)
+        for j in self.columnas_nz:
+            conteo[j + 1] += 1
+        for j in range(self.columnas):
+            conteo[j + 1] += conteo[j]
+        punteros = array("q", conteo)
+        siguiente = conteo[:-1]
+        columnas_nz = array("q", [0] * self.nnz)
+        valores = self.valores[:]
+        for i in range(self.filas):
+            for k in range(self.punteros[i], self.punteros[i + 1]):
+                j = self.columnas_nz[k]
+                destino = siguiente[j]
+                columnas_nz[destino] = i
+                valores[destino] = self.valores[k]
+                siguiente[j] += 1
+        return CSRMatrix(self.columnas, self.filas, punteros, columnas_nz, valores)
+
+    def diagonal(self):
+        """
+        Retorna la diagonal principal con una búsqueda binaria por fila.
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada
+        """
+        if self.filas != self.columnas:
+            raise ValueError("La matriz no es cuadrada")
+        return [self.valor(i, i) for i in range(self.filas)]
+
+    def traza(self):
+        """
+        Suma de la diagonal principal.
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada
+        """
+        return sum(self.diagonal())
+
+    def es_diagonal(self):
+        """Verifica que todos los no ceros estén en la diagonal, en O(nnz)."""
+        if self.filas != self.columnas or self.filas == 0:
+            return False
+        for i in range(self.filas):
+            for k in range(self.punteros[i], self.punteros[i + 1]):
+                if self.columnas_nz[k] != i:
+                    return False
+        return True
+
+    def es_simetrica(self):
+        """Verifica si la matriz es igual a su transpuesta, en O(nnz)."""
+        if self.filas != self.columnas or self.filas == 0:
+            return False
+        transpuesta = self.transpuesta()
+        return (
+            self.punteros == transpuesta.punteros
+            and self.columnas_nz == transpuesta.columnas_nz
+            and list(self.valores) == list(transpuesta.valores)
+        )
+
+    def buscar(self, valor):
+        """
+        Busca todas las posiciones de un valor en orden de filas.
+        Para valores distintos de cero cuesta O(nnz); buscar el 0 requiere
+        recorrer los huecos de cada fila.
+
+        Returns:
+            list: Lista de tuplas (fila, columna)
+        """
+        posiciones = []
+        for i in range(self.filas):
+            inicio, fin = self.punteros[i], self.punteros[i + 1]
+            if valor == 0:
+                guardadas = set(self.columnas_nz[inicio:fin])
+                posiciones.extend((i, j) for j in range(self.columnas) if j not in guardadas)
+            else:
+                for k in range(inicio, fin):
+                    if self.valores[k] == valor:
+                        posiciones.append((i, self.columnas_nz[k]))
+        return posiciones
@@ -0,0 +1,193 @@
+class MatrixView:
+    """
+    Vista perezosa de una matriz transpuesta, rotada o volteada.
+
+    La vista no copia datos: guarda la matriz de origen y tres indicadores
+    (transpuesta, filas invertidas y columnas invertidas) con los que traduce
+    cada índice (i, j) de la vista a un índice del origen. Cualquier rotación
+    de 90/180/270 grados o volteo se puede expresar con esos tres indicadores,
+    por lo que encadenar transformaciones también es O(1).
+
+    Los cambios en la matriz de origen se ven a través de la vista. Para obtener
+    una copia independiente se usa materializar().
+
+    Ejemplo:
+        MatrixView([[1, 2], [3, 4]]).rotar(90).materializar() -> [[3, 1], [4, 2]]
+    """
+
+    __slots__ = ("origen", "transpuesta", "invertir_filas", "invertir_columnas", "filas", "columnas")
+
+    def __init__(self, origen, transpuesta=False, invertir_filas=False, invertir_columnas=False):
+        """
+        Args:
+            origen (list): Matriz de origen (lista de listas, DenseMatrix u otra vista)
+            transpuesta (bool): Si la vista intercambia filas por columnas
+            invertir_filas (bool): Si la vista recorre las filas en orden inverso
+            invertir_columnas (bool): Si la vista recorre las columnas en orden inverso
+        """
+        if isinstance(origen, MatrixView):
+            # Se compone con la vista de origen para no anidar vistas
+            vista = origen.transponer() if transpuesta else origen
+            if invertir_filas:
+                vista = vista.voltear_vertical()
+            if invertir_columnas:
+                vista = vista.voltear_horizontal()
+            origen = vista.origen
+            transpuesta = vista.transpuesta
+            invertir_filas = vista.invertir_filas
+            invertir_columnas = vista.invertir_columnas
+        filas_origen = len(origen)
+        columnas_origen = len(origen[0]) if filas_origen else 0
+        self.origen = origen
+        self.transpuesta = transpuesta
+        self.invertir_filas = invertir_filas
+        self.invertir_columnas = invertir_columnas
+        if transpuesta:
+            self.filas, self.columnas = columnas_origen, filas_origen
+        else:
+            self.filas, self.columnas = filas_origen, columnas_origen
+
+    @property
+    def forma(self):
+        """tuple: Dimensiones (filas, columnas) de la vista."""
+        return (self.filas, self.columnas)
+
+    def _con(self, transpuesta, invertir_filas, invertir_columnas):
+        return MatrixView(self.origen, transpuesta, invertir_filas, invertir_columnas)
+
+    def transponer(self):
+        """
+        Retorna la vista transpuesta.
+
+        Returns:
+            MatrixView: Vista con filas y columnas intercambiadas
+        """
+        return self._con(not self.transpuesta, self.invertir_columnas, self.invertir_filas)
+
+    def voltear_vertical(self):
+        """
+        Retorna la vista con el orden de las filas invertido (volteo arriba-abajo).
+
+        Returns:
+            MatrixView: Vista volteada verticalmente
+        """
+        return self._con(self.transpuesta, not self.invertir_filas, self.invertir_columnas)
+
+    def voltear_horizontal(self):
+        """
+        Retorna la vista con el orden de las columnas invertido (volteo izquierda-derecha).
+
+        Returns:
+            MatrixView: Vista volteada horizontalmente
+        """
+        return self._con(self.transpuesta, self.invertir_filas, not self.invertir_columnas)
+
+    def rotar(self, grados=90):
+        """
+        Retorna la vista rotada en sentido horario.
+
+        Args:
+            grados (int): Ángulo de rotación, múltiplo de 90 (puede ser negativo)
+
+        Returns:
+            MatrixView: Vista rotada
+
+        Raises:
+            ValueError: Si los grados no son múltiplo de 90
+
+        Ejemplo:
+            MatrixView([[1, 2], [3, 4]]).rotar(180).materializar() -> [[4, 3], [2, 1]]
+        """
+        if grados % 90 != 0:
+            raise ValueError("Los grados deben ser múltiplo de 90")
+        giros = (grados // 90) % 4
+        if giros == 0:
+            return self
+        if giros == 2:
+            return self._con(self.transpuesta, not self.invertir_filas, not self.invertir_columnas)
+        # 90 grados = transponer y voltear horizontal; 270 = transponer y voltear vertical
+        vista = self.transponer()
+        if giros == 1:
+            return vista.voltear_horizontal()
+        return vista.voltear_vertical()
+
+    def valor(self, i, j):
+        """
+        Retorna el elemento (i, j) de la vista.
+
+        Args:
+            i (int): Fila de la vista
+            j (int): Columna de la vista
+
+        Returns:
+            number: Elemento correspondiente de la matriz de origen
+        """
+        if self.invertir_filas:
+            i = self.filas - 1 - i
+        if self.invertir_columnas:
+            j = self.columnas - 1 - j
+        if self.transpuesta:
+            return self.origen[j][i]
+        return self.origen[i][j]
+
+    def materializar(self):
+        """
+        Copia la vista a una nueva lista de listas.
+
+        Returns:
+            list: Matriz con los valores de la vista
+        """
+        return [list(fila) for fila in self]
+
+    def __len__(self):
+        return self.filas
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.filas
+        if not 0 <= i < self.filas:
+            raise IndexError("Índice de fila fuera de rango")
+        if not self.transpuesta and not self.invertir_columnas:
+            # La fila existe tal cual en el origen: se retorna sin copiar
+            if self.invertir_filas:
+                i = self.filas - 1 - i
+            return self.origen[i]
+        return _FilaVista(self, i)
+
+    def __iter__(self):
+        for i in range(self.filas):
+            yield self[i]
+
+    def __repr__(self):
+        return f"MatrixView({self.materializar()!r})"
+
+
+class _FilaVista:
+    """Fila de una MatrixView que no existe como fila en el origen."""
+
+    __slots__ = ("vista", "i")
+
+    def __init__(self, vista, i):
+        self.vista = vista
+        self.i = i
+
+    def __len__(self):
+        return self.vista.columnas
+
+    def __getitem__(self, j):
+        if j < 0:
+            j += self.vista.columnas
+        if not 0 <= j < self.vista.columnas:
+            raise IndexError("Índice de columna fuera de rango")
+        return self.vista.valor(self.i, j)
+
+    def __iter__(self):
+        vista = self.vista
+        i = self.vista.filas - 1 - self.i if vista.invertir_filas else self.i
+        if vista.transpuesta:
+            columnas = range(vista.columnas)
+            if vista.invertir_columnas:
+                columnas = reversed(columnas)
+            origen = vista.origen
+            return (origen[r][i] for r in columnas)
+        return reversed(vista.origen[i])
@@ -0,0 +1,21 @@
+class Dataset(tuple):
+    """
+    Conjunto de datos inmutable que sirve de identificador para la caché de
+    Stats.
+
+    Es una tupla, así que todos los métodos de Stats lo aceptan igual que una
+    lista. Como no puede cambiar, un resultado calculado para un Dataset
+    sigue siendo válido mientras exista, y la caché lo identifica por su
+    identidad en O(1), sin comparar ni recorrer los valores.
+
+    Ejemplo:
+        stats = Stats(capacidad_cache=16)
+        datos = Dataset([1, 2, 2, 3, 4])
+        stats.describe(datos)   # calcula y guarda
+        stats.mediana(datos)    # O(1), sale de la caché
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"Dataset({list(self)!r})"
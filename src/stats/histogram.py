@@ -0,0 +1,393 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.stats.sketch import KLLSketch
+
+
+class Histogram:
+    """
+    Histograma de cubetas fijas que se llena en una sola pasada.
+
+    Las cubetas se definen por sus bordes b0 < b1 < ... < bm: la cubeta i
+    cuenta los valores de [bi, bi+1) y la última incluye también bm. Los
+    valores menores que b0 o mayores que bm se cuentan aparte (debajo y
+    encima). Los conteos se guardan en un array('Q'), así que la memoria solo
+    depende del número de cubetas y no de cuántos valores se añaden.
+
+    Se crea con ancho_fijo(), logaritmico() o por_cuantiles(). Los
+    histogramas con los mismos bordes se combinan con merge(), por ejemplo
+    para unir los de varios procesos.
+
+    promedio(), varianza() y cuantil() son aproximados: usan solo los
+    conteos, suponiendo los valores repartidos uniformemente dentro de cada
+    cubeta. Su error está acotado por el ancho de las cubetas. La cantidad, el
+    mínimo y el máximo son exactos.
+
+    Ejemplo:
+        histograma = Histogram.ancho_fijo(0, 100, 10)
+        histograma.extend([5, 15, 15, 99, 120])
+        histograma.conteos -> array('Q', [1, 2, 0, 0, 0, 0, 0, 0, 0, 1])
+        histograma.encima -> 1
+    """
+
+    def __init__(self, bordes):
+        """
+        Args:
+            bordes (list): Bordes de las cubetas, estrictamente crecientes
+
+        Raises:
+            ValueError: Si hay menos de dos bordes o no son estrictamente crecientes
+        """
+        bordes = [float(b) for b in bordes]
+        if len(bordes) < 2:
+            raise ValueError("Se necesitan al menos dos bordes")
+        if any(a >= b for a, b in zip(bordes, bordes[1:])):
+            raise ValueError("Los bordes deben ser estrictamente crecientes")
+        self.bordes = bordes
+        self.conteos = array("Q", bytes(8 * (len(bordes) - 1)))
+        self.debajo = 0
+        self.encima = 0
+        self.n = 0
+        self.minimo = None
+        self.maximo = None
+        # Transformación que lleva un valor a su cubeta sin búsqueda binaria
+        # (None si los bordes no son equiespaciados en escala lineal o logarítmica)
+        self._escala = None
+
+    @classmethod
+    def ancho_fijo(cls, minimo, maximo, cubetas):
+        """
+        Crea un histograma de cubetas del mismo ancho entre minimo y maximo.
+
+        Args:
+            minimo (number): Borde inferior
+            maximo (number): Borde superior
+            cubetas (int): Número de cubetas
+
+        Returns:
+            Histogram: Histograma vacío
+
+        Raises:
+            ValueError: Si cubetas es menor que 1 o minimo >= maximo
+        """
+        if cubetas < 1:
+            raise ValueError("Se necesita al menos una cubeta")
+        if minimo >= maximo:
+            raise ValueError("El mínimo debe ser menor que el máximo")
+        amplitud = maximo - minimo
+        histograma = cls([minimo + amplitud * i / cubetas for i in range(cubetas)] + [maximo])
+        histograma._escala = ("lineal", minimo, cubetas / (maximo - minimo))
+        return histograma
+
+    @classmethod
+    def logaritmico(cls, minimo, maximo, cubetas):
+        """
+        Crea un histograma de cubetas de ancho creciente en escala logarítmica
+        (cada borde es el anterior por un mismo factor), útil para latencias o
+        tamaños que abarcan varios órdenes de magnitud.
+
+        Args:
+            minimo (number): Borde inferior, mayor que 0
+            maximo (number): Borde superior
+            cubetas (int): Número de cubetas
+
+        Returns:
+            Histogram: Histograma vacío
+
+        Raises:
+            ValueError: Si minimo <= 0, minimo >= maximo o cubetas es menor que 1
+        """
+        if minimo <= 0:
+            raise ValueError("El mínimo de una escala logarítmica debe ser mayor que 0")
+        if cubetas < 1:
+            raise ValueError("Se necesita al menos una cubeta")
+        if minimo >= maximo:
+            raise ValueError("El mínimo debe ser menor que el máximo")
+        factor = (maximo / minimo) ** (1 / cubetas)
+        histograma = cls([minimo * factor**i for i in range(cubetas)] + [maximo])
+        histograma._escala = ("log", math.log(minimo), cubetas / math.log(maximo / minimo))
+        return histograma
+
+    @classmethod
+    def por_cuantiles(cls, muestra, cubetas):
+        """
+        Crea un histograma cuyos bordes son los cuantiles de una muestra, así
+        que cada cubeta recibe aproximadamente la misma cantidad de valores.
+
+        Args:
+            muestra (list | KLLSketch): Valores representativos, o un bosquejo
+                                        de los datos
+            cubetas (int): Número de cubetas
+
+        Returns:
+            Histogram: Histograma vacío (la muestra no se cuenta)
+
+        Raises:
+            ValueError: Si cubetas es menor que 1 o la muestra no tiene al
+                        menos dos valores distintos
+        """
+        if cubetas < 1:
+            raise ValueError("Se necesita al menos una cubeta")
+        qs = [i / cubetas for i in range(cubetas + 1)]
+        if isinstance(muestra, KLLSketch):
+            bordes = muestra.cuantiles(qs) if muestra.n else []
+        else:
+            ordenados = sorted(muestra)
+            bordes = [ordenados[round(q * (len(ordenados) - 1))] for q in qs] if ordenados else []
+        # Con valores repetidos varios cuantiles coinciden; se dejan los distintos
+        bordes = sorted(set(bordes))
+        if len(bordes) < 2:
+            raise ValueError("La muestra necesita al menos dos valores distintos")
+        return cls(bordes)
+
+    def push(self, x):
+        """
+        Cuenta un valor.
+
+        Args:
+            x (number): Valor a contar
+        """
+        self.extend((x,))
+
+    def extend(self, numeros):
+        """
+        Cuenta todos los valores de un iterable en una sola pasada (puede ser
+        un generador sin fin).
+
+        Args:
+            numeros (iterable): Valores a contar
+
+        Returns:
+            Histogram: El propio histograma
+        """
+        conteos = self.conteos
+        bordes = self.bordes
+        inferior, superior = bordes[0], bordes[-1]
+        ultima = len(bordes) - 2
+        tipo, origen, escala = self._escala or (None, 0, 0)
+        log = math.log
+        n, debajo, encima = self.n, self.debajo, self.encima
+        minimo, maximo = self.minimo, self.maximo
+        for x in numeros:
+            n += 1
+            if minimo is None or x < minimo:
+                minimo = x
+            if maximo is None or x > maximo:
+                maximo = x
+            if x < inferior:
+                debajo += 1
+                continue
+            if x > superior:
+                encima += 1
+                continue
+            # Cubeta por fórmula si la escala es regular; se corrige el redondeo
+            # frente a los bordes guardados
+            if tipo is None:
+                i = bisect_right(bordes, x) - 1
+            else:
+                i = int(((log(x) if tipo == "log" else x) - origen) * escala)
+                if i > ultima:
+                    i = ultima
+                if x < bordes[i]:
+                    i -= 1
+                elif i < ultima and x >= bordes[i + 1]:
+                    i += 1
+            conteos[i if i <= ultima else ultima] += 1
+        self.n, self.debajo, self.encima = n, debajo, encima
+        self.minimo, self.maximo = minimo, maximo
+        return self
+
+    def merge(self, otro):
+        """
+        Suma los conteos de otro histograma con los mismos bordes.
+
+        Args:
+            otro (Histogram): Histograma a incorporar
+
+        Returns:
+            Histogram: El propio histograma
+
+        Raises:
+            ValueError: Si los bordes no coinciden
+        """
+        if otro.bordes != self.bordes:
+            raise ValueError("Solo se pueden combinar histogramas con los mismos bordes")
+        if otro.n == 0:
+            return self
+        self.conteos = array("Q", map(sum, zip(self.conteos, otro.conteos)))
+        self.debajo += otro.debajo
+        self.encima += otro.encima
+        if self.n == 0:
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+        else:
+            self.minimo = min(self.minimo, otro.minimo)
+            self.maximo = max(self.maximo, otro.maximo)
+        self.n += otro.n
+        return self
+
+    def _intervalos(self):
+        """(desde, hasta, conteo) de cada cubeta con valores, incluidas debajo y encima."""
+        bordes = self.bordes
+        intervalos = []
+        if self.debajo:
+            intervalos.append((self.minimo, bordes[0], self.debajo))
+        for i, conteo in enumerate(self.conteos):
+            if conteo:
+                intervalos.append((bordes[i], bordes[i + 1], conteo))
+        if self.encima:
+            intervalos.append((bordes[-1], self.maximo, self.encima))
+        # Las cubetas de los extremos se recortan al mínimo y al máximo reales
+        return [
+            (max(desde, self.minimo), min(hasta, self.maximo), conteo)
+            for desde, hasta, conteo in intervalos
+        ]
+
+    def promedio(self):
+        """float: Media aproximada con el punto medio de cada cubeta, 0 sin datos."""
+        if self.n == 0:
+            return 0
+        return math.fsum((desde + hasta) / 2 * conteo for desde, hasta, conteo in self._intervalos()) / self.n
+
+    def varianza(self):
+        """
+        float: Varianza poblacional aproximada, 0 sin datos. Cada cubeta aporta
+        la varianza de una distribución uniforme en su intervalo, además de la
+        de su punto medio.
+        """
+        if self.n == 0:
+            return 0
+        media = self.promedio()
+        return math.fsum(
+            conteo * (((desde + hasta) / 2 - media) ** 2 + (hasta - desde) ** 2 / 12)
+            for desde, hasta, conteo in self._intervalos()
+        ) / self.n
+
+    def desviacion_estandar(self):
+        """float: Desviación estándar poblacional aproximada, 0 sin datos."""
+        return math.sqrt(self.varianza())
+
+    def cuantiles(self, qs):
+        """
+        Calcula cuantiles aproximados interpolando linealmente dentro de la
+        cubeta donde cae cada uno. El error es como mucho el ancho de esa cubeta.
+
+        Args:
+            qs (list): Cuantiles a calcular, cada uno entre 0 y 1
+
+        Returns:
+            list: Un valor por cada cuantil de qs, en el mismo orden.
+                  Sin datos, cada valor es 0.
+
+        Raises:
+            ValueError: Si algún cuantil está fuera de [0, 1]
+        """
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Los cuantiles deben estar entre 0 y 1")
+        if self.n == 0:
+            return [0 for _ in qs]
+        intervalos = self._intervalos()
+        acumulados = []
+        total = 0
+        for _, _, conteo in intervalos:
+            total += conteo
+            acumulados.append(total)
+        resultado = []
+        for q in qs:
+            objetivo = q * self.n
+            i = min(bisect_left(acumulados, objetivo), len(intervalos) - 1)
+            desde, hasta, conteo = intervalos[i]
+            anteriores = acumulados[i] - conteo
+            resultado.append(desde + (hasta - desde) * max(0.0, objetivo - anteriores) / conteo)
+        return resultado
+
+    def cuantil(self, q):
+        """
+        Calcula un cuantil aproximado (ver cuantiles()).
+
+        Args:
+            q (float): Cuantil entre 0 y 1
+
+        Returns:
+            float: Valor aproximado del cuantil; 0 sin datos
+        """
+        return self.cuantiles([q])[0]
+
+    def tabla(self):
+        """
+        Tabla de frecuencias: una fila por cubeta, más una fila para los
+        valores por debajo y otra para los de encima si los hay.
+
+        Returns:
+            list: Tuplas (desde, hasta, conteo, proporcion)
+
+        Ejemplo:
+            Histogram.ancho_fijo(0, 10, 2).extend([1, 2, 7]).tabla()
+            -> [(0.0, 5.0, 2, 0.666...), (5.0, 10.0, 1, 0.333...)]
+        """
+        n = self.n or 1
+        filas = []
+        if self.debajo:
+            filas.append((self.minimo, self.bordes[0], self.debajo, self.debajo / n))
+        for i, conteo in enumerate(self.conteos):
+            filas.append((self.bordes[i], self.bordes[i + 1], conteo, conteo / n))
+        if self.encima:
+            filas.append((self.bordes[-1], self.maximo, self.encima, self.encima / n))
+        return filas
+
+    def a_dict(self):
+        """
+        Convierte el histograma a un diccionario de tipos básicos (serializable
+        con json).
+
+        Returns:
+            dict: Estado del histograma, reconstruible con desde_dict
+        """
+        return {
+            "bordes": list(self.bordes),
+            "conteos": self.conteos.tolist(),
+            "debajo": self.debajo,
+            "encima": self.encima,
+            "n": self.n,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "escala": list(self._escala) if self._escala else None,
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """
+        Reconstruye un histograma a partir del resultado de a_dict().
+
+        Args:
+            datos (dict): Estado del histograma
+
+        Returns:
+            Histogram: Histograma equivalente al original
+
+        Raises:
+            ValueError: Si los conteos no corresponden a los bordes o no suman n
+        """
+        histograma = cls(datos["bordes"])
+        if len(datos["conteos"]) != len(histograma.conteos):
+            raise ValueError("Hay que dar un conteo por cubeta")
+        if sum(datos["conteos"]) + datos["debajo"] + datos["encima"] != datos["n"]:
+            raise ValueError("Los conteos no suman n valores")
+        histograma.conteos = array("Q", datos["conteos"])
+        histograma.debajo = datos["debajo"]
+        histograma.encima = datos["encima"]
+        histograma.n = datos["n"]
+        histograma.minimo = datos["minimo"]
+        histograma.maximo = datos["maximo"]
+        histograma._escala = tuple(datos["escala"]) if datos.get("escala") else None
+        return histograma
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return (
+            f"Histogram(cubetas={len(self.conteos)}, n={self.n}, "
+            f"debajo={self.debajo}, encima={self.encima})"
+        )
@@ -0,0 +1,180 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.stats.running import RunningStats
+from src.stats.sketch import KLLSketch
+
+
+def _leer_rango(ruta, inicio, fin):
+    """
+    Lee los números de las líneas de un archivo que empiezan en el rango de
+    bytes [inicio, fin). Los límites se ajustan a saltos de línea, así que cada
+    línea la procesa exactamente un bloque.
+    """
+    with open(ruta, "rb") as archivo:
+        if inicio > 0:
+            archivo.seek(inicio - 1)
+            archivo.readline()
+            inicio = archivo.tell()
+        archivo.seek(fin - 1)
+        archivo.readline()
+        fin = archivo.tell()
+        if fin <= inicio:
+            return []
+        archivo.seek(inicio)
+        datos = archivo.read(fin - inicio)
+    return list(map(float, datos.split()))
+
+
+def _resumir_rango(ruta, inicio, fin):
+    return RunningStats.desde_secuencia(_leer_rango(ruta, inicio, fin))
+
+
+def _resumir_bloque(bloque):
+    return RunningStats.desde_secuencia(bloque)
+
+
+def _bosquejar_rango(ruta, inicio, fin, k):
+    return KLLSketch(k).extend(_leer_rango(ruta, inicio, fin))
+
+
+def _bosquejar_bloque(bloque, k):
+    return KLLSketch(k).extend(bloque)
+
+
+class ParallelStats:
+    """
+    Estadísticas de datos grandes con un map-reduce sobre un ProcessPoolExecutor.
+
+    La entrada se divide en bloques; cada proceso calcula los momentos parciales
+    de su bloque (cantidad, media, m2, mínimo y máximo) en un RunningStats y los
+    parciales se combinan con la fórmula de Chan. El resultado es un
+    RunningStats con promedio, varianza, desviacion_estandar y rango, que
+    coinciden con los de Stats salvo por el redondeo.
+
+    bosquejar() hace lo mismo con un KLLSketch por bloque para calcular
+    cuantiles aproximados (p50, p95, p99) con memoria acotada.
+
+    Ejemplo:
+        with ParallelStats(workers=4) as paralela:
+            resumen = paralela.resumir("latencias.txt")
+            resumen.desviacion_estandar()
+            paralela.bosquejar("latencias.txt").cuantiles([0.5, 0.99])
+    """
+
+    def __init__(self, workers=None, bytes_por_bloque=64 * 1024 * 1024, executor=None):
+        """
+        Args:
+            workers (int): Número de procesos. Por defecto, el número de CPUs.
+                           Con 1 se calcula en el proceso actual, sin pool
+            bytes_por_bloque (int): Tamaño máximo de cada bloque al leer un archivo
+            executor (Executor): Pool ya creado. Si no se indica se crea uno al
+                                 primer uso y se cierra con cerrar()
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.bytes_por_bloque = bytes_por_bloque
+        self._executor = executor
+        self._executor_propio = executor is None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def cerrar(self):
+        """Cierra el pool de procesos si fue creado por esta instancia."""
+        if self._executor is not None and self._executor_propio:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _combinar(self, funcion, tareas, total=None):
+        """
+        Aplica funcion a cada tarea y combina los parciales en total (por
+        defecto un RunningStats). Mantiene como mucho 2 * workers tareas en
+        vuelo para no cargar toda la entrada en memoria.
+        """
+        if total is None:
+            total = RunningStats()
+        if self.workers == 1 and self._executor is None:
+            for argumentos in tareas:
+                total.merge(funcion(*argumentos))
+            return total
+        pool = self._pool()
+        pendientes = deque()
+        for argumentos in tareas:
+            pendientes.append(pool.submit(funcion, *argumentos))
+            if len(pendientes) >= 2 * self.workers:
+                total.merge(pendientes.popleft().result())
+        while pendientes:
+            total.merge(pendientes.popleft().result())
+        return total
+
+    def resumir(self, origen):
+        """
+        Calcula las estadísticas de un archivo o de un iterable de bloques.
+
+        Args:
+            origen (str | PathLike | iterable): Ruta de un archivo de texto con
+                números separados por espacios o saltos de línea, o un iterable
+                de bloques (listas de números)
+
+        Returns:
+            RunningStats: Estadísticas de todos los valores
+
+        Ejemplo:
+            resumir([[1, 2, 3], [4, 5]]).promedio() -> 3.0
+        """
+        if isinstance(origen, (str, os.PathLike)):
+            return self.resumir_archivo(origen)
+        return self._combinar(_resumir_bloque, ((bloque,) for bloque in origen))
+
+    def _rangos(self, ruta):
+        """Divide el archivo en rangos de bytes de como mucho bytes_por_bloque."""
+        tamano = os.path.getsize(ruta)
+        bloques = max(1, -(-tamano // self.bytes_por_bloque))
+        paso = -(-tamano // bloques) if tamano else 0
+        return (
+            (os.fspath(ruta), inicio, min(inicio + paso, tamano))
+            for inicio in range(0, tamano, paso or 1)
+        )
+
+    def resumir_archivo(self, ruta):
+        """
+        Calcula las estadísticas de un archivo de texto con números separados por
+        espacios o saltos de línea. Cada proceso lee su propio rango de bytes del
+        archivo, así que los datos no pasan por el proceso principal.
+
+        Args:
+            ruta (str | PathLike): Ruta del archivo
+
+        Returns:
+            RunningStats: Estadísticas de todos los valores del archivo
+        """
+        return self._combinar(_resumir_rango, self._rangos(ruta))
+
+    def bosquejar(self, origen, k=200):
+        """
+        Calcula un KLLSketch de un archivo o de un iterable de bloques. Cada
+        proceso bosqueja su bloque y los bosquejos se combinan con merge().
+
+        Args:
+            origen (str | PathLike | iterable): Igual que en resumir()
+            k (int): Precisión del bosquejo (ver KLLSketch)
+
+        Returns:
+            KLLSketch: Bosquejo de todos los valores
+
+        Ejemplo:
+            bosquejar("latencias.txt").cuantiles([0.5, 0.95, 0.99])
+        """
+        if isinstance(origen, (str, os.PathLike)):
+            tareas = (rango + (k,) for rango in self._rangos(origen))
+            return self._combinar(_bosquejar_rango, tareas, KLLSketch(k))
+        return self._combinar(_bosquejar_bloque, ((bloque, k) for bloque in origen), KLLSketch(k))
@@ -0,0 +1,341 @@
+from itertools import repeat
+from operator import mul, sub
+
+
+class RunningStats:
+    """
+    Acumulador de estadísticas en una sola pasada y memoria O(1).
+
+    Usa el algoritmo de Welford: por cada valor actualiza la cantidad, la media
+    y la suma de cuadrados de las desviaciones (m2), que es numéricamente
+    estable frente a la fórmula de la suma de cuadrados. Así se pueden calcular
+    media, varianza, desviación estándar, mínimo, máximo y rango sobre un
+    generador sin guardar los datos.
+
+    Dos acumuladores se combinan con merge() usando la fórmula de Chan, por
+    ejemplo para unir resultados parciales calculados por separado.
+
+    Los métodos siguen las convenciones de Stats: varianza y desviación son
+    poblacionales y, sin datos, los resultados son 0.
+
+    Ejemplo:
+        acumulador = RunningStats()
+        acumulador.extend(x for x in [1, 2, 3, 4, 5])
+        acumulador.promedio() -> 3.0
+        acumulador.varianza() -> 2.0
+    """
+
+    def __init__(self, numeros=()):
+        """
+        Args:
+            numeros (iterable): Valores iniciales (opcional)
+        """
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = None
+        self.maximo = None
+        self.extend(numeros)
+
+    @classmethod
+    def desde_secuencia(cls, numeros):
+        """
+        Crea un acumulador a partir de una secuencia que ya está en memoria.
+        Calcula la media y m2 con dos pasadas rápidas (sum/min/max en C) en
+        lugar de actualizar valor a valor.
+
+        Args:
+            numeros (list): Secuencia de números
+
+        Returns:
+            RunningStats: Acumulador con los valores de la secuencia
+        """
+        acumulador = cls()
+        n = len(numeros)
+        if n:
+            media = sum(numeros) / n
+            acumulador.n = n
+            acumulador.media = media
+            acumulador.m2 = sum((x - media) ** 2 for x in numeros)
+            acumulador.minimo = min(numeros)
+            acumulador.maximo = max(numeros)
+        return acumulador
+
+    def push(self, x):
+        """
+        Añade un valor.
+
+        Args:
+            x (number): Valor a añadir
+        """
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (x - self.media)
+        if self.minimo is None or x < self.minimo:
+            self.minimo = x
+        if self.maximo is None or x > self.maximo:
+            self.maximo = x
+
+    def extend(self, numeros):
+        """
+        Añade todos los valores de un iterable (puede ser un generador sin fin
+        de los que se consumen solo los que se van leyendo).
+
+        Args:
+            numeros (iterable): Valores a añadir
+
+        Returns:
+            RunningStats: El propio acumulador
+        """
+        n, media, m2 = self.n, self.media, self.m2
+        minimo, maximo = self.minimo, self.maximo
+        for x in numeros:
+            n += 1
+            delta = x - media
+            media += delta / n
+            m2 += delta * (x - media)
+            if minimo is None or x < minimo:
+                minimo = x
+            if maximo is None or x > maximo:
+                maximo = x
+        self.n, self.media, self.m2 = n, media, m2
+        self.minimo, self.maximo = minimo, maximo
+        return self
+
+    def merge(self, otro):
+        """
+        Incorpora los valores de otro acumulador (fórmula de Chan para varianza
+        en paralelo). El resultado es el mismo que si todos los valores se
+        hubieran añadido a este acumulador.
+
+        Args:
+            otro (RunningStats): Acumulador a incorporar
+
+        Returns:
+            RunningStats: El propio acumulador
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media, self.m2 = otro.n, otro.media, otro.m2
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+            return self
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / n
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.n = n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+
+    def promedio(self):
+        """float: Media aritmética, 0 sin datos."""
+        return self.media if self.n else 0
+
+    def varianza(self):
+        """float: Varianza poblacional, 0 sin datos."""
+        return self.m2 / self.n if self.n else 0
+
+    def desviacion_estandar(self):
+        """float: Desviación estándar poblacional, 0 sin datos."""
+        return self.varianza() ** 0.5
+
+    def rango(self):
+        """number: Diferencia entre máximo y mínimo, 0 sin datos."""
+        return self.maximo - self.minimo if self.n else 0
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return (
+            f"RunningStats(n={self.n}, media={self.promedio()}, "
+            f"varianza={self.varianza()}, minimo={self.minimo}, maximo={self.maximo})"
+        )
+
+
+# Pares por bloque en RunningCovariance.desde_secuencias: los bloques
+# pequeños caben en la caché del procesador y se combinan con merge()
+_BLOQUE = 4096
+
+
+class RunningCovariance:
+    """
+    Acumulador de covarianza, correlación y regresión lineal de pares (x, y)
+    en una sola pasada y memoria O(1).
+
+    Extiende el algoritmo de Welford a dos variables: además de las medias y
+    de m2 de cada variable guarda el co-momento c = suma((x - media_x) *
+    (y - media_y)), actualizado valor a valor de forma numéricamente estable.
+    Dos acumuladores se combinan con merge() (fórmula de Chan), por ejemplo
+    para unir bloques calculados en otros procesos.
+
+    Como en Stats, la covarianza es poblacional.
+
+    Ejemplo:
+        acumulador = RunningCovariance()
+        acumulador.extend(zip([1, 2, 3], [2, 4, 7]))
+        acumulador.correlacion() -> 0.993...
+        acumulador.regresion() -> (2.5, -0.666...)
+    """
+
+    def __init__(self, pares=()):
+        """
+        Args:
+            pares (iterable): Pares (x, y) iniciales (opcional)
+        """
+        self.n = 0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c = 0.0
+        self.extend(pares)
+
+    @classmethod
+    def desde_secuencias(cls, xs, ys):
+        """
+        Crea un acumulador a partir de dos secuencias que ya están en memoria,
+        con dos pasadas rápidas (sum y map en C) en lugar de actualizar par a
+        par. Las secuencias largas se procesan en bloques que se combinan con
+        merge().
+
+        Args:
+            xs (list): Valores de x
+            ys (list): Valores de y, en el mismo orden
+
+        Returns:
+            RunningCovariance: Acumulador con los pares (xs[i], ys[i])
+
+        Raises:
+            ValueError: Si las secuencias tienen distinta longitud
+        """
+        if len(xs) != len(ys):
+            raise ValueError("Las dos series deben tener la misma longitud")
+        n = len(xs)
+        if n > _BLOQUE:
+            acumulador = cls()
+            for inicio in range(0, n, _BLOQUE):
+                fin = inicio + _BLOQUE
+                acumulador.merge(cls.desde_secuencias(xs[inicio:fin], ys[inicio:fin]))
+            return acumulador
+        acumulador = cls()
+        if n:
+            media_x = sum(xs) / n
+            media_y = sum(ys) / n
+            dx = list(map(sub, xs, repeat(media_x, n)))
+            dy = list(map(sub, ys, repeat(media_y, n)))
+            acumulador.n = n
+            acumulador.media_x, acumulador.media_y = media_x, media_y
+            acumulador.m2_x = sum(map(mul, dx, dx))
+            acumulador.m2_y = sum(map(mul, dy, dy))
+            acumulador.c = sum(map(mul, dx, dy))
+        return acumulador
+
+    def push(self, x, y):
+        """
+        Añade un par.
+
+        Args:
+            x (number): Valor de x
+            y (number): Valor de y
+        """
+        self.extend(((x, y),))
+
+    def extend(self, pares):
+        """
+        Añade todos los pares (x, y) de un iterable (puede ser un generador).
+
+        Args:
+            pares (iterable): Pares (x, y), por ejemplo zip(xs, ys)
+
+        Returns:
+            RunningCovariance: El propio acumulador
+        """
+        n, media_x, media_y = self.n, self.media_x, self.media_y
+        m2_x, m2_y, c = self.m2_x, self.m2_y, self.c
+        for x, y in pares:
+            n += 1
+            dx = x - media_x
+            media_x += dx / n
+            dy = y - media_y
+            media_y += dy / n
+            m2_x += dx * (x - media_x)
+            m2_y += dy * (y - media_y)
+            c += dx * (y - media_y)
+        self.n, self.media_x, self.media_y = n, media_x, media_y
+        self.m2_x, self.m2_y, self.c = m2_x, m2_y, c
+        return self
+
+    def merge(self, otro):
+        """
+        Incorpora los pares de otro acumulador (fórmula de Chan). El resultado
+        es el mismo que si todos los pares se hubieran añadido a este acumulador.
+
+        Args:
+            otro (RunningCovariance): Acumulador a incorporar
+
+        Returns:
+            RunningCovariance: El propio acumulador
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media_x, self.media_y = otro.n, otro.media_x, otro.media_y
+            self.m2_x, self.m2_y, self.c = otro.m2_x, otro.m2_y, otro.c
+            return self
+        n = self.n + otro.n
+        dx = otro.media_x - self.media_x
+        dy = otro.media_y - self.media_y
+        factor = self.n * otro.n / n
+        self.m2_x += otro.m2_x + dx * dx * factor
+        self.m2_y += otro.m2_y + dy * dy * factor
+        self.c += otro.c + dx * dy * factor
+        self.media_x += dx * otro.n / n
+        self.media_y += dy * otro.n / n
+        self.n = n
+        return self
+
+    def covarianza(self):
+        """float: Covarianza poblacional, 0 sin datos."""
+        return self.c / self.n if self.n else 0
+
+    def correlacion(self):
+        """
+        Coeficiente de correlación de Pearson.
+
+        Returns:
+            float: Correlación entre -1 y 1
+
+        Raises:
+            ValueError: Si x o y no varían (o no hay datos)
+        """
+        if self.m2_x <= 0 or self.m2_y <= 0:
+            raise ValueError("La correlación no está definida si una de las series es constante")
+        return max(-1.0, min(1.0, self.c / (self.m2_x * self.m2_y) ** 0.5))
+
+    def regresion(self):
+        """
+        Recta de mínimos cuadrados y = pendiente * x + intercepto.
+
+        Returns:
+            tuple: (pendiente, intercepto)
+
+        Raises:
+            ValueError: Si x no varía (o no hay datos)
+        """
+        if self.m2_x <= 0:
+            raise ValueError("La regresión no está definida si x es constante")
+        pendiente = self.c / self.m2_x
+        return pendiente, self.media_y - pendiente * self.media_x
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return (
+            f"RunningCovariance(n={self.n}, media_x={self.media_x}, "
+            f"media_y={self.media_y}, covarianza={self.covarianza()})"
+        )
@@ -0,0 +1,441 @@
+import heapq
+import random
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice
+
+# Cada nivel por debajo del superior tiene 2/3 de la capacidad del siguiente
+_FACTOR = 2 / 3
+_CAPACIDAD_MINIMA = 2
+# Valores que extend() lee de una vez antes de compactar
+_BLOQUE = 4096
+
+
+class KLLSketch:
+    """
+    Bosquejo de cuantiles KLL (Karnin, Lang y Liberty) con memoria acotada.
+
+    Guarda una muestra de los valores en niveles: un valor del nivel h
+    representa 2**h valores originales. Cuando el bosquejo se llena, el nivel
+    más bajo que está lleno se ordena y se queda con uno de cada dos valores
+    (empezando al azar por el primero o el segundo), que suben al nivel
+    siguiente con el doble de peso.
+
+    Error: el cuantil q retornado tiene un rango real entre (q - e)·n y
+    (q + e)·n, con e del orden de 1.7 / k con alta probabilidad (alrededor
+    del 1% para k=200). Con menos de k valores el resultado es exacto.
+    Memoria: unos 3·k valores, independientemente de n (más un bloque de
+    entrada de 4096 valores mientras extend() lo procesa).
+
+    El mínimo, el máximo y la cantidad de valores son exactos. Dos bosquejos
+    con el mismo k se combinan con merge(), y a_dict()/desde_dict() los
+    convierten a tipos básicos (serializables con json o pickle) para
+    combinar bosquejos calculados en otros procesos o máquinas.
+
+    Ejemplo:
+        bosquejo = KLLSketch(k=200)
+        bosquejo.extend(latencias)
+        bosquejo.cuantiles([0.5, 0.95, 0.99])
+    """
+
+    def __init__(self, k=200, semilla=None):
+        """
+        Args:
+            k (int): Precisión del bosquejo; más grande es más preciso y usa más memoria
+            semilla (int): Semilla para las compactaciones (para resultados reproducibles)
+
+        Raises:
+            ValueError: Si k es menor que 8
+        """
+        if k < 8:
+            raise ValueError("k debe ser al menos 8")
+        self.k = k
+        self.n = 0
+        self.minimo = None
+        self.maximo = None
+        self._niveles = [[]]
+        self._aleatorio = random.Random(semilla)
+        self._ordenados = None
+
+    def _capacidad(self, nivel):
+        profundidad = len(self._niveles) - nivel - 1
+        return max(_CAPACIDAD_MINIMA, int(self.k * _FACTOR**profundidad))
+
+    def _comprimir(self):
+        """Compacta niveles mientras el bosquejo guarde más valores de los que caben."""
+        while True:
+            tamanos = [len(nivel) for nivel in self._niveles]
+            if sum(tamanos) <= sum(self._capacidad(h) for h in range(len(tamanos))):
+                return
+            for h, tamano in enumerate(tamanos):
+                if tamano >= self._capacidad(h):
+                    break
+            if h + 1 == len(self._niveles):
+                self._niveles.append([])
+            nivel = self._niveles[h]
+            resto = [nivel.pop()] if len(nivel) % 2 else []
+            nivel.sort()
+            self._niveles[h + 1].extend(nivel[self._aleatorio.getrandbits(1)::2])
+            self._niveles[h] = resto
+
+    def push(self, x):
+        """
+        Añade un valor.
+
+        Args:
+            x (number): Valor a añadir
+        """
+        self.extend((x,))
+
+    def extend(self, numeros):
+        """
+        Añade todos los valores de un iterable (puede ser un generador; se
+        consume por bloques sin guardarlo entero).
+
+        Args:
+            numeros (iterable): Valores a añadir
+
+        Returns:
+            KLLSketch: El propio bosquejo
+        """
+        iterador = iter(numeros)
+        while True:
+            bloque = list(islice(iterador, _BLOQUE))
+            if not bloque:
+                return self
+            minimo, maximo = min(bloque), max(bloque)
+            if self.n == 0:
+                self.minimo, self.maximo = minimo, maximo
+            else:
+                self.minimo = min(self.minimo, minimo)
+                self.maximo = max(self.maximo, maximo)
+            self.n += len(bloque)
+            self._niveles[0].extend(bloque)
+            self._ordenados = None
+            self._comprimir()
+
+    def merge(self, otro):
+        """
+        Incorpora los valores de otro bosquejo. El error del resultado es el
+        mismo que si todos los valores se hubieran añadido a este bosquejo.
+
+        Args:
+            otro (KLLSketch): Bosquejo a incorporar
+
+        Returns:
+            KLLSketch: El propio bosquejo
+
+        Raises:
+            ValueError: Si los bosquejos tienen distinto k
+        """
+        if otro.k != self.k:
+            raise ValueError("Solo se pueden combinar bosquejos con el mismo k")
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+        else:
+            self.minimo = min(self.minimo, otro.minimo)
+            self.maximo = max(self.maximo, otro.maximo)
+        self.n += otro.n
+        while len(self._niveles) < len(otro._niveles):
+            self._niveles.append([])
+        for h, nivel in enumerate(otro._niveles):
+            self._niveles[h].extend(nivel)
+        self._ordenados = None
+        self._comprimir()
+        return self
+
+    def _tabla(self):
+        """Valores guardados ordenados y sus pesos acumulados."""
+        if self._ordenados is None:
+            pares = sorted((x, 1 << h) for h, nivel in enumerate(self._niveles) for x in nivel)
+            self._ordenados = ([x for x, _ in pares], list(accumulate(peso for _, peso in pares)))
+        return self._ordenados
+
+    def cuantil(self, q):
+        """
+        Calcula un cuantil aproximado.
+
+        Args:
+            q (float): Cuantil entre 0 y 1 (0.5 es la mediana, 0.99 el p99)
+
+        Returns:
+            number: Un valor cuyo rango está cerca de q·n; 0 sin datos
+
+        Raises:
+            ValueError: Si q está fuera de [0, 1]
+        """
+        return self.cuantiles([q])[0]
+
+    def cuantiles(self, qs):
+        """
+        Calcula varios cuantiles aproximados con el mismo contrato que
+        Stats.cuantiles (sin interpolar). El mínimo (q=0) y el máximo (q=1)
+        son exactos.
+
+        Args:
+            qs (list): Cuantiles a calcular, cada uno entre 0 y 1
+
+        Returns:
+            list: Un valor por cada cuantil de qs, en el mismo orden.
+                  Sin datos, cada valor es 0.
+
+        Raises:
+            ValueError: Si algún cuantil está fuera de [0, 1]
+
+        Ejemplo:
+            KLLSketch().extend(range(1, 101)).cuantiles([0.5, 0.9]) -> [50, 90]
+        """
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Los cuantiles deben estar entre 0 y 1")
+        if self.n == 0:
+            return [0 for _ in qs]
+        valores, acumulados = self._tabla()
+        resultado = []
+        for q in qs:
+            if q == 0:
+                resultado.append(self.minimo)
+            elif q == 1:
+                resultado.append(self.maximo)
+            else:
+                i = bisect_left(acumulados, q * self.n)
+                resultado.append(valores[min(i, len(valores) - 1)])
+        return resultado
+
+    def mediana(self):
+        """number: Mediana aproximada, 0 sin datos."""
+        return self.cuantil(0.5)
+
+    def fraccion_hasta(self, x):
+        """
+        Proporción aproximada de valores menores o iguales que x (la función
+        de distribución acumulada), con el mismo error que cuantiles().
+
+        Args:
+            x (number): Valor límite
+
+        Returns:
+            float: Proporción entre 0 y 1; 0 sin datos
+
+        Ejemplo:
+            fraccion_hasta(200) -> 0.97  (el 97% de las latencias es <= 200)
+        """
+        if self.n == 0:
+            return 0
+        valores, acumulados = self._tabla()
+        i = bisect_right(valores, x)
+        return acumulados[i - 1] / self.n if i else 0.0
+
+    def rango(self):
+        """number: Diferencia exacta entre máximo y mínimo, 0 sin datos."""
+        return self.maximo - self.minimo if self.n else 0
+
+    def a_dict(self):
+        """
+        Convierte el bosquejo a un diccionario de tipos básicos (serializable
+        con json si los valores son números).
+
+        Returns:
+            dict: Estado del bosquejo, reconstruible con desde_dict
+        """
+        return {
+            "k": self.k,
+            "n": self.n,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "niveles": [list(nivel) for nivel in self._niveles],
+        }
+
+    @classmethod
+    def desde_dict(cls, datos, semilla=None):
+        """
+        Reconstruye un bosquejo a partir del resultado de a_dict().
+
+        Args:
+            datos (dict): Estado del bosquejo
+            semilla (int): Semilla para las próximas compactaciones
+
+        Returns:
+            KLLSketch: Bosquejo equivalente al original
+
+        Raises:
+            ValueError: Si los pesos de los niveles no suman n
+        """
+        bosquejo = cls(datos["k"], semilla)
+        niveles = [list(nivel) for nivel in datos["niveles"]] or [[]]
+        if sum(len(nivel) << h for h, nivel in enumerate(niveles)) != datos["n"]:
+            raise ValueError("Los niveles del bosquejo no suman n valores")
+        bosquejo.n = datos["n"]
+        bosquejo.minimo = datos["minimo"]
+        bosquejo.maximo = datos["maximo"]
+        bosquejo._niveles = niveles
+        return bosquejo
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        guardados = sum(len(nivel) for nivel in self._niveles)
+        return (
+            f"KLLSketch(k={self.k}, n={self.n}, guardados={guardados}, "
+            f"minimo={self.minimo}, maximo={self.maximo})"
+        )
+
+
+class SpaceSaving:
+    """
+    Valores más frecuentes de un flujo con memoria acotada (algoritmo
+    Space-Saving de Metwally, Agrawal y El Abbadi).
+
+    Mantiene como mucho capacidad contadores. Un valor nuevo con los
+    contadores llenos ocupa el contador del valor con menor conteo y hereda
+    ese conteo (guardado también como su error máximo). Así ningún conteo
+    se subestima, la sobrestimación de cada uno es como mucho n / capacidad y
+    todo valor que aparece más de n / capacidad veces tiene contador.
+
+    El contador mínimo se busca con un montículo que se corrige de forma
+    perezosa: los conteos solo crecen, así que una entrada desactualizada se
+    reinserta con su conteo real cuando llega a la cima.
+
+    Ejemplo:
+        contador = SpaceSaving(capacidad=100)
+        contador.extend(ips)
+        contador.mas_frecuentes(10)
+    """
+
+    def __init__(self, capacidad=100):
+        """
+        Args:
+            capacidad (int): Número máximo de contadores
+
+        Raises:
+            ValueError: Si la capacidad es menor que 1
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad debe ser al menos 1")
+        self.capacidad = capacidad
+        self.n = 0
+        # valor -> [conteo, error, orden de llegada]
+        self._contadores = {}
+        # (conteo, orden, valor); el conteo puede estar desactualizado
+        self._monticulo = []
+        self._orden = 0
+
+    def push(self, x):
+        """
+        Cuenta una aparición de x.
+
+        Args:
+            x: Valor (hashable)
+        """
+        self.extend((x,))
+
+    def extend(self, numeros):
+        """
+        Cuenta todos los valores de un iterable (puede ser un generador sin fin).
+
+        Args:
+            numeros (iterable): Valores hashables
+
+        Returns:
+            SpaceSaving: El propio contador
+        """
+        contadores = self._contadores
+        monticulo = self._monticulo
+        capacidad = self.capacidad
+        n, orden = self.n, self._orden
+        for x in numeros:
+            n += 1
+            entrada = contadores.get(x)
+            if entrada is not None:
+                entrada[0] += 1
+            elif len(contadores) < capacidad:
+                contadores[x] = [1, 0, orden]
+                heapq.heappush(monticulo, (1, orden, x))
+                orden += 1
+            else:
+                while True:
+                    conteo, llegada, valor = monticulo[0]
+                    real = contadores[valor][0]
+                    if real == conteo:
+                        break
+                    heapq.heapreplace(monticulo, (real, llegada, valor))
+                del contadores[valor]
+                contadores[x] = [conteo + 1, conteo, orden]
+                heapq.heapreplace(monticulo, (conteo + 1, orden, x))
+                orden += 1
+        self.n, self._orden = n, orden
+        return self
+
+    def _minimo(self):
+        """Menor conteo si todos los contadores están ocupados; 0 si queda sitio."""
+        if len(self._contadores) < self.capacidad:
+            return 0
+        return min(entrada[0] for entrada in self._contadores.values())
+
+    def merge(self, otro):
+        """
+        Incorpora los conteos de otro contador. Un valor que falta en uno de
+        los dos suma el menor conteo de ese contador (su máximo posible), así
+        que se mantienen las mismas garantías sobre el total de valores.
+
+        Args:
+            otro (SpaceSaving): Contador a incorporar
+
+        Returns:
+            SpaceSaving: El propio contador
+        """
+        minimo_propio, minimo_otro = self._minimo(), otro._minimo()
+        combinados = {}
+        for valor, (conteo, error, _) in self._contadores.items():
+            combinados[valor] = [conteo + minimo_otro, error + minimo_otro]
+        for valor, (conteo, error, _) in otro._contadores.items():
+            entrada = combinados.get(valor)
+            if entrada is None:
+                combinados[valor] = [conteo + minimo_propio, error + minimo_propio]
+            else:
+                entrada[0] += conteo - minimo_otro
+                entrada[1] += error - minimo_otro
+        mejores = heapq.nlargest(self.capacidad, combinados.items(), key=lambda par: par[1][0])
+        self._contadores = {}
+        self._monticulo = []
+        for orden, (valor, (conteo, error)) in enumerate(mejores, self._orden):
+            self._contadores[valor] = [conteo, error, orden]
+            self._monticulo.append((conteo, orden, valor))
+        heapq.heapify(self._monticulo)
+        self._orden += len(mejores)
+        self.n += otro.n
+        return self
+
+    def mas_frecuentes(self, k):
+        """
+        Retorna los k valores con mayor conteo.
+
+        Args:
+            k (int): Número de valores a retornar
+
+        Returns:
+            list: Tuplas (valor, conteo, error) de mayor a menor conteo; el
+                  conteo real está entre conteo - error y conteo
+        """
+        mejores = heapq.nsmallest(
+            k, self._contadores.items(), key=lambda par: (-par[1][0], par[1][2])
+        )
+        return [(valor, conteo, error) for valor, (conteo, error, _) in mejores]
+
+    def conteo(self, valor):
+        """
+        Conteo estimado de un valor (nunca menor que el real).
+
+        Returns:
+            int: Conteo del valor, o la cota máxima si no tiene contador
+        """
+        entrada = self._contadores.get(valor)
+        return entrada[0] if entrada is not None else self._minimo()
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return f"SpaceSaving(capacidad={self.capacidad}, n={self.n}, contadores={len(self._contadores)})"
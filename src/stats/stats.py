@@ -1,4 +1,326 @@
+import random
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict, deque
+from itertools import islice, repeat
+from math import fsum, sqrt
+from operator import eq, lt, sub
+
+from src.stats.dataset import Dataset
+from src.stats.histogram import Histogram
+from src.stats.running import RunningCovariance
+from src.stats.sketch import SpaceSaving
+
+# Tamaño de segmento por debajo del cual la selección ordena directamente
+_SEGMENTO_MINIMO = 32
+# Tamaño a partir del cual se acota cada posición con una muestra (Floyd-Rivest)
+_UMBRAL_MUESTREO = 4096
+# Marca de fin de un iterador
+_FIN = object()
+
+
+def _particionar(datos, inicio, fin, pivote):
+    """
+    Partición de tres vías en el sitio (bandera holandesa de Dijkstra) de
+    datos[inicio:fin], intercambiando elementos sin listas auxiliares.
+
+    Returns:
+        tuple: (a, b) con los menores que el pivote en inicio:a, los iguales en
+               a:b y los mayores en b:fin, o None si algún valor no se puede
+               comparar con el pivote (como NaN)
+    """
+    a = i = inicio
+    b = fin
+    while i < b:
+        x = datos[i]
+        if x < pivote:
+            datos[i] = datos[a]
+            datos[a] = x
+            a += 1
+            i += 1
+        elif x > pivote:
+            b -= 1
+            datos[i] = datos[b]
+            datos[b] = x
+        elif x == pivote:
+            i += 1
+        else:
+            return None
+    return a, b
+
+
+def _introselect(datos, rangos):
+    """
+    Reordena datos en el sitio para que cada posición k de rangos contenga el
+    valor que tendría si la lista estuviera ordenada.
+
+    Particiona en el sitio en tres grupos (menores, iguales y mayores que un
+    pivote mediana de tres) y solo sigue por los grupos que contienen alguna
+    posición pedida, con coste O(n) esperado y sin copiar los segmentos. Si el
+    segmento es pequeño, o la recursión se profundiza demasiado o hay valores
+    no comparables, ordena el segmento.
+    """
+    limite = 2 * max(1, len(datos)).bit_length()
+    pendientes = [(0, len(datos), sorted(set(rangos)), 0)]
+    while pendientes:
+        inicio, fin, rangos, profundidad = pendientes.pop()
+        if fin - inicio <= _SEGMENTO_MINIMO or profundidad > limite:
+            datos[inicio:fin] = sorted(datos[inicio:fin])
+            continue
+        pivote = sorted((datos[inicio], datos[(inicio + fin) // 2], datos[fin - 1]))[1]
+        limites = _particionar(datos, inicio, fin, pivote)
+        if limites is None:
+            datos[inicio:fin] = sorted(datos[inicio:fin])
+            continue
+        a, b = limites
+        izquierda = [k for k in rangos if k < a]
+        derecha = [k for k in rangos if k >= b]
+        if izquierda:
+            pendientes.append((inicio, a, izquierda, profundidad + 1))
+        if derecha:
+            pendientes.append((b, fin, derecha, profundidad + 1))
+
+
+def _seleccionar(numeros, rangos, en_sitio=False):
+    """
+    Retorna {k: valor} con el valor que ocuparía cada posición k de rangos si
+    la lista estuviera ordenada, sin ordenarla.
+
+    Con listas grandes primero acota cada grupo de posiciones cercanas con una
+    muestra ordenada (como Floyd-Rivest): por cada grupo, una pasada cuenta
+    los valores por debajo de la banda (sumando un mapa en C, sin crear una
+    lista) y otra extrae la banda, y solo se ordena la banda, que es pequeña.
+    Esto no modifica ni copia la lista. Las posiciones que la muestra
+    no logra acotar se resuelven con introselect sobre una copia (o sobre la
+    propia lista si en_sitio es True).
+    """
+    rangos = sorted(set(rangos))
+    n = len(numeros)
+    valores = {}
+    if n >= _UMBRAL_MUESTREO:
+        tamano = int(n**0.5)
+        muestra = sorted(random.Random(n).sample(numeros, tamano))
+        margen = int(2.5 * tamano**0.5) + 1
+        # Se agrupan las posiciones cuyas ventanas de la muestra se solapan
+        grupos = []
+        for k in rangos:
+            centro = k * tamano // n
+            desde, hasta = max(0, centro - margen), min(tamano - 1, centro + margen)
+            if grupos and desde <= grupos[-1][1]:
+                grupos[-1][1] = hasta
+                grupos[-1][2].append(k)
+            else:
+                grupos.append([desde, hasta, [k]])
+        for desde, hasta, ks in grupos:
+            bajo, alto = muestra[desde], muestra[hasta]
+            menores = sum(map(lt, numeros, repeat(bajo)))
+            banda = [x for x in numeros if bajo <= x <= alto]
+            banda.sort()
+            for k in ks:
+                if menores <= k < menores + len(banda):
+                    valores[k] = banda[k - menores]
+        rangos = [k for k in rangos if k not in valores]
+    if rangos:
+        datos = numeros if en_sitio and isinstance(numeros, list) else list(numeros)
+        _introselect(datos, rangos)
+        for k in rangos:
+            valores[k] = datos[k]
+    return valores
+
+
+def _moda_de_conteo(conteo):
+    """Primer valor (en orden de aparición) con el conteo máximo de un Counter."""
+    maximo = max(conteo.values())
+    return next(valor for valor, veces in conteo.items() if veces == maximo)
+
+
+def _resumir_serie(serie):
+    """
+    Las estadísticas de describe() para una serie, compartiendo los cálculos.
+    Recorre la serie en pasadas con bucles en C: una fsum para el promedio,
+    otra fsum de los cuadrados de las desviaciones (generadas al vuelo, sin
+    guardarlas en una lista) para la varianza, una ordenación para mediana,
+    mínimo y máximo, una comparación de vecinos ordenados y, solo si hay
+    valores repetidos, un conteo para la moda.
+    """
+    n = len(serie)
+    if not n:
+        return {
+            "n": 0, "promedio": 0, "mediana": 0, "moda": None,
+            "desviacion_estandar": 0, "varianza": 0, "rango": 0,
+            "minimo": None, "maximo": None,
+        }
+    media = fsum(serie) / n
+    varianza = fsum(map(pow, map(sub, serie, repeat(media, n)), repeat(2))) / n
+    ordenados = sorted(serie)
+    mitad = n // 2
+    minimo, maximo = ordenados[0], ordenados[-1]
+    # Sin valores repetidos (ningún par de vecinos ordenados es igual) todos
+    # empatan y la moda es el primer valor, sin contar
+    repetidos = any(map(eq, ordenados, islice(ordenados, 1, None)))
+    moda = _moda_de_conteo(Counter(serie)) if repetidos else serie[0]
+    return {
+        "n": n,
+        "promedio": media,
+        "mediana": ordenados[mitad] if n % 2 else (ordenados[mitad - 1] + ordenados[mitad]) / 2,
+        "moda": moda,
+        "desviacion_estandar": sqrt(varianza),
+        "varianza": varianza,
+        "rango": maximo - minimo,
+        "minimo": minimo,
+        "maximo": maximo,
+    }
+
+
+def _momentos_moviles(numeros, ventana):
+    """
+    Genera (media, varianza) de cada ventana. Cada paso suma el valor que
+    entra y quita el que sale en O(1) (Welford con ventana deslizante); cada
+    ventana pasos se recalculan la media y m2 desde la ventana para que los
+    errores de redondeo no se acumulen.
+    """
+    iterador = iter(numeros)
+    valores = deque(islice(iterador, ventana))
+    if len(valores) < ventana:
+        return
+    media = fsum(valores) / ventana
+    m2 = fsum((x - media) ** 2 for x in valores)
+    yield media, m2 / ventana
+    pasos = 0
+    for x in iterador:
+        y = valores.popleft()
+        valores.append(x)
+        pasos += 1
+        if pasos == ventana:
+            pasos = 0
+            media = fsum(valores) / ventana
+            m2 = fsum((v - media) ** 2 for v in valores)
+        else:
+            anterior = media
+            media += (x - y) / ventana
+            m2 += (x - y) * (x - media + y - anterior)
+        yield media, max(m2, 0.0) / ventana
+
+
+def _extremos_moviles(numeros, ventana):
+    """
+    Genera (mínimo, máximo) de cada ventana con dos colas monótonas de
+    posiciones: cada valor entra y sale de cada cola una sola vez, así que
+    el coste es O(1) amortizado por paso.
+    """
+    menores = deque()
+    mayores = deque()
+    for i, x in enumerate(numeros):
+        while menores and menores[-1][1] >= x:
+            menores.pop()
+        menores.append((i, x))
+        while mayores and mayores[-1][1] <= x:
+            mayores.pop()
+        mayores.append((i, x))
+        inicio = i - ventana + 1
+        if inicio < 0:
+            continue
+        if menores[0][0] < inicio:
+            menores.popleft()
+        if mayores[0][0] < inicio:
+            mayores.popleft()
+        yield menores[0][1], mayores[0][1]
+
+
+def _medianas_moviles(numeros, ventana):
+    """
+    Genera la mediana de cada ventana manteniendo la ventana ordenada: cada
+    paso inserta y quita un valor con búsqueda binaria (O(log w) comparaciones
+    y un desplazamiento de memoria en C).
+    """
+    iterador = iter(numeros)
+    valores = deque(islice(iterador, ventana))
+    if len(valores) < ventana:
+        return
+    ordenados = sorted(valores)
+    mitad = ventana // 2
+    par = ventana % 2 == 0
+    while True:
+        yield (ordenados[mitad - 1] + ordenados[mitad]) / 2 if par else ordenados[mitad]
+        x = next(iterador, _FIN)
+        if x is _FIN:
+            return
+        del ordenados[bisect_left(ordenados, valores.popleft())]
+        valores.append(x)
+        insort(ordenados, x)
+
+
+def _comomentos(xs, ys):
+    """RunningCovariance de dos series: en bloque si son secuencias, par a par si no."""
+    if hasattr(xs, "__len__") and hasattr(ys, "__len__"):
+        return RunningCovariance.desde_secuencias(xs, ys)
+    return RunningCovariance(zip(xs, ys, strict=True))
+
+
+def _validar_ventana(ventana):
+    if ventana < 1:
+        raise ValueError("La ventana debe ser al menos 1")
+
+
 class Stats:
+    def __init__(self, capacidad_cache=0):
+        """
+        Args:
+            capacidad_cache (int): Número de Dataset cuyas estadísticas se
+                guardan (caché LRU). Con 0, el valor por defecto, no hay caché.
+        """
+        self.capacidad_cache = capacidad_cache
+        # id(dataset) -> (dataset, descripción); guardar el dataset impide que su id se reutilice
+        self._cache = OrderedDict()
+
+    def _guardada(self, numeros):
+        """Descripción de un Dataset en caché (la calcula si hace falta), o None."""
+        if not self.capacidad_cache or not isinstance(numeros, Dataset):
+            return None
+        entrada = self._cache.get(id(numeros))
+        if entrada is not None and entrada[0] is numeros:
+            self._cache.move_to_end(id(numeros))
+            return entrada[1]
+        descripcion = _resumir_serie(numeros)
+        self._cache[id(numeros)] = (numeros, descripcion)
+        while len(self._cache) > self.capacidad_cache:
+            self._cache.popitem(last=False)
+        return descripcion
+
+    def limpiar_cache(self):
+        """Elimina todas las descripciones guardadas."""
+        self._cache.clear()
+
+    def describe(self, numeros):
+        """
+        Calcula todas las estadísticas descriptivas compartiendo los cálculos
+        intermedios: una suma (fsum) para el promedio y la varianza, una
+        ordenación para la mediana, el mínimo, el máximo y el rango, y una
+        pasada de conteo para la moda, que se omite si no hay valores
+        repetidos.
+
+        Si la instancia tiene caché (capacidad_cache > 0) y numeros es un
+        Dataset, el resultado se guarda: las siguientes llamadas con el mismo
+        Dataset, a describe() o a promedio, mediana, moda, varianza,
+        desviacion_estandar y rango, cuestan O(1).
+
+        Args:
+            numeros (list | Dataset): Lista de números
+
+        Returns:
+            dict: Claves n, promedio, mediana, moda, desviacion_estandar,
+                  varianza, rango, minimo y maximo. Sin datos siguen las
+                  mismas convenciones que el resto de métodos (minimo y
+                  maximo son None).
+
+        Ejemplo:
+            describe([1, 2, 2, 3, 4]) -> {"n": 5, "promedio": 2.4, "mediana": 2,
+                                          "moda": 2, ..., "rango": 3, "minimo": 1, "maximo": 4}
+        """
+        descripcion = self._guardada(numeros)
+        if descripcion is None:
+            descripcion = _resumir_serie(numeros)
+        return dict(descripcion)
+
     def promedio(self, numeros):
         """
         Calcula la media aritmética de una lista de números.
@@ -12,17 +334,24 @@ class Stats:
         Ejemplo:
             promedio([1, 2, 3, 4, 5]) -> 3.0
         """
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["promedio"]
         if not numeros:
             return 0
         return sum(numeros) / len(numeros)
 
-    def mediana(self, numeros):
+    def mediana(self, numeros, en_sitio=False):
         """
         Encuentra el valor mediano de una lista de números.
         Para listas con número par de elementos, retorna el promedio de los dos valores centrales.
 
+        Usa selección en lugar de ordenar toda la lista, con coste O(n).
+
         Args:
             numeros (list): Lista de números
+            en_sitio (bool): Si es True, cuando hace falta particionar se reordena
+                             la lista recibida en lugar de copiarla
 
         Returns:
             float: El valor mediano
@@ -31,22 +360,77 @@ class Stats:
             mediana([1, 2, 3, 4, 5]) -> 3.0
             mediana([1, 2, 3, 4]) -> 2.5
         """
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["mediana"]
         if not numeros:
             return 0
-        numeros_ord = sorted(numeros)
-        n = len(numeros_ord)
+        n = len(numeros)
         if n % 2 == 1:
-            return numeros_ord[n // 2]
+            return _seleccionar(numeros, [n // 2], en_sitio)[n // 2]
         else:
-            return (numeros_ord[n // 2 - 1] + numeros_ord[n // 2]) / 2
+            valores = _seleccionar(numeros, [n // 2 - 1, n // 2], en_sitio)
+            return (valores[n // 2 - 1] + valores[n // 2]) / 2
+
+    def cuantiles(self, numeros, qs, en_sitio=False):
+        """
+        Calcula varios cuantiles (por ejemplo p50, p90 y p99) con una sola
+        selección múltiple, sin ordenar toda la lista. Con listas grandes
+        cuesta dos pasadas por cada grupo de cuantiles cercanos.
+        Entre dos posiciones se interpola linealmente: el cuantil q está en la
+        posición (n - 1) * q de los datos ordenados.
+
+        Args:
+            numeros (list): Lista de números
+            qs (list): Cuantiles a calcular, cada uno entre 0 y 1
+            en_sitio (bool): Si es True, cuando hace falta particionar se reordena
+                             la lista recibida en lugar de copiarla
+
+        Returns:
+            list: Un valor por cada cuantil de qs, en el mismo orden.
+                  Con la lista vacía, cada valor es 0.
+
+        Raises:
+            ValueError: Si algún cuantil está fuera de [0, 1]
+
+        Ejemplo:
+            cuantiles([1, 2, 3, 4, 5], [0, 0.5, 0.9]) -> [1, 3, 4.6]
+        """
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Los cuantiles deben estar entre 0 y 1")
+        if not numeros:
+            return [0 for _ in qs]
+        n = len(numeros)
+        posiciones = []
+        rangos = []
+        for q in qs:
+            h = (n - 1) * q
+            k = int(h)
+            posiciones.append((k, h - k))
+            rangos.append(k)
+            if h > k:
+                rangos.append(k + 1)
+        datos = _seleccionar(numeros, rangos, en_sitio)
+        resultado = []
+        for k, fraccion in posiciones:
+            if fraccion:
+                resultado.append(datos[k] + fraccion * (datos[k + 1] - datos[k]))
+            else:
+                resultado.append(datos[k])
+        return resultado
 
     def moda(self, numeros):
         """
         Encuentra el valor que aparece con mayor frecuencia en la lista.
         Si hay empate, retorna el primer valor encontrado.
 
+        Recorre los datos una sola vez, así que también acepta un iterador o
+        generador. El Counter conserva el orden de primera aparición, que es
+        el que decide los empates.
+
         Args:
-            numeros (list): Lista de números
+            numeros (iterable): Lista (o iterable) de números
 
         Returns:
             number: El valor más frecuente
@@ -54,16 +438,45 @@ class Stats:
         Ejemplo:
             moda([1, 2, 2, 3, 3, 3]) -> 3
         """
-        if not numeros:
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["moda"]
+        conteo = Counter(numeros)
+        if not conteo:
             return None
-        conteo = {}
-        for num in numeros:
-            conteo[num] = conteo.get(num, 0) + 1
-        max_frecuencia = max(conteo.values())
-        for num in numeros:
-            if conteo[num] == max_frecuencia:
-                return num
-        return None
+        return _moda_de_conteo(conteo)
+
+    def mas_frecuentes(self, numeros, k, capacidad=None):
+        """
+        Encuentra los k valores más frecuentes de un iterable, que puede ser un
+        flujo sin fin, con memoria acotada (algoritmo Space-Saving).
+
+        Solo se guardan capacidad contadores. Si hay como mucho capacidad
+        valores distintos el resultado es exacto; si no, cada conteo puede
+        sobrestimar el real en como mucho n / capacidad, y todo valor que
+        aparece más de n / capacidad veces está en el resultado.
+
+        Args:
+            numeros (iterable): Valores a contar
+            k (int): Número de valores a retornar
+            capacidad (int): Contadores a mantener. Por defecto 10 * k
+
+        Returns:
+            list: Tuplas (valor, conteo) de mayor a menor conteo; los empates
+                  en orden de primera aparición
+
+        Raises:
+            ValueError: Si k es menor que 1 o capacidad es menor que k
+
+        Ejemplo:
+            mas_frecuentes([1, 2, 2, 3, 3, 3], 2) -> [(3, 3), (2, 2)]
+        """
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        contador = SpaceSaving(10 * k if capacidad is None else capacidad)
+        if contador.capacidad < k:
+            raise ValueError("La capacidad debe ser al menos k")
+        return [(valor, conteo) for valor, conteo, _ in contador.extend(numeros).mas_frecuentes(k)]
 
     def desviacion_estandar(self, numeros):
         """
@@ -79,6 +492,9 @@ class Stats:
         Ejemplo:
             desviacion_estandar([1, 2, 3, 4, 5]) -> 1.41...
         """
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["desviacion_estandar"]
         if not numeros:
             return 0
         media = sum(numeros) / len(numeros)
@@ -99,6 +515,9 @@ class Stats:
         Ejemplo:
             varianza([1, 2, 3, 4, 5]) -> 2.0
         """
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["varianza"]
         if not numeros:
             return 0
         media = sum(numeros) / len(numeros)
@@ -117,6 +536,275 @@ class Stats:
         Ejemplo:
             rango([1, 5, 3, 9, 2]) -> 8
         """
+        guardada = self._guardada(numeros)
+        if guardada is not None:
+            return guardada["rango"]
         if not numeros:
             return 0
         return max(numeros) - min(numeros)
+
+    def resumen_lote(self, series, longitud=None):
+        """
+        Calcula promedio, mediana, moda, desviacion_estandar, varianza y rango
+        de muchas series con una sola llamada.
+
+        Cada serie se recorre con map() y fsum, que hacen el bucle en C, en
+        lugar de una expresión generadora por estadística. Las sumas con
+        fsum son más precisas que las de sum(), así que promedio y varianza
+        pueden diferir de los de Stats en el último decimal.
+
+        Args:
+            series (iterable | array | memoryview): Lista de series (listas,
+                arrays o memoryviews), o una columna plana de valores si se
+                indica longitud
+            longitud (int): Si se indica, series es una columna plana (por
+                ejemplo un array('d')) que se divide en series consecutivas de
+                esta longitud sin copiarla; la última puede ser más corta
+
+        Returns:
+            list: Un diccionario por serie con las mismas claves que
+                  describe(). Una serie vacía sigue las mismas convenciones
+                  que el resto de métodos.
+
+        Raises:
+            ValueError: Si longitud es menor que 1
+
+        Ejemplo:
+            resumen_lote([[1, 2, 3], [4, 4, 10]])[1]["moda"] -> 4
+            resumen_lote(array("d", [1, 2, 3, 4]), longitud=2)[0]["promedio"] -> 1.5
+        """
+        if longitud is not None:
+            if longitud < 1:
+                raise ValueError("La longitud debe ser al menos 1")
+            columna = series if isinstance(series, (list, tuple)) else memoryview(series)
+            series = (columna[i:i + longitud] for i in range(0, len(columna), longitud))
+        return [_resumir_serie(serie) for serie in series]
+
+    def promedio_movil(self, numeros, ventana):
+        """
+        Genera la media de cada ventana de tamaño ventana, actualizándola en
+        O(1) por paso sin copiar la ventana.
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Una media por ventana completa (len(numeros) - ventana + 1
+                       valores; ninguno si la serie es más corta que la ventana)
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(promedio_movil([1, 2, 3, 4, 5], 3)) -> [2.0, 3.0, 4.0]
+        """
+        _validar_ventana(ventana)
+        return (media for media, _ in _momentos_moviles(numeros, ventana))
+
+    def varianza_movil(self, numeros, ventana):
+        """
+        Genera la varianza (poblacional) de cada ventana en O(1) por paso.
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Una varianza por ventana completa
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(varianza_movil([1, 2, 3, 5], 2)) -> [0.25, 0.25, 1.0]
+        """
+        _validar_ventana(ventana)
+        return (varianza for _, varianza in _momentos_moviles(numeros, ventana))
+
+    def desviacion_estandar_movil(self, numeros, ventana):
+        """
+        Genera la desviación estándar (poblacional) de cada ventana en O(1) por paso.
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Una desviación estándar por ventana completa
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+        """
+        _validar_ventana(ventana)
+        return (sqrt(varianza) for _, varianza in _momentos_moviles(numeros, ventana))
+
+    def minimo_movil(self, numeros, ventana):
+        """
+        Genera el mínimo de cada ventana con una cola monótona (O(1) amortizado por paso).
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Un mínimo por ventana completa
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(minimo_movil([4, 2, 5, 1, 3], 2)) -> [2, 2, 1, 1]
+        """
+        _validar_ventana(ventana)
+        return (minimo for minimo, _ in _extremos_moviles(numeros, ventana))
+
+    def maximo_movil(self, numeros, ventana):
+        """
+        Genera el máximo de cada ventana con una cola monótona (O(1) amortizado por paso).
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Un máximo por ventana completa
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(maximo_movil([4, 2, 5, 1, 3], 2)) -> [4, 5, 5, 3]
+        """
+        _validar_ventana(ventana)
+        return (maximo for _, maximo in _extremos_moviles(numeros, ventana))
+
+    def rango_movil(self, numeros, ventana):
+        """
+        Genera el rango (máximo - mínimo) de cada ventana.
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Un rango por ventana completa
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(rango_movil([4, 2, 5, 1, 3], 2)) -> [2, 3, 4, 2]
+        """
+        _validar_ventana(ventana)
+        return (maximo - minimo for minimo, maximo in _extremos_moviles(numeros, ventana))
+
+    def mediana_movil(self, numeros, ventana):
+        """
+        Genera la mediana de cada ventana. La ventana se mantiene ordenada y en
+        cada paso se inserta y se quita un valor con búsqueda binaria, en lugar
+        de ordenar cada ventana.
+
+        Args:
+            numeros (iterable): Serie de números (puede ser un generador)
+            ventana (int): Tamaño de la ventana
+
+        Returns:
+            generator: Una mediana por ventana completa, con la misma
+                       convención que mediana() para ventanas pares
+
+        Raises:
+            ValueError: Si ventana es menor que 1
+
+        Ejemplo:
+            list(mediana_movil([5, 1, 4, 2, 3], 3)) -> [4, 2, 3]
+        """
+        _validar_ventana(ventana)
+        return _medianas_moviles(numeros, ventana)
+
+    def histograma(self, numeros, cubetas=10):
+        """
+        Reparte los números en cubetas del mismo ancho entre el mínimo y el
+        máximo. Para escalas logarítmicas, por cuantiles o datos que no caben
+        en memoria, se puede usar Histogram directamente.
+
+        Args:
+            numeros (list): Lista de números
+            cubetas (int): Número de cubetas
+
+        Returns:
+            Histogram: Histograma con los números contados; None si la lista está vacía
+
+        Raises:
+            ValueError: Si cubetas es menor que 1
+
+        Ejemplo:
+            histograma([1, 2, 2, 3, 9], cubetas=4).conteos -> array('Q', [3, 1, 0, 1])
+        """
+        if not numeros:
+            return None
+        minimo, maximo = min(numeros), max(numeros)
+        if minimo == maximo:
+            maximo = minimo + 1
+        return Histogram.ancho_fijo(minimo, maximo, cubetas).extend(numeros)
+
+    def covarianza(self, xs, ys):
+        """
+        Calcula la covarianza poblacional de dos series emparejadas.
+
+        Args:
+            xs (iterable): Valores de x (lista o iterable)
+            ys (iterable): Valores de y, en el mismo orden
+
+        Returns:
+            float: La covarianza, 0 sin datos
+
+        Raises:
+            ValueError: Si las series tienen distinta longitud
+
+        Ejemplo:
+            covarianza([1, 2, 3], [2, 4, 6]) -> 1.333...
+        """
+        return _comomentos(xs, ys).covarianza()
+
+    def correlacion(self, xs, ys):
+        """
+        Calcula el coeficiente de correlación de Pearson de dos series emparejadas.
+
+        Para series que no caben en memoria o llegan por bloques se puede usar
+        RunningCovariance directamente y combinar los bloques con merge().
+
+        Args:
+            xs (iterable): Valores de x (lista o iterable)
+            ys (iterable): Valores de y, en el mismo orden
+
+        Returns:
+            float: Correlación entre -1 y 1
+
+        Raises:
+            ValueError: Si las series tienen distinta longitud o una es constante
+
+        Ejemplo:
+            correlacion([1, 2, 3], [2, 4, 6]) -> 1.0
+        """
+        return _comomentos(xs, ys).correlacion()
+
+    def regresion_lineal(self, xs, ys):
+        """
+        Calcula la recta de mínimos cuadrados y = pendiente * x + intercepto.
+
+        Args:
+            xs (iterable): Valores de x (lista o iterable)
+            ys (iterable): Valores de y, en el mismo orden
+
+        Returns:
+            tuple: (pendiente, intercepto)
+
+        Raises:
+            ValueError: Si las series tienen distinta longitud o x es constante
+
+        Ejemplo:
+            regresion_lineal([1, 2, 3], [3, 5, 7]) -> (2.0, 1.0)
+        """
+        return _comomentos(xs, ys).regresion()
+
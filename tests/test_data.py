@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from src.data.data import Data
 
@@ -44,7 +46,23 @@ class TestData:
         assert self.data.merge_ordenado([], []) == []
         # Test con listas con elementos repetidos
         assert self.data.merge_ordenado([1, 2, 3], [1, 3, 5]) == [1, 1, 2, 3, 3, 5]
-    
+        # Test de estabilidad: con iguales, primero los de la primera lista
+        resultado = self.data.merge_ordenado([1.0, 2.0], [1, 2, 3])
+        assert [type(x) for x in resultado] == [float, int, float, int, int]
+
+    def test_merge_k(self):
+        # Test con generadores de distinta longitud
+        fuentes = [iter([1, 4, 7]), (x for x in [2, 5]), [], [0, 3, 6, 9]]
+        resultado = self.data.merge_k(fuentes)
+        assert next(resultado) == 0
+        assert list(resultado) == [1, 2, 3, 4, 5, 6, 7, 9]
+        # Test sin secuencias
+        assert list(self.data.merge_k([])) == []
+        # Test perezoso con una secuencia infinita
+        pares = (2 * i for i in range(10**18))
+        primeros = [x for _, x in zip(range(5), self.data.merge_k([pares, [1, 3]]))]
+        assert primeros == [0, 1, 2, 3, 4]
+
     def test_rotar_lista(self):
         # Test con rotación positiva
         assert self.data.rotar_lista([1, 2, 3, 4, 5], 2) == [4, 5, 1, 2, 3]
@@ -78,7 +96,37 @@ class TestData:
         assert self.data.es_subconjunto([1, 2, 3], [1, 2, 3]) == True
         # Test con conjunto vacío
         assert self.data.es_subconjunto([], [1, 2, 3]) == True
-    
+        # Test con elementos no hashables
+        assert self.data.es_subconjunto([[1], "a"], ["a", [2], [1]]) == True
+        assert self.data.es_subconjunto([[3]], ["a", [2], [1]]) == False
+        # Test con un índice ordenado de conjunto2
+        grande = list(range(0, 200_000, 2))
+        indice = self.data.indice_lista(grande, ordenada=True)
+        assert self.data.es_subconjunto(list(range(0, 100_000, 4)), grande, indice) == True
+        assert self.data.es_subconjunto([4, 7], grande, indice) == False
+        with pytest.raises(ValueError):
+            self.data.es_subconjunto([1], [1], indice)
+
+    def test_buscar_con_indice(self):
+        lista = [10, 20, 30, 20, [1, 2], 50, [1, 2]]
+        indice = self.data.indice_lista(lista)
+        # Test con los mismos resultados que la búsqueda sin índice
+        for elemento in (10, 20, 50, 60, [1, 2], [3]):
+            assert self.data.buscar_elemento(lista, elemento, indice) == self.data.buscar_elemento(lista, elemento)
+        assert 30 in indice
+        assert [3] not in indice
+        # Test de invalidar tras cambiar la lista
+        lista[0] = 99
+        indice.invalidar()
+        assert self.data.buscar_elemento(lista, 99, indice) == 0
+        # Test con una lista ordenada
+        ordenada = [[0], [1], [1], [2]]
+        indice = self.data.indice_lista(ordenada, ordenada=True)
+        assert self.data.buscar_elemento(ordenada, [1], indice) == 1
+        assert self.data.buscar_elemento(ordenada, [3], indice) == -1
+        with pytest.raises(ValueError):
+            self.data.buscar_elemento([10], 10, indice)
+
     def test_implementar_pila(self):
         pila = self.data.implementar_pila()
         # Test de pila vacía
@@ -93,6 +141,40 @@ class TestData:
         assert pila["pop"]() == 1
         assert pila["is_empty"]() == True
     
+    def test_implementar_pila_concurrente(self):
+        pila = self.data.implementar_pila(modo="hilos", capacidad=2)
+        pila["push"](1)
+        pila["push"](2)
+        assert pila["peek"]() == 2
+        assert pila["pop"]() == 2
+        assert pila["pop"]() == 1
+        assert pila["is_empty"]() == True
+        with pytest.raises(TimeoutError):
+            pila["pop"](timeout=0.01)
+        with pytest.raises(ValueError):
+            self.data.implementar_pila(modo="procesos")
+        # Test con los mismos argumentos posicionales que implementar_cola
+        pila = self.data.implementar_pila(1, "hilos")
+        cola = self.data.implementar_cola(1, "hilos")
+        pila["push"]("a")
+        cola["enqueue"]("a")
+        with pytest.raises(TimeoutError):
+            pila["push"]("b", timeout=0)
+        with pytest.raises(TimeoutError):
+            cola["enqueue"]("b", timeout=0)
+
+    def test_implementar_cola_asyncio(self):
+        cola = self.data.implementar_cola(capacidad=2, modo="asyncio")
+
+        async def principal():
+            await cola["enqueue"]("a")
+            await cola["enqueue_many"](["b"])
+            assert cola["is_full"]() == True
+            return [await cola["dequeue"](), await cola["dequeue"]()]
+
+        assert asyncio.run(principal()) == ["a", "b"]
+        assert cola["is_empty"]() == True
+
     def test_implementar_cola(self):
         cola = self.data.implementar_cola()
         # Test de cola vacía
@@ -106,6 +188,29 @@ class TestData:
         assert cola["dequeue"]() == 1
         assert cola["dequeue"]() == 2
         assert cola["is_empty"]() == True
+        # Test de dequeue con la cola vacía
+        assert cola["dequeue"]() == None
+        # Test de operaciones por lotes
+        assert cola["enqueue_many"](range(5)) == 5
+        assert cola["dequeue_many"](3) == [0, 1, 2]
+        assert cola["dequeue_many"](10) == [3, 4]
+        assert cola["dequeue_many"](2) == []
+
+    def test_implementar_cola_con_capacidad(self):
+        cola = self.data.implementar_cola(capacidad=3)
+        assert cola["enqueue"]("a") == True
+        # enqueue_many solo consume lo que cabe
+        elementos = iter(["b", "c", "d", "e"])
+        assert cola["enqueue_many"](elementos) == 2
+        assert next(elementos) == "d"
+        assert cola["is_full"]() == True
+        assert cola["enqueue"]("x") == False
+        assert cola["enqueue_many"](["y"]) == 0
+        assert cola["dequeue"]() == "a"
+        assert cola["enqueue"]("x") == True
+        assert cola["dequeue_many"](5) == ["b", "c", "x"]
+        with pytest.raises(ValueError):
+            self.data.implementar_cola(capacidad=0)
     
     def test_matriz_transpuesta(self):
         # Test con matriz 2x3
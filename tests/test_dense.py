@@ -0,0 +1,80 @@
+import pytest
+from src.matrix.dense import DenseMatrix, tipo_para
+from src.matrix.matrix import Matrix
+
+
+class TestDenseMatrix:
+    def setup_method(self):
+        self.matrix = Matrix()
+
+    def test_tipo_para(self):
+        # Test con enteros
+        assert tipo_para([1, 2, 3]) == "q"
+        # Test con decimales
+        assert tipo_para([1, 2.5]) == "d"
+        # Test con enteros que no caben en 64 bits
+        assert tipo_para([2**70]) == "d"
+
+    def test_desde_lista_y_a_lista(self):
+        # Test de ida y vuelta con enteros
+        M = DenseMatrix.desde_lista([[1, 2, 3], [4, 5, 6]])
+        assert M.forma == (2, 3)
+        assert M.tipo == "q"
+        assert M.a_lista() == [[1, 2, 3], [4, 5, 6]]
+        # Test con decimales
+        assert DenseMatrix.desde_lista([[1.5, 2]]).tipo == "d"
+        # Test de indexación como lista de listas
+        assert M[1][2] == 6
+        assert len(M) == 2
+        # Test con filas de distinta longitud
+        with pytest.raises(ValueError):
+            DenseMatrix.desde_lista([[1, 2], [3]])
+
+    def test_transpuesta_comparte_buffer(self):
+        M = DenseMatrix.desde_lista([[1, 2, 3], [4, 5, 6]])
+        T = self.matrix.transpuesta(M)
+        assert T.datos is M.datos
+        assert T.a_lista() == [[1, 4], [2, 5], [3, 6]]
+        assert T.transpuesta().a_lista() == M.a_lista()
+
+    def test_operaciones_elemento_a_elemento(self):
+        A = DenseMatrix.desde_lista([[1, 2], [3, 4]])
+        B = DenseMatrix.desde_lista([[5, 6], [7, 8]])
+        # Test de suma y resta
+        assert self.matrix.suma_matrices(A, B).a_lista() == [[6, 8], [10, 12]]
+        assert self.matrix.resta_matrices(A, B).a_lista() == [[-4, -4], [-4, -4]]
+        # Test mezclando DenseMatrix y lista
+        assert self.matrix.suma_matrices(A, [[1, 1], [1, 1]]).a_lista() == [[2, 3], [4, 5]]
+        # Test con escalar entero y decimal
+        assert self.matrix.multiplicar_escalar(A, 3).a_lista() == [[3, 6], [9, 12]]
+        assert self.matrix.multiplicar_escalar(A, 0.5).tipo == "d"
+        # Test con matriz transpuesta (no contigua)
+        assert self.matrix.suma_matrices(A.transpuesta(), A).a_lista() == [[2, 5], [5, 8]]
+        # Test con dimensiones incompatibles
+        with pytest.raises(ValueError):
+            self.matrix.suma_matrices(A, DenseMatrix.desde_lista([[1, 2]]))
+
+    def test_otros_metodos_de_matrix(self):
+        A = DenseMatrix.desde_lista([[1, 2], [3, 4]])
+        B = DenseMatrix.desde_lista([[5, 6], [7, 8]])
+        assert self.matrix.multiplicar_matrices(A, B).a_lista() == [[19, 22], [43, 50]]
+        assert self.matrix.traza(A) == 5
+        assert self.matrix.diagonal(A) == [1, 4]
+        assert self.matrix.es_simetrica(A) == False
+        assert self.matrix.buscar_en_matriz(A, 3) == [(1, 0)]
+        # Test de que las operaciones que retornan matrices retornan DenseMatrix
+        assert self.matrix.rotar_90(A).a_lista() == [[3, 1], [4, 2]]
+        assert self.matrix.rotar_90(DenseMatrix.desde_lista([[1.5, 2]])).tipo == "d"
+        assert self.matrix.potencia(A, 2).a_lista() == [[7, 10], [15, 22]]
+        assert self.matrix.potencia(A, 0).a_lista() == [[1, 0], [0, 1]]
+
+    def test_desbordamiento(self):
+        # Test de productos enteros que no caben en 64 bits (no pasan a coma flotante)
+        with pytest.raises(OverflowError):
+            self.matrix.multiplicar_matrices(DenseMatrix.desde_lista([[2**40]]), [[2**40]])
+        with pytest.raises(OverflowError):
+            self.matrix.potencia(DenseMatrix.desde_lista([[2**40]]), 2)
+        with pytest.raises(OverflowError):
+            self.matrix.suma_matrices(DenseMatrix.desde_lista([[2**62]]), [[2**62]])
+        # Test con decimales (no hay desbordamiento)
+        assert self.matrix.multiplicar_matrices(DenseMatrix.desde_lista([[2.0**40]]), [[2**40]]).tipo == "d"
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+from src.data.external import ExternalSorter, leer_binario
+
+
+class TestExternalSorter:
+    def setup_method(self):
+        self.aleatorio = random.Random(7)
+
+    def test_en_memoria(self):
+        with ExternalSorter() as ordenador:
+            ordenador.extend([3, 1, 2, 1])
+            assert list(ordenador.ordenados()) == [1, 1, 2, 3]
+            assert list(ordenador.unicos()) == [1, 2, 3]
+            assert ordenador._tramos == []
+        assert list(ExternalSorter().ordenados()) == []
+
+    def test_tramos_en_disco(self):
+        valores = [self.aleatorio.randrange(1000) for _ in range(5000)]
+        # 320 bytes por tramo: unos 10 números, así que hay varias pasadas
+        with ExternalSorter(memoria=320 * 4, tipo="q", fan_in=2) as ordenador:
+            ordenador.extend(iter(valores))
+            ordenador.push(-1)
+            assert len(ordenador) == 5001
+            assert len(ordenador._tramos) > 2
+            assert list(ordenador.ordenados()) == sorted(valores + [-1])
+            assert len(ordenador._tramos) <= 2
+            assert list(ordenador.unicos()) == sorted(set(valores + [-1]))
+        assert ordenador._tramos == []
+
+    def test_mismo_resultado_en_memoria_y_en_disco(self):
+        valores = [2**60 + 1, 2**60, 300, -5, 300]
+        for tipo in ("q", "d"):
+            with ExternalSorter(tipo=tipo) as memoria, ExternalSorter(memoria=32 * 4, tipo=tipo, fan_in=2) as disco:
+                memoria.extend(valores)
+                disco.extend(valores)
+                assert memoria._tramos == [] and disco._tramos != []
+                assert list(memoria.ordenados()) == list(disco.ordenados())
+                unicos = list(memoria.unicos())
+                assert unicos == list(disco.unicos())
+                assert [type(x) for x in unicos] == [int if tipo == "q" else float] * len(unicos)
+        # Con "q" los enteros grandes se conservan exactos
+        with ExternalSorter(memoria=32 * 4, tipo="q", fan_in=2) as ordenador:
+            assert list(ordenador.extend(valores).unicos()) == [-5, 300, 2**60, 2**60 + 1]
+
+    def test_valores_invalidos(self):
+        with ExternalSorter(tipo="q") as ordenador:
+            with pytest.raises(TypeError):
+                ordenador.extend([1, "a"])
+            with pytest.raises(TypeError):
+                ordenador.push(1.5)
+            with pytest.raises(OverflowError):
+                ordenador.push(2**64)
+            assert len(ordenador) == 0
+
+    def test_escribir_y_leer(self, tmp_path):
+        valores = [self.aleatorio.random() for _ in range(3000)]
+        ruta = str(tmp_path / "salida.bin")
+        with ExternalSorter(memoria=32 * 1000, fan_in=4) as ordenador:
+            ordenador.extend(valores * 2)
+            assert ordenador.escribir(ruta, unicos=True) == 3000
+        assert list(leer_binario(ruta, bloque=7)) == sorted(valores)
+
+    def test_argumentos_invalidos(self):
+        with pytest.raises(ValueError):
+            ExternalSorter(tipo="u")
+        with pytest.raises(ValueError):
+            ExternalSorter(fan_in=1)
+        with pytest.raises(ValueError):
+            ExternalSorter(memoria=64, fan_in=4)
@@ -0,0 +1,81 @@
+import json
+import random
+
+import pytest
+from src.stats.histogram import Histogram
+from src.stats.sketch import KLLSketch
+from src.stats.stats import Stats
+
+
+class TestHistogram:
+    def setup_method(self):
+        self.stats = Stats()
+        aleatorio = random.Random(9)
+        self.numeros = [aleatorio.uniform(0, 100) for _ in range(20_000)]
+
+    def test_ancho_fijo(self):
+        histograma = Histogram.ancho_fijo(0, 100, 10)
+        histograma.extend([0, 5, 15, 15, 99, 100, 120, -3])
+        assert list(histograma.conteos) == [2, 2, 0, 0, 0, 0, 0, 0, 0, 2]
+        assert (histograma.debajo, histograma.encima, len(histograma)) == (1, 1, 8)
+        assert (histograma.minimo, histograma.maximo) == (-3, 120)
+        tabla = histograma.tabla()
+        assert tabla[0] == (-3, 0.0, 1, 1 / 8)
+        assert tabla[-1] == (100.0, 120, 1, 1 / 8)
+        # Los bordes calculados y la fórmula de la cubeta coinciden
+        histograma = Histogram.ancho_fijo(0, 1, 10).extend([i / 10 for i in range(11)])
+        assert list(histograma.conteos) == [1] * 9 + [2]
+        with pytest.raises(ValueError):
+            Histogram.ancho_fijo(5, 5, 3)
+        with pytest.raises(ValueError):
+            Histogram([1, 1, 2])
+
+    def test_logaritmico_y_cuantiles(self):
+        histograma = Histogram.logaritmico(1, 1000, 3).extend([1, 5, 10, 50, 999, 1000])
+        assert histograma.bordes == pytest.approx([1, 10, 100, 1000])
+        assert list(histograma.conteos) == [2, 2, 2]
+        with pytest.raises(ValueError):
+            Histogram.logaritmico(0, 10, 3)
+        muestra = sorted(self.numeros[:1000])
+        for fuente in (muestra, KLLSketch().extend(muestra)):
+            histograma = Histogram.por_cuantiles(fuente, 4).extend(self.numeros)
+            # Cada cubeta recibe alrededor de una cuarta parte de los valores
+            for conteo in histograma.conteos:
+                assert conteo == pytest.approx(len(self.numeros) / 4, rel=0.15)
+        with pytest.raises(ValueError):
+            Histogram.por_cuantiles([3, 3, 3], 4)
+
+    def test_estadisticas_aproximadas(self):
+        histograma = Histogram.ancho_fijo(0, 100, 50).extend(iter(self.numeros))
+        assert histograma.promedio() == pytest.approx(self.stats.promedio(self.numeros), abs=0.5)
+        assert histograma.desviacion_estandar() == pytest.approx(self.stats.desviacion_estandar(self.numeros), abs=0.5)
+        qs = [0, 0.1, 0.5, 0.99, 1]
+        for aproximado, exacto in zip(histograma.cuantiles(qs), self.stats.cuantiles(self.numeros, qs)):
+            assert aproximado == pytest.approx(exacto, abs=2)
+        assert histograma.cuantil(0) == min(self.numeros)
+        assert histograma.cuantil(1) == max(self.numeros)
+        # Test sin datos
+        vacio = Histogram.ancho_fijo(0, 1, 4)
+        assert (vacio.promedio(), vacio.varianza(), vacio.cuantiles([0.5])) == (0, 0, [0])
+        with pytest.raises(ValueError):
+            vacio.cuantil(2)
+
+    def test_merge_y_serializacion(self):
+        partes = [Histogram.ancho_fijo(0, 50, 5).extend(self.numeros[i::3]) for i in range(3)]
+        total = Histogram.ancho_fijo(0, 50, 5)
+        for parte in partes:
+            total.merge(Histogram.desde_dict(json.loads(json.dumps(parte.a_dict()))))
+        completo = Histogram.ancho_fijo(0, 50, 5).extend(self.numeros)
+        assert total.a_dict() == completo.a_dict()
+        with pytest.raises(ValueError):
+            total.merge(Histogram.ancho_fijo(0, 50, 4))
+        datos = total.a_dict()
+        datos["n"] += 1
+        with pytest.raises(ValueError):
+            Histogram.desde_dict(datos)
+
+    def test_stats_histograma(self):
+        histograma = self.stats.histograma([1, 2, 2, 3, 9], cubetas=4)
+        assert list(histograma.conteos) == [3, 1, 0, 1]
+        assert list(self.stats.histograma([7, 7], cubetas=2).conteos) == [2, 0]
+        assert self.stats.histograma([]) is None
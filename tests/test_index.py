@@ -0,0 +1,47 @@
+import pytest
+from src.matrix.dense import DenseMatrix
+from src.matrix.matrix import Matrix
+
+
+class TestValueIndex:
+    def setup_method(self):
+        self.matrix = Matrix()
+        self.M = [[1, 2, 3], [4, 2, 6], [7, 8, 2]]
+
+    def test_buscar_con_indice(self):
+        indice = self.matrix.indice_valores(self.M)
+        # Test con los mismos resultados que la búsqueda sin índice
+        for valor in (1, 2, 8, 9):
+            assert self.matrix.buscar_en_matriz(self.M, valor, indice) == self.matrix.buscar_en_matriz(self.M, valor)
+        assert indice.conteo(2) == 3
+        assert 9 not in indice
+        # Test con un índice de otra matriz
+        with pytest.raises(ValueError):
+            self.matrix.buscar_en_matriz([[1]], 1, indice)
+
+    def test_actualizar(self):
+        indice = self.matrix.indice_valores(self.M)
+        indice.actualizar(0, 0, 2)
+        assert self.M[0][0] == 2
+        assert indice.buscar(2) == [(0, 0), (0, 1), (1, 1), (2, 2)]
+        assert indice.buscar(1) == []
+        indice.actualizar(1, 1, 5)
+        assert indice.buscar(5) == [(1, 1)]
+        assert indice.conteo(2) == 3
+
+    def test_invalidar(self):
+        indice = self.matrix.indice_valores(self.M)
+        assert indice.buscar(8) == [(2, 1)]
+        # Test de cambio directo sobre la matriz y reconstrucción
+        self.M[0][0] = 8
+        indice.invalidar()
+        assert indice.buscar(8) == [(0, 0), (2, 1)]
+
+    def test_indice_densa(self):
+        D = DenseMatrix.desde_lista([[1, 2], [2, 1]])
+        indice = self.matrix.indice_valores(D)
+        assert indice.buscar(2) == [(0, 1), (1, 0)]
+        indice.actualizar(0, 0, 2)
+        assert D.a_lista() == [[2, 2], [2, 1]]
+        # Test con matriz vacía
+        assert self.matrix.indice_valores([]).buscar(1) == []
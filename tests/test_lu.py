@@ -0,0 +1,81 @@
+import pytest
+from decimal import Decimal
+from fractions import Fraction
+from src.matrix.dense import DenseMatrix
+from src.matrix.lu import LUDecomposition
+from src.matrix.matrix import Matrix
+
+
+class TestLU:
+    def setup_method(self):
+        self.matrix = Matrix()
+
+    def test_descomposicion(self):
+        A = [[0, 2, 1], [4, 1, 3], [2, 5, 7]]
+        lu = LUDecomposition(A, exacto=True)
+        # Test P·A = L·U
+        PA = [A[i] for i in lu.permutacion]
+        assert self.matrix.multiplicar_matrices(lu.L, lu.U) == PA
+        # Test con matriz no cuadrada
+        with pytest.raises(ValueError):
+            LUDecomposition([[1, 2, 3], [4, 5, 6]])
+
+    def test_determinante(self):
+        # Test coincide con Sarrus para 3x3
+        M = [[2, -1, 0], [1, 3, -2], [0, 1, 4]]
+        assert self.matrix.determinante(M, exacto=True) == 32
+        assert self.matrix.determinante(M) == pytest.approx(32)
+        # Test con matriz 4x4
+        M4 = [[1, 2, 3, 4], [5, 6, 7, 8], [2, 6, 4, 8], [3, 1, 1, 2]]
+        assert self.matrix.determinante(M4, exacto=True) == 72
+        # Test con matriz singular (filas proporcionales)
+        assert self.matrix.determinante([[1, 2, 3], [4, 5, 6], [7, 8, 9]], exacto=True) == 0
+        # Test singular en coma flotante (el redondeo no deja un pivote exacto 0)
+        assert self.matrix.determinante([[1, 2, 3], [4, 5, 6], [7, 8, 9]]) == 0
+        assert self.matrix.determinante([[1e-20, 0], [0, 1e-20]]) == pytest.approx(1e-40)
+        # Test con pivote cero en la primera posición
+        assert self.matrix.determinante([[0, 1], [1, 0]], exacto=True) == -1
+
+    def test_inversa(self):
+        A = [[4, 7], [2, 6]]
+        assert self.matrix.inversa(A, exacto=True) == [
+            [Fraction(3, 5), Fraction(-7, 10)],
+            [Fraction(-1, 5), Fraction(2, 5)],
+        ]
+        # Test A · A^-1 = I en modo exacto
+        B = [[2, 0, 1], [1, 3, 2], [1, 1, 2]]
+        assert self.matrix.multiplicar_matrices(B, self.matrix.inversa(B, exacto=True)) == self.matrix.identidad(3)
+        # Test con matriz singular
+        with pytest.raises(ValueError):
+            self.matrix.inversa([[2, 4], [1, 2]])
+        with pytest.raises(ValueError):
+            self.matrix.inversa([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    def test_resolver(self):
+        A = [[2, 1], [1, 3]]
+        # Test con un vector
+        x = self.matrix.resolver(A, [3, 5])
+        assert x == pytest.approx([0.8, 1.4])
+        # Test con varios lados derechos (uno por columna)
+        X = self.matrix.resolver(A, [[3, 1], [5, 3]], exacto=True)
+        assert X == [[Fraction(4, 5), 0], [Fraction(7, 5), 1]]
+        # Test con DenseMatrix y MatrixView como lados derechos
+        assert self.matrix.resolver(A, DenseMatrix.desde_lista([[3, 1], [5, 3]]), exacto=True) == X
+        vista = self.matrix.vista([[3, 5], [1, 3]]).transponer()
+        assert self.matrix.resolver(A, vista, exacto=True) == X
+        # Test con un vector de Decimal
+        x = self.matrix.resolver(A, [Decimal("3"), Decimal("5")], exacto=True)
+        assert x == [Fraction(4, 5), Fraction(7, 5)]
+        # Test con dimensiones incompatibles
+        with pytest.raises(ValueError):
+            self.matrix.resolver(A, [1, 2, 3])
+
+    def test_cache(self):
+        A = [[4, 3], [6, 3]]
+        lu = self.matrix.descomposicion_lu(A)
+        # Test la misma matriz reutiliza la descomposición
+        assert self.matrix.descomposicion_lu(A) is lu
+        # Test si la matriz cambia se recalcula
+        A[0][0] = 5
+        assert self.matrix.descomposicion_lu(A) is not lu
+        assert self.matrix.determinante(A, exacto=True) == -3
@@ -73,6 +73,74 @@ class TestMatrix:
         with pytest.raises(ValueError):
             self.matrix.multiplicar_matrices([[1, 2]], [[1, 2]])
 
+    def test_multiplicar_matrices_grandes(self):
+        # Test con matrices más grandes (resultado exacto)
+        A = [[(i * 7 + j * 3) % 11 - 5 for j in range(70)] for i in range(90)]
+        B = [[(i * 5 - j * 2) % 13 - 6 for j in range(75)] for i in range(70)]
+        esperado = [
+            [sum(A[i][k] * B[k][j] for k in range(70)) for j in range(75)]
+            for i in range(90)
+        ]
+        assert self.matrix.multiplicar_matrices(A, B) == esperado
+
+        # Test con vector fila por vector columna
+        assert self.matrix.multiplicar_matrices([[1, 2, 3]], [[4], [5], [6]]) == [[32]]
+
+    # ── Multiplicación Strassen ──────────────────────────────────────────────
+
+    def test_multiplicar_strassen(self):
+        # Test con matrices 2x2 (corte mínimo para forzar la recursión)
+        A = [[1, 2], [3, 4]]
+        B = [[5, 6], [7, 8]]
+        assert self.matrix.multiplicar_strassen(A, B, corte=1) == [[19, 22], [43, 50]]
+
+        # Test con tamaños impares (se completan con ceros) y resultado exacto
+        for n in (3, 5, 9, 33):
+            A = [[(i * 7 + j * 3) % 11 - 5 for j in range(n)] for i in range(n)]
+            B = [[(i * 5 - j * 2) % 13 - 6 for j in range(n)] for i in range(n)]
+            assert self.matrix.multiplicar_strassen(A, B, corte=2) == self.matrix.multiplicar_matrices(A, B)
+
+        # Test con matrices no cuadradas (usa el producto clásico)
+        A2 = [[1, 2, 3], [4, 5, 6]]
+        B2 = [[7, 8], [9, 10], [11, 12]]
+        assert self.matrix.multiplicar_strassen(A2, B2) == [[58, 64], [139, 154]]
+
+        # Test con dimensiones incompatibles (debe lanzar ValueError)
+        with pytest.raises(ValueError):
+            self.matrix.multiplicar_strassen([[1, 2]], [[1, 2]])
+
+    # ── Potencia ─────────────────────────────────────────────────────────────
+
+    def test_potencia(self):
+        # Test con la matriz de Fibonacci
+        F = [[1, 1], [1, 0]]
+        assert self.matrix.potencia(F, 10) == [[89, 55], [55, 34]]
+
+        # Test con exponente 0 (identidad) y 1 (copia de la matriz)
+        assert self.matrix.potencia(F, 0) == [[1, 0], [0, 1]]
+        assert self.matrix.potencia(F, 1) == F
+        assert self.matrix.potencia(F, 1) is not F
+
+        # Test coincide con multiplicaciones sucesivas
+        M = [[2, -1, 0], [1, 3, -2], [0, 1, 4]]
+        esperado = M
+        for _ in range(6):
+            esperado = self.matrix.multiplicar_matrices(esperado, M)
+        assert self.matrix.potencia(M, 7) == esperado
+
+        # Test con caché de cuadrados (varios exponentes sobre la misma matriz)
+        assert self.matrix.potencia(F, 30, cache=True)[0][1] == 832040
+        assert self.matrix.potencia(F, 20, cache=True)[0][1] == 6765
+        # Test si la matriz cambia no se usan los cuadrados guardados
+        F[1][1] = 1
+        assert self.matrix.potencia(F, 2, cache=True) == [[2, 2], [2, 2]]
+
+        # Test con matriz no cuadrada o exponente negativo
+        with pytest.raises(ValueError):
+            self.matrix.potencia([[1, 2, 3]], 2)
+        with pytest.raises(ValueError):
+            self.matrix.potencia(F, -1)
+
     # ── Multiplicación escalar ────────────────────────────────────────────────
 
     def test_multiplicar_escalar(self):
@@ -251,6 +319,44 @@ class TestMatrix:
         # Test con matriz 1x1 (siempre diagonal)
         assert self.matrix.es_diagonal([[5]]) == True
 
+    # ── Analizar ─────────────────────────────────────────────────────────────
+
+    def test_analizar(self):
+        # Test con matriz identidad (todas las propiedades)
+        info = self.matrix.analizar([[1, 0], [0, 1]])
+        assert info["es_cuadrada"] == True
+        assert info["es_identidad"] == True
+        assert info["es_diagonal"] == True
+        assert info["es_simetrica"] == True
+        assert info["traza"] == 2
+        assert info["diagonal"] == [1, 1]
+        assert info["ceros"] == 2
+        assert info["dispersion"] == 0.5
+
+        # Test con matriz triangular superior
+        info = self.matrix.analizar([[1, 2, 3], [0, 4, 5], [0, 0, 6]])
+        assert info["es_triangular_superior"] == True
+        assert info["es_triangular_inferior"] == False
+        assert info["es_simetrica"] == False
+        assert info["es_diagonal"] == False
+        assert info["traza"] == 11
+
+        # Test coincide con los métodos individuales
+        M = [[1, 2, 3], [2, 5, 6], [3, 6, 9]]
+        info = self.matrix.analizar(M)
+        assert info["es_simetrica"] == self.matrix.es_simetrica(M)
+        assert info["es_triangular_inferior"] == False
+        assert info["diagonal"] == self.matrix.diagonal(M)
+
+        # Test con matriz no cuadrada
+        info = self.matrix.analizar([[1, 0, 3], [4, 5, 0]])
+        assert info["es_cuadrada"] == False
+        assert info["traza"] is None
+        assert info["ceros"] == 2
+
+        # Test con matriz vacía
+        assert self.matrix.analizar([])["es_cuadrada"] == False
+
     # ── Rotar 90 grados ──────────────────────────────────────────────────────
 
     def test_rotar_90(self):
@@ -0,0 +1,88 @@
+from fractions import Fraction
+
+import pytest
+from src.matrix.dense import DenseMatrix
+from src.matrix.matrix import Matrix
+from src.matrix.parallel import ParallelMatrix
+
+
+class TestParallelMatrix:
+    @classmethod
+    def setup_class(cls):
+        # umbral=0 fuerza el camino paralelo incluso con matrices pequeñas
+        cls.paralela = ParallelMatrix(workers=2, umbral=0)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.paralela.cerrar()
+
+    def setup_method(self):
+        self.matrix = Matrix()
+        self.A = [[(i * 3 + j) % 7 - 3 for j in range(5)] for i in range(6)]
+        self.B = [[(i + j * 2) % 5 - 2 for j in range(4)] for i in range(5)]
+
+    def test_multiplicar_matrices(self):
+        assert self.paralela.multiplicar_matrices(self.A, self.B) == self.matrix.multiplicar_matrices(self.A, self.B)
+        # Test con decimales
+        A = [[0.5, 1.5], [2.0, -1.0]]
+        assert self.paralela.multiplicar_matrices(A, A) == self.matrix.multiplicar_matrices(A, A)
+        # Test con DenseMatrix (retorna DenseMatrix)
+        D = self.paralela.multiplicar_matrices(DenseMatrix.desde_lista(self.A), self.B)
+        assert D.a_lista() == self.matrix.multiplicar_matrices(self.A, self.B)
+        # Test con enteros que podrían desbordar 64 bits (usa la versión secuencial)
+        grande = [[2**40, 1], [1, 2**40]]
+        assert self.paralela.multiplicar_matrices(grande, grande) == self.matrix.multiplicar_matrices(grande, grande)
+        # Test con dimensiones incompatibles
+        with pytest.raises(ValueError):
+            self.paralela.multiplicar_matrices([[1, 2]], [[1, 2]])
+
+    def test_elemento_a_elemento(self):
+        C = [[(i * j) % 4 for j in range(5)] for i in range(6)]
+        A, D = DenseMatrix.desde_lista(self.A), DenseMatrix.desde_lista(C)
+        assert self.paralela.suma_matrices(A, D).a_lista() == self.matrix.suma_matrices(self.A, C)
+        assert self.paralela.resta_matrices(A, D).a_lista() == self.matrix.resta_matrices(self.A, C)
+        assert self.paralela.multiplicar_escalar(A, 3).a_lista() == self.matrix.multiplicar_escalar(self.A, 3)
+        assert self.paralela.multiplicar_escalar(A, 0.5).a_lista() == self.matrix.multiplicar_escalar(self.A, 0.5)
+        # Test mezclando 'q' y 'd' (resultado en coma flotante)
+        mitades = DenseMatrix.desde_lista([[x / 2 for x in fila] for fila in C])
+        suma = self.paralela.suma_matrices(A, mitades)
+        assert suma.tipo == "d"
+        assert suma.a_lista() == self.matrix.suma_matrices(self.A, mitades.a_lista())
+        # Test con una vista no contigua (transpuesta)
+        assert self.paralela.suma_matrices(A.transpuesta(), A.transpuesta()).a_lista() == self.matrix.transpuesta(
+            self.matrix.multiplicar_escalar(self.A, 2)
+        )
+        with pytest.raises(ValueError):
+            self.paralela.suma_matrices(DenseMatrix.desde_lista([[1, 2]]), DenseMatrix.desde_lista([[1, 2], [3, 4]]))
+        # Test con enteros que desbordan 64 bits (versión secuencial de DenseMatrix)
+        with pytest.raises(OverflowError):
+            self.paralela.suma_matrices(DenseMatrix.desde_lista([[2**62]]), DenseMatrix.desde_lista([[2**62]]))
+
+    def test_elemento_a_elemento_con_listas(self):
+        # Test con listas de listas se calcula en secuencial (no se crea el pool)
+        C = [[(i * j) % 4 for j in range(5)] for i in range(6)]
+        with ParallelMatrix(workers=2, umbral=0) as matrix:
+            assert matrix.suma_matrices(self.A, C) == self.matrix.suma_matrices(self.A, C)
+            assert matrix.resta_matrices(self.A, C) == self.matrix.resta_matrices(self.A, C)
+            assert matrix.multiplicar_escalar(self.A, 3) == self.matrix.multiplicar_escalar(self.A, 3)
+            assert matrix._executor is None
+            with pytest.raises(ValueError):
+                matrix.suma_matrices([[1, 2]], [[1, 2], [3, 4]])
+
+    def test_valores_no_representables(self):
+        # Test con enteros de más de 64 bits y Fraction (usa la versión secuencial, exacta)
+        grande = [[2**70 + 1, 1], [1, 1]]
+        assert self.paralela.suma_matrices(grande, grande) == [[2**71 + 2, 2], [2, 2]]
+        assert self.paralela.resta_matrices(grande, [[1, 1], [1, 1]]) == [[2**70, 0], [0, 0]]
+        assert self.paralela.multiplicar_escalar(grande, 2) == [[2**71 + 2, 2], [2, 2]]
+        assert self.paralela.multiplicar_escalar([[1, 2]], 2**70) == [[2**70, 2**71]]
+        assert self.paralela.multiplicar_matrices(grande, [[1], [0]]) == [[2**70 + 1], [1]]
+        tercios = [[Fraction(1, 3), 0.5]]
+        assert self.paralela.suma_matrices(tercios, tercios) == [[Fraction(2, 3), 1.0]]
+        assert self.paralela.multiplicar_matrices([[Fraction(1, 3)]], [[3]]) == [[1]]
+
+    def test_umbral_secuencial(self):
+        # Test por debajo del umbral no se crea el pool
+        with ParallelMatrix(workers=2, umbral=10**9) as matrix:
+            assert matrix.multiplicar_matrices([[1, 2], [3, 4]], [[5, 6], [7, 8]]) == [[19, 22], [43, 50]]
+            assert matrix._executor is None
@@ -0,0 +1,54 @@
+import pytest
+from src.stats.parallel import ParallelStats
+from src.stats.stats import Stats
+
+
+class TestParallelStats:
+    @classmethod
+    def setup_class(cls):
+        cls.paralela = ParallelStats(workers=2)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.paralela.cerrar()
+
+    def setup_method(self):
+        self.stats = Stats()
+        self.numeros = [((i * 37) % 101) / 4 - 7 for i in range(1000)]
+
+    def comparar(self, resumen, numeros):
+        assert resumen.n == len(numeros)
+        assert resumen.promedio() == pytest.approx(self.stats.promedio(numeros))
+        assert resumen.varianza() == pytest.approx(self.stats.varianza(numeros))
+        assert resumen.desviacion_estandar() == pytest.approx(self.stats.desviacion_estandar(numeros))
+        assert resumen.rango() == pytest.approx(self.stats.rango(numeros))
+
+    def test_bloques(self):
+        bloques = (self.numeros[i:i + 64] for i in range(0, len(self.numeros), 64))
+        self.comparar(self.paralela.resumir(bloques), self.numeros)
+        # Test sin datos
+        assert self.paralela.resumir([]).promedio() == 0
+
+    def test_archivo(self, tmp_path):
+        ruta = tmp_path / "numeros.txt"
+        # Varios números por línea y bloques pequeños que cortan líneas a la mitad
+        lineas = [" ".join(str(x) for x in self.numeros[i:i + 3]) for i in range(0, len(self.numeros), 3)]
+        ruta.write_text("\n".join(lineas) + "\n")
+        paralela = ParallelStats(workers=2, bytes_por_bloque=97, executor=self.paralela._pool())
+        self.comparar(paralela.resumir(ruta), self.numeros)
+        # Test en el proceso actual, sin pool
+        self.comparar(ParallelStats(workers=1, bytes_por_bloque=50).resumir(str(ruta)), self.numeros)
+        # Test con archivo vacío
+        vacio = tmp_path / "vacio.txt"
+        vacio.write_text("")
+        assert ParallelStats(workers=1).resumir(vacio).n == 0
+
+    def test_bosquejar(self, tmp_path):
+        ruta = tmp_path / "numeros.txt"
+        ruta.write_text("\n".join(str(x) for x in self.numeros))
+        esperado = self.stats.cuantiles(self.numeros, [0.5, 0.9])
+        paralela = ParallelStats(workers=2, bytes_por_bloque=500, executor=self.paralela._pool())
+        for bosquejo in (paralela.bosquejar(ruta), paralela.bosquejar([self.numeros[:400], self.numeros[400:]])):
+            assert bosquejo.n == len(self.numeros)
+            assert bosquejo.cuantiles([0.5, 0.9]) == pytest.approx(esperado, abs=1)
+            assert bosquejo.rango() == pytest.approx(self.stats.rango(self.numeros))
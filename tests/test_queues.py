@@ -0,0 +1,157 @@
+import asyncio
+import threading
+
+import pytest
+from src.data.queues import AsyncQueue, AsyncStack, Queue, ThreadSafeQueue, ThreadSafeStack
+
+
+class TestQueue:
+    def setup_method(self):
+        self.cola = Queue()
+
+    def test_fifo(self):
+        assert self.cola.is_empty()
+        assert self.cola.peek() is None
+        assert self.cola.enqueue_many(x * x for x in range(4)) == 4
+        self.cola.enqueue("fin")
+        assert len(self.cola) == 5
+        assert self.cola.peek() == 0
+        assert [self.cola.dequeue() for _ in range(5)] == [0, 1, 4, 9, "fin"]
+        assert self.cola.dequeue() is None
+        assert not self.cola.is_full()
+
+    def test_vaciar_muchos(self):
+        n = 200_000
+        self.cola.enqueue_many(range(n))
+        vaciados = []
+        while not self.cola.is_empty():
+            vaciados.extend(self.cola.dequeue_many(1000))
+        assert vaciados == list(range(n))
+
+
+class TestThreadSafe:
+    def test_productores_y_consumidores(self):
+        cola = ThreadSafeQueue(capacidad=16)
+        recibidos = []
+        cerrojo = threading.Lock()
+
+        def productor(inicio):
+            cola.push_many(range(inicio, inicio + 500))
+            for i in range(inicio + 500, inicio + 1000):
+                cola.push(i)
+
+        def consumidor():
+            while True:
+                lote = cola.pop_many(10)
+                with cerrojo:
+                    recibidos.extend(x for x in lote if x is not None)
+                if None in lote:
+                    # Devuelve las marcas de fin de los otros consumidores
+                    for _ in range(lote.count(None) - 1):
+                        cola.push(None)
+                    return
+
+        hilos = [threading.Thread(target=productor, args=(k * 1000,)) for k in range(3)]
+        consumidores = [threading.Thread(target=consumidor) for _ in range(3)]
+        for hilo in hilos + consumidores:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        for _ in consumidores:
+            cola.push(None)
+        for hilo in consumidores:
+            hilo.join()
+        assert sorted(recibidos) == list(range(3000))
+
+    def test_timeouts_y_pila(self):
+        pila = ThreadSafeStack(capacidad=2)
+        with pytest.raises(TimeoutError):
+            pila.pop(timeout=0.01)
+        pila.push("a")
+        pila.push("b")
+        with pytest.raises(TimeoutError):
+            pila.push("c", timeout=0)
+        assert pila.peek() == "b"
+        assert pila.is_full()
+        assert pila.pop() == "b"
+        assert pila.pop_many(5) == ["a"]
+        assert pila.is_empty()
+        # push_many espera a que un consumidor haga sitio
+        cola = ThreadSafeQueue(capacidad=2)
+        consumidor = threading.Thread(target=lambda: [cola.pop() for _ in range(3)])
+        consumidor.start()
+        assert cola.push_many([1, 2, 3, 4, 5], timeout=5) == 5
+        consumidor.join()
+        assert cola.pop_many(5) == [4, 5]
+
+    def test_productor_sin_fin(self):
+        # Sin capacidad, push_many suelta el cerrojo entre bloques
+        cola = ThreadSafeQueue()
+        parar = threading.Event()
+
+        def sin_fin():
+            i = 0
+            while not parar.is_set():
+                yield i
+                i += 1
+
+        productor = threading.Thread(target=cola.push_many, args=(sin_fin(),))
+        productor.start()
+        recibidos = [cola.pop(timeout=5) for _ in range(5000)]
+        parar.set()
+        productor.join()
+        assert recibidos == list(range(5000))
+
+
+class TestAsync:
+    def test_cola_acotada(self):
+        async def principal():
+            cola = AsyncQueue(capacidad=3)
+            recibidos = []
+
+            async def consumidor():
+                while (x := await cola.pop()) is not None:
+                    recibidos.append(x)
+
+            tarea = asyncio.create_task(consumidor())
+            for i in range(50):
+                await cola.push(i)
+            assert await cola.push_many(range(50, 100)) == 50
+            await cola.push(None)
+            await tarea
+            return recibidos
+
+        assert asyncio.run(principal()) == list(range(100))
+
+    def test_productor_sin_fin(self):
+        async def principal():
+            cola = AsyncQueue()
+            parar = False
+
+            def sin_fin():
+                i = 0
+                while not parar:
+                    yield i
+                    i += 1
+
+            productor = asyncio.create_task(cola.push_many(sin_fin()))
+            recibidos = [await cola.pop(timeout=5) for _ in range(5000)]
+            parar = True
+            await productor
+            return recibidos
+
+        assert asyncio.run(principal()) == list(range(5000))
+
+    def test_timeouts_y_pila(self):
+        async def principal():
+            pila = AsyncStack(capacidad=1)
+            with pytest.raises(TimeoutError):
+                await pila.pop(timeout=0.01)
+            await pila.push(1)
+            with pytest.raises(TimeoutError):
+                await pila.push(2, timeout=0.01)
+            assert pila.peek() == 1
+            assert await pila.pop_many(3) == [1]
+            return pila.is_empty()
+
+        assert asyncio.run(principal())
@@ -0,0 +1,99 @@
+import pytest
+from src.stats.running import RunningCovariance, RunningStats
+from src.stats.stats import Stats
+
+
+class TestRunningStats:
+    def setup_method(self):
+        self.stats = Stats()
+
+    def test_coincide_con_stats(self):
+        for numeros in ([1, 2, 3, 4, 5], [2, 4, 4, 4, 5, 5, 7, 9], [1.5, 2.5, 3.5], [-5, 0, 5], [42]):
+            acumulador = RunningStats(numeros)
+            assert acumulador.promedio() == pytest.approx(self.stats.promedio(numeros))
+            assert acumulador.varianza() == pytest.approx(self.stats.varianza(numeros))
+            assert acumulador.desviacion_estandar() == pytest.approx(self.stats.desviacion_estandar(numeros))
+            assert acumulador.rango() == self.stats.rango(numeros)
+
+    def test_push_y_generador(self):
+        acumulador = RunningStats()
+        # Test sin datos (mismas convenciones que Stats)
+        assert acumulador.promedio() == 0
+        assert acumulador.varianza() == 0
+        assert acumulador.rango() == 0
+        acumulador.push(10)
+        acumulador.extend(x for x in range(5))
+        assert len(acumulador) == 6
+        assert acumulador.minimo == 0
+        assert acumulador.maximo == 10
+        assert acumulador.promedio() == pytest.approx(20 / 6)
+
+    def test_merge(self):
+        datos = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        izquierda = RunningStats(datos[:4])
+        derecha = RunningStats.desde_secuencia(datos[4:])
+        izquierda.merge(derecha)
+        completo = RunningStats(datos)
+        assert izquierda.n == completo.n
+        assert izquierda.promedio() == pytest.approx(completo.promedio())
+        assert izquierda.varianza() == pytest.approx(completo.varianza())
+        assert izquierda.rango() == completo.rango()
+        # Test con acumuladores vacíos
+        assert RunningStats().merge(completo).varianza() == pytest.approx(completo.varianza())
+        assert completo.merge(RunningStats()).n == len(datos)
+
+    def test_estabilidad_numerica(self):
+        # Valores grandes con poca variación: la fórmula de suma de cuadrados pierde precisión
+        numeros = [1e9 + x for x in (4, 7, 13, 16)]
+        assert RunningStats(numeros).varianza() == pytest.approx(22.5)
+
+
+class TestRunningCovariance:
+    def setup_method(self):
+        self.xs = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        self.ys = [2 * x + (i % 3) - 1 for i, x in enumerate(self.xs)]
+
+    def esperados(self, xs, ys):
+        """Covarianza, correlación y regresión con las fórmulas de dos pasadas."""
+        n = len(xs)
+        mx, my = sum(xs) / n, sum(ys) / n
+        sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+        sxx = sum((x - mx) ** 2 for x in xs)
+        syy = sum((y - my) ** 2 for y in ys)
+        return sxy / n, sxy / (sxx * syy) ** 0.5, (sxy / sxx, my - sxy / sxx * mx)
+
+    def test_coincide_con_dos_pasadas(self):
+        covarianza, correlacion, (pendiente, intercepto) = self.esperados(self.xs, self.ys)
+        for acumulador in (
+            RunningCovariance(zip(self.xs, self.ys)),
+            RunningCovariance.desde_secuencias(self.xs, self.ys),
+        ):
+            assert len(acumulador) == len(self.xs)
+            assert acumulador.covarianza() == pytest.approx(covarianza)
+            assert acumulador.correlacion() == pytest.approx(correlacion)
+            assert acumulador.regresion() == pytest.approx((pendiente, intercepto))
+        # Test sin datos y con una serie constante
+        assert RunningCovariance().covarianza() == 0
+        with pytest.raises(ValueError):
+            RunningCovariance().correlacion()
+        with pytest.raises(ValueError):
+            RunningCovariance(zip([2, 2, 2], [1, 2, 3])).regresion()
+        with pytest.raises(ValueError):
+            RunningCovariance.desde_secuencias([1, 2], [1])
+
+    def test_merge_y_estabilidad(self):
+        izquierda = RunningCovariance(zip(self.xs[:5], self.ys[:5]))
+        derecha = RunningCovariance.desde_secuencias(self.xs[5:], self.ys[5:])
+        izquierda.merge(derecha).merge(RunningCovariance())
+        completo = RunningCovariance(zip(self.xs, self.ys))
+        assert izquierda.n == completo.n
+        assert izquierda.covarianza() == pytest.approx(completo.covarianza())
+        assert izquierda.regresion() == pytest.approx(completo.regresion())
+        # Con un desplazamiento grande la fórmula de suma de productos pierde
+        # toda la precisión; el co-momento no
+        desplazadas = [x + 1e9 for x in self.xs]
+        acumulador = RunningCovariance()
+        for x, y in zip(desplazadas, self.ys):
+            acumulador.push(x, y)
+        assert acumulador.correlacion() == pytest.approx(completo.correlacion(), rel=1e-6)
+        assert acumulador.regresion()[0] == pytest.approx(completo.regresion()[0], rel=1e-6)
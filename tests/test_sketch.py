@@ -0,0 +1,111 @@
+import json
+import pickle
+import random
+from bisect import bisect_right
+
+import pytest
+from collections import Counter
+
+from src.stats.sketch import KLLSketch, SpaceSaving
+from src.stats.stats import Stats
+
+
+class TestKLLSketch:
+    def setup_method(self):
+        self.stats = Stats()
+        aleatorio = random.Random(7)
+        self.numeros = [aleatorio.gauss(100, 15) for _ in range(50_000)]
+        self.ordenados = sorted(self.numeros)
+
+    def error_de_rango(self, bosquejo, qs):
+        """Mayor diferencia entre q y el rango real del valor retornado."""
+        n = len(self.ordenados)
+        return max(
+            abs(bisect_right(self.ordenados, valor) / n - q)
+            for q, valor in zip(qs, bosquejo.cuantiles(qs))
+        )
+
+    def test_exacto_con_pocos_valores(self):
+        bosquejo = KLLSketch(k=200).extend(range(1, 101))
+        assert bosquejo.cuantiles([0, 0.5, 0.9, 1]) == [1, 50, 90, 100]
+        assert bosquejo.mediana() == 50
+        assert bosquejo.fraccion_hasta(25) == 0.25
+        assert bosquejo.rango() == 99
+        # Test sin datos (mismas convenciones que Stats)
+        vacio = KLLSketch()
+        assert vacio.cuantiles([0.5, 0.99]) == [0, 0]
+        assert vacio.mediana() == 0
+        assert vacio.rango() == 0
+        with pytest.raises(ValueError):
+            vacio.cuantil(1.5)
+        with pytest.raises(ValueError):
+            KLLSketch(k=4)
+
+    def test_error_acotado(self):
+        qs = [i / 100 for i in range(1, 100)]
+        bosquejo = KLLSketch(k=200, semilla=1)
+        bosquejo.extend(x for x in self.numeros)
+        assert self.error_de_rango(bosquejo, qs) < 0.02
+        # Memoria acotada y extremos exactos
+        assert sum(map(len, bosquejo.a_dict()["niveles"])) < 3 * 200
+        assert bosquejo.minimo == self.ordenados[0]
+        assert bosquejo.maximo == self.ordenados[-1]
+        assert bosquejo.mediana() == pytest.approx(self.stats.mediana(self.numeros), rel=0.01)
+
+    def test_merge(self):
+        partes = [KLLSketch(k=200, semilla=i).extend(self.numeros[i::5]) for i in range(5)]
+        total = KLLSketch(k=200)
+        for parte in partes:
+            total.merge(parte)
+        assert len(total) == len(self.numeros)
+        assert total.minimo == self.ordenados[0]
+        assert total.maximo == self.ordenados[-1]
+        assert self.error_de_rango(total, [0.5, 0.95, 0.99]) < 0.02
+        with pytest.raises(ValueError):
+            total.merge(KLLSketch(k=100))
+
+    def test_serializacion(self):
+        bosquejo = KLLSketch(k=64, semilla=3).extend(self.numeros)
+        qs = [0.1, 0.5, 0.99]
+        copia = KLLSketch.desde_dict(json.loads(json.dumps(bosquejo.a_dict())))
+        assert copia.n == bosquejo.n
+        assert copia.cuantiles(qs) == bosquejo.cuantiles(qs)
+        assert pickle.loads(pickle.dumps(bosquejo)).cuantiles(qs) == bosquejo.cuantiles(qs)
+        datos = bosquejo.a_dict()
+        datos["n"] += 1
+        with pytest.raises(ValueError):
+            KLLSketch.desde_dict(datos)
+
+
+class TestSpaceSaving:
+    def setup_method(self):
+        aleatorio = random.Random(11)
+        self.valores = [int(aleatorio.paretovariate(1.1)) for _ in range(30_000)]
+        self.exactos = Counter(self.valores)
+
+    def test_garantias(self):
+        contador = SpaceSaving(capacidad=40).extend(iter(self.valores))
+        cota = len(self.valores) / 40
+        for valor, conteo, error in contador.mas_frecuentes(10):
+            # Nunca subestima y sobrestima como mucho n / capacidad
+            assert conteo - error <= self.exactos[valor] <= conteo
+            assert conteo - self.exactos[valor] <= cota
+        frecuentes = {valor for valor, _, _ in contador.mas_frecuentes(40)}
+        assert all(valor in frecuentes for valor, conteo in self.exactos.items() if conteo > cota)
+        assert len(contador) == len(self.valores)
+
+    def test_exacto_y_merge(self):
+        contador = SpaceSaving(capacidad=3)
+        for x in "abacab":
+            contador.push(x)
+        assert contador.mas_frecuentes(3) == [("a", 3, 0), ("b", 2, 0), ("c", 1, 0)]
+        assert contador.conteo("z") == 1
+        izquierda = SpaceSaving(capacidad=40).extend(self.valores[::2])
+        derecha = SpaceSaving(capacidad=40).extend(self.valores[1::2])
+        izquierda.merge(derecha)
+        assert izquierda.n == len(self.valores)
+        for valor, conteo, error in izquierda.mas_frecuentes(5):
+            assert conteo - error <= self.exactos[valor] <= conteo
+        assert [v for v, _, _ in izquierda.mas_frecuentes(3)] == [v for v, _ in self.exactos.most_common(3)]
+        with pytest.raises(ValueError):
+            SpaceSaving(capacidad=0)
@@ -0,0 +1,68 @@
+from fractions import Fraction
+
+import pytest
+from src.matrix.matrix import Matrix
+from src.matrix.sparse import COOMatrix, CSRMatrix
+
+
+class TestSparse:
+    def setup_method(self):
+        self.matrix = Matrix()
+        self.A = [[1, 0, 0], [0, 0, 2], [3, 0, 4]]
+        self.B = [[0, 5, 0], [6, 0, 0], [0, 0, 7]]
+
+    def test_conversiones(self):
+        csr = CSRMatrix.desde_lista(self.A)
+        assert csr.nnz == 4
+        assert csr.forma == (3, 3)
+        assert csr.a_lista() == self.A
+        assert csr.a_coo().a_lista() == self.A
+        # Test COO con elementos repetidos (se suman)
+        coo = COOMatrix(2, 2, [0, 0, 1], [1, 1, 0], [2, 3, 4])
+        assert coo.a_lista() == [[0, 5], [4, 0]]
+        # Test COO con índice fuera de rango
+        with pytest.raises(ValueError):
+            COOMatrix(2, 2, [2], [0], [1])
+
+    def test_aritmetica(self):
+        A = CSRMatrix.desde_lista(self.A)
+        B = COOMatrix.desde_lista(self.B)
+        assert self.matrix.suma_matrices(A, B).a_lista() == [[1, 5, 0], [6, 0, 2], [3, 0, 11]]
+        assert self.matrix.resta_matrices(A, A).nnz == 0
+        assert self.matrix.multiplicar_escalar(A, 2).a_lista() == [[2, 0, 0], [0, 0, 4], [6, 0, 8]]
+        esperado = self.matrix.multiplicar_matrices(self.A, self.B)
+        assert self.matrix.multiplicar_matrices(A, B).a_lista() == esperado
+        # Test dispersa por densa
+        assert self.matrix.multiplicar_matrices(A, self.B) == esperado
+        # Test con dimensiones incompatibles
+        with pytest.raises(ValueError):
+            self.matrix.suma_matrices(A, CSRMatrix.desde_lista([[1, 2]]))
+
+    def test_propiedades(self):
+        A = CSRMatrix.desde_lista(self.A)
+        assert self.matrix.transpuesta(A).a_lista() == self.matrix.transpuesta(self.A)
+        assert self.matrix.traza(A) == 5
+        assert self.matrix.diagonal(A) == [1, 0, 4]
+        assert self.matrix.es_diagonal(A) == False
+        assert self.matrix.es_diagonal(CSRMatrix.desde_lista([[3, 0], [0, 7]])) == True
+        assert self.matrix.es_simetrica(CSRMatrix.desde_lista([[1, 2], [2, 0]])) == True
+        assert self.matrix.es_simetrica(A) == False
+        assert self.matrix.es_cuadrada(A) == True
+
+    def test_buscar(self):
+        A = CSRMatrix.desde_lista(self.A)
+        assert self.matrix.buscar_en_matriz(A, 2) == [(1, 2)]
+        assert self.matrix.buscar_en_matriz(A, 9) == []
+        # Test buscando el cero (posiciones no guardadas)
+        assert self.matrix.buscar_en_matriz(A, 0) == self.matrix.buscar_en_matriz(self.A, 0)
+
+    def test_valores_exactos(self):
+        # Test con Fraction y enteros de más de 64 bits (no pasan a float)
+        fracciones = [[Fraction(1, 3), 0], [0, Fraction(-2, 5)]]
+        csr = CSRMatrix.desde_lista(fracciones)
+        assert csr.a_lista() == fracciones
+        assert self.matrix.transpuesta(csr).a_lista() == fracciones
+        assert self.matrix.multiplicar_escalar(csr, 3).a_lista() == [[1, 0], [0, Fraction(-6, 5)]]
+        grandes = [[2**70, 0], [0, 1]]
+        assert COOMatrix.desde_lista(grandes).a_lista() == grandes
+        assert CSRMatrix.desde_lista(grandes).a_coo().a_lista() == grandes
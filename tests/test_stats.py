@@ -1,4 +1,8 @@
+import random
+from array import array
+
 import pytest
+from src.stats.dataset import Dataset
 from src.stats.stats import Stats
 
 class TestStats:
@@ -41,6 +45,62 @@ class TestStats:
         # Test con lista vacía
         assert self.stats.mediana([]) == 0
     
+    def test_mediana_seleccion(self):
+        # Test con listas grandes (selección por muestra) frente a ordenar
+        aleatorio = random.Random(7)
+        for numeros in (
+            [aleatorio.random() for _ in range(10001)],
+            [aleatorio.randint(0, 5) for _ in range(10000)],
+            list(range(5000, 0, -1)),
+        ):
+            ordenados = sorted(numeros)
+            n = len(ordenados)
+            if n % 2:
+                esperado = ordenados[n // 2]
+            else:
+                esperado = (ordenados[n // 2 - 1] + ordenados[n // 2]) / 2
+            assert self.stats.mediana(numeros) == esperado
+        # Test sin modificar la lista recibida
+        numeros = [5, 1, 4, 2, 3]
+        assert self.stats.mediana(numeros) == 3
+        assert numeros == [5, 1, 4, 2, 3]
+        # Test en el sitio (la lista se reordena)
+        numeros = [aleatorio.random() for _ in range(100)]
+        esperado = self.stats.mediana(numeros)
+        copia = sorted(numeros)
+        assert self.stats.mediana(numeros, en_sitio=True) == esperado
+        assert sorted(numeros) == copia
+        assert numeros[49:51] == copia[49:51]
+        # Test en el sitio con muchos repetidos (grupo de iguales al pivote)
+        numeros = [aleatorio.randrange(5) for _ in range(301)]
+        esperado = sorted(numeros)[150]
+        assert self.stats.mediana(numeros, en_sitio=True) == esperado
+        assert numeros[150] == esperado
+        # Test en el sitio con una tupla (no se puede reordenar; se copia)
+        assert self.stats.mediana((3, 1, 2), en_sitio=True) == 2
+
+    def test_cuantiles(self):
+        # Test con interpolación lineal
+        assert self.stats.cuantiles([1, 2, 3, 4, 5], [0, 0.5, 0.9, 1]) == [1, 3, 4.6, 5]
+        # Test con lista desordenada
+        assert self.stats.cuantiles([4, 1, 3, 2], [0.5]) == [2.5]
+        # Test con la mediana
+        numeros = list(range(100, 0, -3))
+        assert self.stats.cuantiles(numeros, [0.5]) == [self.stats.mediana(numeros)]
+        # Test con lista grande (p50, p90, p99)
+        aleatorio = random.Random(3)
+        numeros = [aleatorio.gauss(0, 1) for _ in range(20000)]
+        ordenados = sorted(numeros)
+        for q, valor in zip([0.5, 0.9, 0.99], self.stats.cuantiles(numeros, [0.5, 0.9, 0.99])):
+            h = (len(ordenados) - 1) * q
+            k = int(h)
+            assert valor == pytest.approx(ordenados[k] + (h - k) * (ordenados[k + 1] - ordenados[k]))
+        # Test con lista vacía
+        assert self.stats.cuantiles([], [0.5, 0.9]) == [0, 0]
+        # Test con cuantil fuera de rango
+        with pytest.raises(ValueError):
+            self.stats.cuantiles([1, 2, 3], [1.5])
+
     def test_moda(self):
         # Test con moda clara (un valor más frecuente)
         assert self.stats.moda([1, 2, 2, 3, 3, 3]) == 3
@@ -60,6 +120,25 @@ class TestStats:
         assert self.stats.moda(["a", "b", "b", "c"]) == "b"
         # Test con lista vacía
         assert self.stats.moda([]) == None
+        # Test con un generador (una sola pasada)
+        assert self.stats.moda(x % 4 for x in [3, 7, 1, 5, 2, 11]) == 3
+        assert self.stats.moda(iter([])) == None
+
+    def test_mas_frecuentes(self):
+        assert self.stats.mas_frecuentes([1, 2, 2, 3, 3, 3], 2) == [(3, 3), (2, 2)]
+        # Empates en orden de primera aparición
+        assert self.stats.mas_frecuentes(["b", "a", "a", "b", "c"], 3) == [("b", 2), ("a", 2), ("c", 1)]
+        # Flujo con muchos valores distintos y pocos contadores
+        aleatorio = random.Random(3)
+        flujo = (0 if aleatorio.random() < 0.3 else aleatorio.randrange(1, 10_000) for _ in range(20_000))
+        (valor, conteo), = self.stats.mas_frecuentes(flujo, 1, capacidad=50)
+        assert valor == 0
+        assert 5_000 < conteo < 7_000
+        assert self.stats.mas_frecuentes([], 3) == []
+        with pytest.raises(ValueError):
+            self.stats.mas_frecuentes([1, 2], 0)
+        with pytest.raises(ValueError):
+            self.stats.mas_frecuentes([1, 2], 5, capacidad=2)
     
     def test_desviacion_estandar(self):
         # Test con conjunto simple conocido
@@ -115,4 +194,107 @@ class TestStats:
         # Test con lista vacía
         assert self.stats.rango([]) == 0
         # Test con números grandes
-        assert self.stats.rango([1000, 5000, 2000, 8000]) == 7000
\ No newline at end of file
+        assert self.stats.rango([1000, 5000, 2000, 8000]) == 7000
+
+    def test_resumen_lote(self):
+        series = [[1, 2, 3, 4, 5], [2, 4, 4, 4, 5, 5, 7, 9], [1.5, 2.5, 1.5], [42], []]
+        resumenes = self.stats.resumen_lote(series)
+        assert len(resumenes) == len(series)
+        for serie, resumen in zip(series, resumenes):
+            assert resumen["n"] == len(serie)
+            assert resumen["promedio"] == pytest.approx(self.stats.promedio(serie))
+            assert resumen["mediana"] == self.stats.mediana(serie)
+            assert resumen["moda"] == self.stats.moda(serie)
+            assert resumen["desviacion_estandar"] == pytest.approx(self.stats.desviacion_estandar(serie))
+            assert resumen["varianza"] == pytest.approx(self.stats.varianza(serie))
+            assert resumen["rango"] == self.stats.rango(serie)
+        # Test con una columna plana dividida en series de la misma longitud
+        columna = array("d", [1, 2, 3, 4, 10, 10, 7])
+        resumenes = self.stats.resumen_lote(columna, longitud=3)
+        assert [r["n"] for r in resumenes] == [3, 3, 1]
+        assert [r["promedio"] for r in resumenes] == [2.0, 8.0, 7.0]
+        assert resumenes[1]["moda"] == 10.0
+        assert self.stats.resumen_lote(memoryview(columna), longitud=7)[0]["rango"] == 9.0
+        # fsum evita la pérdida de precisión de sum()
+        assert self.stats.resumen_lote([[1e16, 1.0, -1e16]])[0]["promedio"] == pytest.approx(1 / 3)
+        with pytest.raises(ValueError):
+            self.stats.resumen_lote(columna, longitud=0)
+
+    def test_ventanas_moviles(self):
+        aleatorio = random.Random(5)
+        serie = [aleatorio.randint(-50, 50) / 4 for _ in range(300)] + [1e6, -1e6] + [0.5] * 20
+        for ventana in (1, 2, 7, 30):
+            ventanas = [serie[i:i + ventana] for i in range(len(serie) - ventana + 1)]
+            esperados = {
+                "promedio_movil": [self.stats.promedio(v) for v in ventanas],
+                "varianza_movil": [self.stats.varianza(v) for v in ventanas],
+                "desviacion_estandar_movil": [self.stats.desviacion_estandar(v) for v in ventanas],
+            }
+            for metodo, esperado in esperados.items():
+                calculado = list(getattr(self.stats, metodo)(iter(serie), ventana))
+                assert calculado == pytest.approx(esperado, rel=1e-9, abs=1e-6)
+            assert list(self.stats.minimo_movil(serie, ventana)) == [min(v) for v in ventanas]
+            assert list(self.stats.maximo_movil(serie, ventana)) == [max(v) for v in ventanas]
+            assert list(self.stats.rango_movil(serie, ventana)) == [self.stats.rango(v) for v in ventanas]
+            assert list(self.stats.mediana_movil(iter(serie), ventana)) == [self.stats.mediana(v) for v in ventanas]
+        # Test con una serie más corta que la ventana
+        assert list(self.stats.promedio_movil([1, 2], 3)) == []
+        assert list(self.stats.mediana_movil([1, 2], 3)) == []
+        assert list(self.stats.rango_movil([], 3)) == []
+        with pytest.raises(ValueError):
+            self.stats.promedio_movil([1, 2, 3], 0)
+
+    def test_describe(self):
+        for numeros in ([1, 2, 2, 3, 4], [2, 4, 4, 4, 5, 5, 7, 9], [1.5, 2.5, 1.5], [42]):
+            descripcion = self.stats.describe(numeros)
+            assert descripcion["n"] == len(numeros)
+            assert descripcion["promedio"] == pytest.approx(self.stats.promedio(numeros))
+            assert descripcion["mediana"] == self.stats.mediana(numeros)
+            assert descripcion["moda"] == self.stats.moda(numeros)
+            assert descripcion["varianza"] == pytest.approx(self.stats.varianza(numeros))
+            assert descripcion["desviacion_estandar"] == pytest.approx(self.stats.desviacion_estandar(numeros))
+            assert descripcion["rango"] == self.stats.rango(numeros)
+            assert (descripcion["minimo"], descripcion["maximo"]) == (min(numeros), max(numeros))
+        vacio = self.stats.describe([])
+        assert (vacio["promedio"], vacio["moda"], vacio["rango"], vacio["minimo"]) == (0, None, 0, None)
+
+    def test_cache_de_dataset(self):
+        stats = Stats(capacidad_cache=2)
+        datos = Dataset([3, 1, 2, 2, 7])
+        assert stats.describe(datos) == self.stats.describe(list(datos))
+        # Las siguientes consultas salen de la caché sin recorrer los datos
+        stats._cache[id(datos)][1]["mediana"] = "guardada"
+        assert stats.mediana(datos) == "guardada"
+        assert stats.describe(datos)["mediana"] == "guardada"
+        # Las listas no se guardan en la caché
+        assert stats.mediana([3, 1, 2, 2, 7]) == 2
+        # Descarta el menos usado al superar la capacidad
+        otros = [Dataset([1, 2]), Dataset([5, 5, 6])]
+        for conjunto in otros:
+            stats.promedio(conjunto)
+        assert id(datos) not in stats._cache
+        assert stats.moda(datos) == 2
+        assert stats.varianza(otros[1]) == pytest.approx(self.stats.varianza([5, 5, 6]))
+        stats.limpiar_cache()
+        assert len(stats._cache) == 0
+        # Sin caché, un Dataset se comporta como una lista
+        assert self.stats.mediana(datos, en_sitio=True) == 2
+        assert not self.stats._cache
+
+    def test_covarianza_y_regresion(self):
+        xs = [1, 2, 3, 4, 5]
+        ys = [3, 5, 7, 9, 11]
+        assert self.stats.covarianza(xs, ys) == pytest.approx(4.0)
+        assert self.stats.correlacion(xs, ys) == pytest.approx(1.0)
+        assert self.stats.correlacion(xs, ys[::-1]) == pytest.approx(-1.0)
+        assert self.stats.regresion_lineal(xs, ys) == pytest.approx((2.0, 1.0))
+        # Test con generadores (una sola pasada)
+        assert self.stats.regresion_lineal(iter(xs), (2 * x + 1 for x in xs)) == pytest.approx((2.0, 1.0))
+        assert self.stats.covarianza([], []) == 0
+        with pytest.raises(ValueError):
+            self.stats.covarianza([1, 2, 3], [1, 2])
+        with pytest.raises(ValueError):
+            self.stats.correlacion(iter([1, 2, 3]), iter([1, 2]))
+        with pytest.raises(ValueError):
+            self.stats.regresion_lineal([4, 4, 4], [1, 2, 3])
+
@@ -0,0 +1,55 @@
+import pytest
+from src.matrix.matrix import Matrix
+from src.matrix.views import MatrixView
+
+
+class TestMatrixView:
+    def setup_method(self):
+        self.matrix = Matrix()
+        self.M = [[1, 2, 3], [4, 5, 6]]
+
+    def test_transponer(self):
+        vista = self.matrix.vista(self.M).transponer()
+        assert vista.forma == (3, 2)
+        assert vista.materializar() == [[1, 4], [2, 5], [3, 6]]
+        # Test de doble transpuesta (vuelve a la original)
+        assert vista.transponer().materializar() == self.M
+        # Test de acceso a un elemento sin materializar
+        assert vista[2][1] == 6
+
+    def test_rotar(self):
+        vista = self.matrix.vista(self.M)
+        assert vista.rotar(90).materializar() == [[4, 1], [5, 2], [6, 3]]
+        assert vista.rotar(180).materializar() == [[6, 5, 4], [3, 2, 1]]
+        assert vista.rotar(270).materializar() == [[3, 6], [2, 5], [1, 4]]
+        assert vista.rotar(-90).materializar() == vista.rotar(270).materializar()
+        # Test de cuatro rotaciones de 90 (vuelve a la original)
+        assert vista.rotar(90).rotar(90).rotar(90).rotar(90).materializar() == self.M
+        # Test con ángulo inválido
+        with pytest.raises(ValueError):
+            vista.rotar(45)
+
+    def test_voltear(self):
+        vista = self.matrix.vista(self.M)
+        assert vista.voltear_vertical().materializar() == [[4, 5, 6], [1, 2, 3]]
+        assert vista.voltear_horizontal().materializar() == [[3, 2, 1], [6, 5, 4]]
+        # Test de vista sobre otra vista (se componen los índices)
+        assert MatrixView(vista.transponer(), invertir_filas=True).materializar() == [[3, 6], [2, 5], [1, 4]]
+
+    def test_vista_no_copia(self):
+        M = [[1, 2], [3, 4]]
+        vista = self.matrix.vista(M).voltear_vertical()
+        # Las filas que existen en el origen se retornan sin copiar
+        assert vista[0] is M[1]
+        # Los cambios del origen se ven en la vista
+        M[0][1] = 9
+        assert vista.transponer()[1][1] == 9
+
+    def test_vista_en_metodos_de_matrix(self):
+        A = [[1, 2], [3, 4]]
+        B = [[5, 7], [6, 8]]
+        # Test de multiplicación por una vista transpuesta
+        vista = self.matrix.vista(B).transponer()
+        assert self.matrix.multiplicar_matrices(A, vista) == [[19, 22], [43, 50]]
+        assert self.matrix.suma_matrices(vista, A) == [[6, 8], [10, 12]]
+        assert self.matrix.traza(vista) == 13